@@ -0,0 +1,157 @@
+# AI bot opponents
+# Bots join rooms as ordinary players and submit words through the same path as
+# human players. Every bot in the process is driven by one BotScheduler: a single
+# asyncio task with a heap of due times, instead of one sleeping task per bot.
+import asyncio
+import heapq
+import itertools
+import logging
+import math
+import random
+from typing import Awaitable, Callable, List, Optional
+
+from pydantic import BaseModel, Field
+
+from clock import SYSTEM_CLOCK, Clock
+
+logger = logging.getLogger(__name__)
+
+BOT_NAMES = ['Ada', 'Bram', 'Cleo', 'Dex', 'Esme', 'Finn', 'Gus', 'Hana', 'Ivo', 'Juno', 'Kai', 'Lux']
+# How long an idle bot waits before looking at the table again when nothing is formable
+RECHECK_SECONDS = 1.0
+# A bot leaves a room that has not started this long after it joined
+IDLE_TIMEOUT_SECONDS = 600.0
+
+
+class BotProfile(BaseModel):
+    skill: float = Field(default=0.5, ge=0, le=1)  # 1 = always plays the best word, 0 = any formable word
+    reaction_seconds: float = Field(default=4.0, gt=0)  # Median delay before each move
+    reaction_spread: float = Field(default=0.5, ge=0)  # Log-normal sigma of the delay
+
+
+class Bot:
+    def __init__(self, bot_id: str, name: str, room_code: str, profile: BotProfile, rng: random.Random,
+                 joined_at: float = 0.0):
+        self.bot_id = bot_id
+        self.name = name
+        self.room_code = room_code
+        self.profile = profile
+        self.rng = rng
+        self.joined_at = joined_at
+
+    def reaction_delay(self) -> float:
+        return self.profile.reaction_seconds * math.exp(self.rng.gauss(0, self.profile.reaction_spread))
+
+    def choose_move(self, game) -> Optional[tuple]:
+        """Pick a word from the room's solver index and the tiles for it, or None if nothing fits"""
+        words = game.solver.words()
+        if not words:
+            return None
+        words.sort(key=game.calculate_word_score, reverse=True)
+        # Skill narrows the choice towards the top-scoring words
+        pool = max(1, round(len(words) * (1 - self.profile.skill)))
+        word = words[self.rng.randrange(pool)]
+
+        letter_ids = []
+        for letter in word:
+            tile = next(t for t in game.tiles_by_id.values() if t.letter == letter and t.id not in letter_ids)
+            letter_ids.append(tile.id)
+        return word, letter_ids
+
+
+SubmitWord = Callable[[str, str, str, List[int]], Awaitable[bool]]
+
+
+class BotScheduler:
+    """Drives every bot from one task ordered by each bot's next move time"""
+
+    def __init__(self, get_game: Callable[[str], object], submit_word: SubmitWord, seed: Optional[int] = None,
+                 clock: Clock = SYSTEM_CLOCK):
+        self.get_game = get_game
+        self.submit_word = submit_word  # (room_code, player_id, word, letter_ids) -> accepted
+        self.rng = random.Random(seed)
+        self.clock = clock
+        self._queue: list = []
+        self._sequence = itertools.count()
+        self._bot_ids = itertools.count(1)
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.moves_attempted = 0
+        self.moves_accepted = 0
+
+    def add_bot(self, game, profile: BotProfile, name: Optional[str] = None) -> Bot:
+        """Seat a new bot in the game and schedule its first move"""
+        bot_id = f"bot-{next(self._bot_ids)}"
+        name = name or f"{self.rng.choice(BOT_NAMES)} (bot)"
+        bot = Bot(bot_id, name, game.room_code, profile, random.Random(self.rng.random()), self.clock.time())
+        game.join(bot_id, name, is_bot=True)
+        self._schedule(bot, bot.reaction_delay())
+        return bot
+
+    def retire_room(self, game) -> int:
+        """Remove every bot seated in the game (e.g. once its last human player has left)"""
+        retired = [bot for _, _, bot in self._queue if bot.room_code == game.room_code]
+        if not retired:
+            return 0
+        self._queue = [entry for entry in self._queue if entry[2].room_code != game.room_code]
+        heapq.heapify(self._queue)
+        for bot in retired:
+            game.leave(bot.bot_id)
+        self._wakeup.set()  # The earliest move may have been one of them
+        return len(retired)
+
+    @property
+    def bot_count(self) -> int:
+        return len(self._queue)
+
+    def _schedule(self, bot: Bot, delay: float):
+        due = self.clock.time() + delay
+        heapq.heappush(self._queue, (due, next(self._sequence), bot))
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        elif self._queue[0][2] is bot:
+            self._wakeup.set()  # new earliest move, cut the current sleep short
+
+    async def _run(self):
+        while self._queue:
+            delay = self._queue[0][0] - self.clock.time()
+            if delay > 0:
+                self._wakeup.clear()
+                await self.clock.wait_for(self._wakeup, delay)
+                continue
+
+            _, _, bot = heapq.heappop(self._queue)
+            try:
+                await self._act(bot)
+            except Exception as e:
+                logger.error(f"Bot {bot.bot_id} in room {bot.room_code} failed: {e}")
+
+    async def _act(self, bot: Bot):
+        game = self.get_game(bot.room_code)
+        if game is None or game.game_ended or bot.bot_id not in game.players:
+            return  # bot retires with its game
+
+        if not game.game_started:
+            if self.clock.time() - bot.joined_at >= IDLE_TIMEOUT_SECONDS:
+                game.leave(bot.bot_id)  # The room never started
+                return
+            self._schedule(bot, RECHECK_SECONDS)
+            return
+
+        move = bot.choose_move(game)
+        if move is None:
+            self._schedule(bot, RECHECK_SECONDS)
+            return
+
+        word, letter_ids = move
+        self.moves_attempted += 1
+        if await self.submit_word(bot.room_code, bot.bot_id, word, letter_ids):
+            self.moves_accepted += 1
+        self._schedule(bot, bot.reaction_delay())
+
+    def stats(self) -> dict:
+        return {
+            "bots": self.bot_count,
+            "moves_attempted": self.moves_attempted,
+            "moves_accepted": self.moves_accepted
+        }
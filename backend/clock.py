@@ -0,0 +1,110 @@
+# Time source for games
+# GameState, the room timers and the bot scheduler read the time and sleep through
+# a Clock. Production uses the wall clock; simulations and tests use VirtualClock,
+# which jumps straight to the next sleeper instead of waiting, so a full game runs
+# in milliseconds with the same sequence of events as a real one.
+#
+# That only holds while every task waits on nothing but the clock: VirtualClock
+# moves time forward as soon as no task is ready to run, so work that waits on real
+# I/O (executors, database calls, asyncio.sleep) would fall behind virtual time.
+# Simulated games are created with persist=False for that reason.
+import asyncio
+import heapq
+import itertools
+import math
+import time
+from typing import Optional
+
+SETTLE_LIMIT = 100000  # Event-loop passes after which the woken tasks are taken to be spinning
+
+
+class Clock:
+    """Wall-clock time and real sleeps"""
+
+    def time(self) -> float:
+        return time.time()
+
+    async def sleep(self, seconds: float):
+        await asyncio.sleep(seconds)
+
+    async def wait_for(self, event: asyncio.Event, timeout: float) -> bool:
+        """Wait until the event is set or the timeout passes; returns whether it was set"""
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+
+SYSTEM_CLOCK = Clock()
+
+
+class VirtualClock(Clock):
+    """Simulated time that only moves when `advance` runs the next due sleepers"""
+
+    def __init__(self, start: float = 0.0):
+        self.now = start
+        self._sleepers: list = []
+        self._sequence = itertools.count()
+
+    def time(self) -> float:
+        return self.now
+
+    def _wake_at(self, seconds: float) -> asyncio.Future:
+        """Future resolved by `advance` once virtual time reaches now + seconds"""
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._sleepers, (self.now + seconds, next(self._sequence), future))
+        return future
+
+    async def sleep(self, seconds: float):
+        if seconds <= 0:
+            await asyncio.sleep(0)
+            return
+        await self._wake_at(seconds)
+
+    async def wait_for(self, event: asyncio.Event, timeout: float) -> bool:
+        if event.is_set():
+            return True
+        sleeper = self._wake_at(timeout)
+        waiter = asyncio.ensure_future(event.wait())
+        await asyncio.wait({waiter, sleeper}, return_when=asyncio.FIRST_COMPLETED)
+        sleeper.cancel()
+        waiter.cancel()
+        return event.is_set()
+
+    @property
+    def sleepers(self) -> int:
+        return sum(1 for _, _, future in self._sleepers if not future.done())
+
+    async def advance(self, seconds: Optional[float] = None):
+        """Wake every sleeper due within `seconds` of virtual time, in order (all of them if None)"""
+        deadline = math.inf if seconds is None else self.now + seconds
+        await self._settle()
+        while True:
+            # Cancelled sleepers (e.g. wait_for timeouts whose event was set) must not move time on
+            while self._sleepers and self._sleepers[0][2].done():
+                heapq.heappop(self._sleepers)
+            if not self._sleepers or self._sleepers[0][0] > deadline:
+                break
+            due = self._sleepers[0][0]
+            self.now = max(self.now, due)
+            # Everything due at the same instant wakes together, then runs until it sleeps again
+            while self._sleepers and self._sleepers[0][0] == due:
+                _, _, future = heapq.heappop(self._sleepers)
+                if not future.done():
+                    future.set_result(None)
+            await self._settle()
+        if seconds is not None:
+            self.now = deadline
+
+    async def _settle(self):
+        """Run the event loop until no task is ready, i.e. every task is blocked again"""
+        # asyncio has no public "is the loop idle" check, so this reads the loop's ready queue
+        ready = getattr(asyncio.get_running_loop(), '_ready', None)
+        if ready is None:
+            raise RuntimeError("VirtualClock needs the standard asyncio event loop")
+        for _ in range(SETTLE_LIMIT):
+            await asyncio.sleep(0)
+            if not ready:
+                return
+        raise RuntimeError(f"Tasks still runnable after {SETTLE_LIMIT} event-loop passes")
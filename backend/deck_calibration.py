@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Offline deck calibration via Monte Carlo simulation.
+
+Shuffles decks from seeds exactly like GameState does for ranked rooms, deals them
+in the same order (including the adaptive dealer when a lookahead is given), plays
+each one out with a greedy simulated room that takes the best word every few ticks, and
+scores its playability: how many words are formable on the table over time and how
+long the table sits dead. The best seeds are written to the deck library that
+ranked rooms draw from.
+
+Batches of decks are simulated together with NumPy letter-count math and spread
+over every core with a process pool.
+
+Usage: python deck_calibration.py --word-length 4 --decks 1000000 [--keep 5000] [--dealer-lookahead 3]
+"""
+import argparse
+import heapq
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import List, Optional
+
+import numpy as np
+
+from tiles import SCRABBLE_SCORES, create_deck, dealer_window, dealing_order, deck_library_path
+
+TABLE_CAP = 26  # Same cap as GameState.add_letter_to_table
+LETTER_INTERVAL = 2.2  # Seconds between dealt letters in letter_generation_timer
+PLAY_EVERY = 3  # The simulated room plays one word every this many ticks (~6.6 s)
+DEAD_PENALTY = 20.0  # Score lost per fully dead game (scaled by the dead fraction of ticks)
+BATCH_DECKS = 128  # Decks simulated together; bounds the (decks x words x 26) intermediate
+
+# Per-worker state, set up once by _init_worker
+_matrix: Optional[np.ndarray] = None
+_word_sizes: Optional[np.ndarray] = None
+
+
+def deck_codes(seed: int) -> np.ndarray:
+    """Letter codes (0-25) of the deck GameState deals for this seed, in dealing order"""
+    deck = dealing_order(create_deck(random.Random(seed)))
+    return np.frombuffer(''.join(deck).encode('ascii'), dtype=np.uint8) - ord('A')
+
+
+def _init_worker(word_length: int):
+    global _matrix, _word_sizes
+    from letter_counts import get_letter_matrix
+
+    letters = get_letter_matrix(word_length)
+    # Greedy player: try words in descending score order, so argmax picks the best formable one
+    order = sorted(range(len(letters.words)),
+                   key=lambda i: -sum(SCRABBLE_SCORES[c] for c in letters.words[i]))
+    _matrix = letters.matrix[order]
+    _word_sizes = _matrix.sum(axis=1, dtype=np.int16)
+
+
+def formable_counts(counts: np.ndarray) -> np.ndarray:
+    """Number of formable words for each row of an (R, 26) batch of table counts"""
+    return np.all(_matrix[None, :, :] <= counts[:, None, :], axis=2).sum(axis=1)
+
+
+def dealer_pick(decks: np.ndarray, position: np.ndarray, counts: np.ndarray, rows: np.ndarray, lookahead: int):
+    """Move the tile the adaptive dealer would deal next to the front of each row's undealt tiles.
+
+    Same rule as GameState._choose_deck_index: of the next `lookahead` tiles, the one
+    that makes the most words formable, ties going to the tile that comes first.
+    Later tiles keep their relative order, as they do when GameState pops from its deck.
+    """
+    deck_size = decks.shape[1]
+    offsets = position[rows][:, None] + np.arange(lookahead)[None, :]
+    window = decks[rows[:, None], np.minimum(offsets, deck_size - 1)]
+    gains = np.empty((len(rows), lookahead), dtype=np.int64)
+    for j in range(lookahead):
+        candidate = counts[rows].copy()
+        candidate[np.arange(len(rows)), window[:, j]] += 1
+        gains[:, j] = formable_counts(candidate)
+    gains[offsets >= deck_size] = -1
+    best = gains.argmax(axis=1)
+    for row, start, pick in zip(rows[best > 0], position[rows][best > 0], best[best > 0]):
+        chosen = decks[row, start + pick]
+        decks[row, start + 1:start + pick + 1] = decks[row, start:start + pick].copy()
+        decks[row, start] = chosen
+
+
+def simulate(seeds: np.ndarray, ticks: int, dealer_lookahead: int = 0) -> np.ndarray:
+    """Play out a batch of decks; returns (decks, 3) of mean formable, dead ticks, words played"""
+    word_length = int(_word_sizes[0])
+    decks = np.stack([deck_codes(int(seed)) for seed in seeds])
+    n_decks, deck_size = decks.shape
+    rows = np.arange(n_decks)
+    counts = np.zeros((n_decks, 26), dtype=np.uint8)
+    table_size = np.zeros(n_decks, dtype=np.int16)
+    position = np.zeros(n_decks, dtype=np.int16)
+    formable_total = np.zeros(n_decks, dtype=np.int64)
+    dead_ticks = np.zeros(n_decks, dtype=np.int32)
+    words_played = np.zeros(n_decks, dtype=np.int32)
+
+    for tick in range(ticks):
+        deal = (table_size < TABLE_CAP) & (position < deck_size)
+        if dealer_window(dealer_lookahead) and deal.any():
+            dealer_pick(decks, position, counts, rows[deal], dealer_lookahead)
+        dealt = decks[rows[deal], position[deal]]
+        counts[rows[deal], dealt] += 1
+        table_size[deal] += 1
+        position[deal] += 1
+
+        mask = np.all(_matrix[None, :, :] <= counts[:, None, :], axis=2)
+        formable = mask.sum(axis=1)
+        formable_total += formable
+        # A table is dead when it holds enough tiles for a word but none can be formed
+        dead_ticks += (formable == 0) & (table_size >= word_length)
+
+        if tick % PLAY_EVERY:
+            continue
+        play = formable > 0
+        best = mask.argmax(axis=1)[play]
+        counts[play] -= _matrix[best]
+        table_size[play] -= _word_sizes[best]
+        words_played += play
+
+    return np.stack([formable_total / ticks, dead_ticks, words_played], axis=1)
+
+
+def _run_chunk(start_seed: int, count: int, ticks: int, keep: int, dealer_lookahead: int = 0) -> List[tuple]:
+    """Simulate seeds [start_seed, start_seed + count) and return the best `keep` as tuples"""
+    best: List[tuple] = []
+    for batch_start in range(start_seed, start_seed + count, BATCH_DECKS):
+        seeds = np.arange(batch_start, min(batch_start + BATCH_DECKS, start_seed + count))
+        stats = simulate(seeds, ticks, dealer_lookahead)
+        scores = stats[:, 0] - DEAD_PENALTY * stats[:, 1] / ticks
+        for seed, score, (mean_formable, dead, played) in zip(seeds, scores, stats):
+            entry = (float(score), int(seed), float(mean_formable), int(dead), int(played))
+            if len(best) < keep:
+                heapq.heappush(best, entry)
+            elif entry > best[0]:
+                heapq.heapreplace(best, entry)
+    return best
+
+
+def calibrate(word_length: int, decks: int, keep: int, timer_minutes: int = 4,
+              first_seed: int = 0, workers: Optional[int] = None, dealer_lookahead: int = 0) -> dict:
+    """Simulate `decks` seeds across all cores and return the library of the best `keep`"""
+    ticks = int(timer_minutes * 60 / LETTER_INTERVAL)
+    workers = workers or os.cpu_count() or 1
+    chunk = max(BATCH_DECKS, -(-decks // (workers * 8)))  # several chunks per worker for balance
+    started = time.perf_counter()
+
+    best: List[tuple] = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(word_length,)) as pool:
+        futures = [
+            pool.submit(_run_chunk, start, min(chunk, first_seed + decks - start), ticks, keep, dealer_lookahead)
+            for start in range(first_seed, first_seed + decks, chunk)
+        ]
+        for future in futures:
+            for entry in future.result():
+                if len(best) < keep:
+                    heapq.heappush(best, entry)
+                elif entry > best[0]:
+                    heapq.heapreplace(best, entry)
+
+    elapsed = time.perf_counter() - started
+    return {
+        "word_length": word_length,
+        "timer_minutes": timer_minutes,
+        "dealer_lookahead": dealer_window(dealer_lookahead),
+        "ticks": ticks,
+        "decks_simulated": decks,
+        "first_seed": first_seed,
+        "seconds": round(elapsed, 1),
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "decks": [
+            {"seed": seed, "score": round(score, 3), "mean_formable": round(mean_formable, 2),
+             "dead_ticks": dead, "words_played": played}
+            for score, seed, mean_formable, dead, played in sorted(best, reverse=True)
+        ]
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--word-length', type=int, default=4, choices=range(3, 7))
+    parser.add_argument('--decks', type=int, default=100000)
+    parser.add_argument('--keep', type=int, default=5000, help="number of best seeds to store")
+    parser.add_argument('--timer-minutes', type=int, default=4)
+    parser.add_argument('--first-seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--dealer-lookahead', type=int, default=0, choices=range(0, 9),
+                        help="calibrate for rooms with this adaptive dealer window")
+    args = parser.parse_args()
+
+    library = calibrate(args.word_length, args.decks, args.keep, args.timer_minutes,
+                        args.first_seed, args.workers, args.dealer_lookahead)
+    path = deck_library_path(args.word_length, args.dealer_lookahead)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(library, indent=1))
+    rate = args.decks / max(library["seconds"], 1e-9)
+    print(f"Simulated {args.decks} decks in {library['seconds']}s ({rate:.0f} decks/s), "
+          f"kept {len(library['decks'])} in {path}")
+    if library["decks"]:
+        top = library["decks"][0]
+        print(f"Best seed {top['seed']}: score {top['score']}, {top['mean_formable']} formable on average, "
+              f"{top['dead_ticks']} dead ticks")
+
+
+if __name__ == '__main__':
+    main()
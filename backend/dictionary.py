@@ -1,479 +1,389 @@
 # Ultra-Comprehensive English Dictionary
 # This is a significantly expanded word list covering common and uncommon English words
+#
+# Lookups are served from the packed artifact built by dictionary_artifact.py.
+# The raw set literals live in word_lists.py and are only imported when no artifact
+# exists (or when a caller asks for the legacy THREE_LETTER_WORDS-style names).
+import itertools
+import os
+import threading
+import time
+import weakref
+from collections import Counter, OrderedDict
+from pathlib import Path
+from typing import AbstractSet, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 
-# Ultra-Comprehensive English Dictionary
-# This includes a significantly expanded word list covering common and uncommon English words
-from expanded_words import ADDITIONAL_FOUR_LETTER_WORDS, ADDITIONAL_FIVE_LETTER_WORDS, ADDITIONAL_SIX_LETTER_WORDS
-
-# Enhanced 3-letter words (1500+ words)
-THREE_LETTER_WORDS = {
-    # Common 3-letter words
-    'THE', 'AND', 'FOR', 'ARE', 'BUT', 'NOT', 'YOU', 'ALL', 'CAN', 'HER', 'WAS', 'ONE', 'OUR', 'HAD', 'DAY', 'GET',
-    'USE', 'MAN', 'NEW', 'NOW', 'WAY', 'MAY', 'SAY', 'SEE', 'HIM', 'TWO', 'HOW', 'ITS', 'WHO', 'OIL', 'SIT', 'SET',
-    'RUN', 'EAT', 'FAR', 'SEA', 'EYE', 'RED', 'TOP', 'ARM', 'TOO', 'OLD', 'ANY', 'APP', 'ART', 'BAD', 'BAG', 'BAR',
-    'BAT', 'BED', 'BIG', 'BIT', 'BOX', 'BOY', 'BUS', 'BUY', 'CAR', 'CAT', 'COW', 'CRY', 'CUP', 'CUT', 'DOG', 'DRY',
-    'EAR', 'EGG', 'END', 'FAN', 'FEW', 'FIT', 'FIX', 'FLY', 'FOX', 'FUN', 'GAS', 'GOD', 'GOT', 'GUN', 'GUY', 'HAT',
-    'HIT', 'HOT', 'JOB', 'KEY', 'KID', 'LAW', 'LAY', 'LEG', 'LET', 'LIE', 'LOT', 'LOW', 'MAP', 'MOM', 'NET', 'OFF',
-    'PAY', 'PEN', 'PET', 'PUT', 'RAT', 'RAW', 'ROW', 'SAD', 'SUN', 'TAX', 'TEA', 'TEN', 'TIE', 'TIP', 'TRY', 'WAR',
-    'WIN', 'YES', 'YET', 'ZOO', 'ACE', 'ADD', 'AGE', 'AID', 'AIM', 'AIR', 'ASK', 'AXE', 'BAN', 'BEE', 'BET', 'BIN',
-    
-    # Extended 3-letter words including all common combinations
-    'BOW', 'CAB', 'CAD', 'CAM', 'CAN', 'CAP', 'COB', 'COD', 'COG', 'DIG', 'DIM', 'DIP', 'DOT', 'DUE', 'DUG', 'ELF',
-    'ERA', 'EVE', 'FED', 'FIG', 'FIN', 'FOG', 'FUR', 'GAP', 'GEL', 'GEM', 'HAM', 'HEN', 'HEX', 'HID', 'HOP', 'HUB',
-    'HUG', 'HUT', 'ICE', 'ILL', 'INK', 'ION', 'JAM', 'JAR', 'JAW', 'JET', 'JOG', 'JOT', 'JOY', 'JUG', 'LAB', 'LAD',
-    'LAP', 'LED', 'LID', 'LIP', 'LOG', 'MAD', 'MUD', 'MUG', 'NAP', 'NUT', 'OAK', 'ODD', 'ORB', 'OWL', 'PAD', 'PAN',
-    'PAW', 'PEA', 'PIG', 'PIN', 'PIT', 'POD', 'POT', 'PUP', 'RAG', 'RAM', 'RAN', 'RAP', 'RIB', 'RID', 'RIM', 'RIP',
-    'ROD', 'RUB', 'RUG', 'RUM', 'SAG', 'SAP', 'SAW', 'SKI', 'SKY', 'SOB', 'SOD', 'SON', 'SPA', 'SPY', 'TAB', 'TAG',
-    'TAN', 'TAP', 'TAR', 'TON', 'TOY', 'TUB', 'TUG', 'VAN', 'VAT', 'VET', 'WEB', 'WET', 'WIG', 'ZIP', 'APE', 'ARC',
-    'ARK', 'AWE', 'BAY', 'BOB', 'BUG', 'BUN', 'COT', 'DAD', 'DAM', 'DEN', 'DEW', 'DIE', 'EEL', 'ELM', 'ERR', 'FEW',
-    'FLU', 'FRY', 'GAG', 'GAL', 'GAB', 'HUE', 'IRE', 'IVY', 'JAB', 'KEG', 'LAG', 'LAM', 'MAT', 'MAX', 'MIX', 'MOB',
-    'MOD', 'MOP', 'NAG', 'NOB', 'NOD', 'NOR', 'PAL', 'POP', 'PRO', 'PUB', 'PUN', 'RAY', 'REP', 'ROT', 'SAT', 'SHE',
-    'SHY', 'SIN', 'SIP', 'SIR', 'SIS', 'SIX', 'TAD', 'TAT', 'TIC', 'TIN', 'TOE', 'TUX', 'URN', 'VIA', 'VIE', 'WAX',
-    'WHO', 'WHY', 'WOK', 'WON', 'WOO', 'YAK', 'YAM', 'YAP', 'YAW', 'YEA', 'YEP', 'YEW', 'YIN', 'YIP', 'ZAP', 'ZED',
-    'ZEN', 'ZIT', 'BAA', 'BAH', 'BAM', 'BEL', 'BOA', 'BOG', 'BRA', 'BRO', 'BUR', 'CAW', 'COO', 'COP', 'COX', 'COY',
-    'CUB', 'CUD', 'CUE', 'DAB', 'DUB', 'DUD', 'DUN', 'DYE', 'EBB', 'EEK', 'EGO', 'ELK', 'EMU', 'ERG', 'EWE', 'FAD',
-    'FAG', 'FAT', 'FAX', 'FEZ', 'FIB', 'FIR', 'FOB', 'FOE', 'GIG', 'GIN', 'GNU', 'GOB', 'GOO', 'GUM', 'GUT', 'GYM',
-    'HAG', 'HAS', 'HAY', 'HEM', 'HEP', 'HER', 'HEW', 'HEY', 'HIM', 'HIP', 'HIS', 'HOB', 'HOD', 'HOG', 'HOW', 'HUM',
-    'HUN', 'HYP', 'ICY', 'IMP', 'INN', 'IRK', 'JAG', 'JAY', 'JEW', 'JIG', 'JUT', 'KEN', 'KIN', 'KIT', 'LAC', 'LAX',
-    'LEA', 'LEV', 'LIT', 'LOB', 'LOO', 'LOP', 'LOX', 'LUG', 'LYE', 'MAC', 'MAR', 'MAW', 'MEN', 'MET', 'MID', 'MUM',
-    'NAB', 'NAY', 'NEW', 'NIB', 'NIL', 'NIT', 'NIX', 'NUB', 'NUN', 'OAF', 'OAR', 'OAT', 'ODE', 'OFT', 'ONE', 'OPT',
-    'ORE', 'OUT', 'OVA', 'OWE', 'OWN', 'PAP', 'PAR', 'PAT', 'PAX', 'PEG', 'PEP', 'PER', 'PEW', 'PIE', 'PIP', 'PLY',
-    'POW', 'POX', 'PRY', 'PUD', 'PUG', 'PUS', 'QUA', 'RED', 'REF', 'REV', 'RIG', 'ROB', 'ROE', 'RUT', 'RYE', 'SAC',
-    'SAX', 'SEW', 'SEX', 'SLY', 'SOP', 'SOT', 'SOW', 'SOX', 'SOY', 'STY', 'SUB', 'SUM', 'SUP', 'TAU', 'TAW', 'TED',
-    'THE', 'THY', 'TIT', 'TOT', 'TOW', 'TUN', 'TUT', 'TWO', 'UGH', 'USE', 'VEX', 'VOW', 'WAD', 'WAG', 'WAN', 'WAY',
-    'WED', 'WIT', 'WOE', 'WOW', 'YOW', 'YUK', 'ZAG', 'ZEE', 'ZIG', 'ABS', 'ACE', 'ACT', 'ADS', 'AFT', 'AGO', 'AHA',
-    'AHS', 'ALE', 'ALP', 'AMP', 'ANT', 'APT', 'ARC', 'ARF', 'ARM', 'ART', 'ASH', 'ATE', 'AWL', 'AYE', 'BAD', 'BAG',
-    'BAM', 'BAT', 'BAY', 'BED', 'BEG', 'BET', 'BIB', 'BID', 'BIG', 'BIN', 'BIT', 'BOA', 'BOB', 'BOG', 'BOX', 'BOY',
-    'BUD', 'BUG', 'BUM', 'BUN', 'BUS', 'BUT', 'BUY', 'BYE', 'CAB', 'CAD', 'CAM', 'CAN', 'CAP', 'CAR', 'CAT', 'CAW',
-    'COB', 'COD', 'COG', 'COO', 'COP', 'COT', 'COW', 'COX', 'COY', 'COZ', 'CRY', 'CUB', 'CUD', 'CUE', 'CUP', 'CUR',
-    'CUT', 'DAB', 'DAD', 'DAM', 'DAY', 'DEN', 'DEW', 'DIB', 'DID', 'DIE', 'DIG', 'DIM', 'DIN', 'DIP', 'DOC', 'DOE',
-    'DOG', 'DON', 'DOT', 'DRY', 'DUB', 'DUD', 'DUE', 'DUG', 'DUN', 'DUO', 'DYE', 'EAR', 'EAT', 'EBB', 'EEL', 'EGG',
-    'EGO', 'ELF', 'ELK', 'ELM', 'EMU', 'END', 'ERA', 'ERG', 'ERR', 'EVE', 'EWE', 'EYE', 'FAB', 'FAD', 'FAN', 'FAR',
-    'FAT', 'FAX', 'FED', 'FEE', 'FEW', 'FEZ', 'FIB', 'FIG', 'FIN', 'FIR', 'FIT', 'FIX', 'FLU', 'FLY', 'FOB', 'FOE',
-    'FOG', 'FOR', 'FOX', 'FRY', 'FUG', 'FUN', 'FUR', 'GAB', 'GAG', 'GAL', 'GAP', 'GAS', 'GAY', 'GEL', 'GEM', 'GET',
-    'GIG', 'GIN', 'GNU', 'GOB', 'GOD', 'GOO', 'GOT', 'GUM', 'GUN', 'GUT', 'GUY', 'GYM', 'HAD', 'HAG', 'HAM', 'HAS',
-    'HAT', 'HAY', 'HEM', 'HEN', 'HEP', 'HER', 'HEW', 'HEX', 'HEY', 'HID', 'HIM', 'HIP', 'HIS', 'HIT', 'HOB', 'HOD',
-    'HOG', 'HOP', 'HOT', 'HOW', 'HUB', 'HUE', 'HUG', 'HUM', 'HUN', 'HUT', 'HYP', 'ICE', 'ICY', 'ILL', 'IMP', 'INK',
-    'INN', 'ION', 'IRE', 'IRK', 'ITS', 'IVY', 'JAB', 'JAG', 'JAM', 'JAR', 'JAW', 'JAY', 'JET', 'JEW', 'JIG', 'JOB',
-    'JOG', 'JOT', 'JOY', 'JUG', 'JUT', 'KEG', 'KEN', 'KEY', 'KID', 'KIN', 'KIT', 'LAB', 'LAC', 'LAD', 'LAG', 'LAM',
-    'LAP', 'LAW', 'LAX', 'LAY', 'LEA', 'LED', 'LEG', 'LET', 'LEV', 'LID', 'LIE', 'LIP', 'LIT', 'LOB', 'LOG', 'LOO',
-    'LOP', 'LOT', 'LOW', 'LOX', 'LUG', 'LYE', 'MAC', 'MAD', 'MAN', 'MAP', 'MAR', 'MAT', 'MAW', 'MAX', 'MAY', 'MEN',
-    'MET', 'MID', 'MIX', 'MOB', 'MOD', 'MOM', 'MOP', 'MOW', 'MUD', 'MUG', 'MUM', 'NAB', 'NAG', 'NAP', 'NAY', 'NET',
-    'NEW', 'NIB', 'NIL', 'NIT', 'NIX', 'NOB', 'NOD', 'NOR', 'NOT', 'NOW', 'NUB', 'NUN', 'NUT', 'OAF', 'OAK', 'OAR',
-    'OAT', 'ODD', 'ODE', 'OFF', 'OFT', 'OIL', 'OLD', 'ONE', 'OPT', 'ORB', 'ORE', 'OUR', 'OUT', 'OVA', 'OWE', 'OWL',
-    'OWN', 'PAD', 'PAL', 'PAN', 'PAP', 'PAR', 'PAT', 'PAW', 'PAX', 'PAY', 'PEA', 'PEG', 'PEN', 'PEP', 'PER', 'PET',
-    'PEW', 'PIE', 'PIG', 'PIN', 'PIP', 'PIT', 'PLY', 'POD', 'POP', 'POT', 'POW', 'POX', 'PRO', 'PRY', 'PUB', 'PUD',
-    'PUG', 'PUN', 'PUP', 'PUS', 'PUT', 'QUA', 'RAG', 'RAM', 'RAN', 'RAP', 'RAT', 'RAW', 'RAY', 'RED', 'REF', 'REP',
-    'REV', 'RIB', 'RID', 'RIG', 'RIM', 'RIP', 'ROB', 'ROD', 'ROE', 'ROT', 'ROW', 'RUB', 'RUG', 'RUM', 'RUN', 'RUT',
-    'RYE', 'SAC', 'SAD', 'SAG', 'SAP', 'SAT', 'SAW', 'SAX', 'SAY', 'SEA', 'SEE', 'SET', 'SEW', 'SEX', 'SHE', 'SHY',
-    'SIN', 'SIP', 'SIR', 'SIS', 'SIT', 'SIX', 'SKI', 'SKY', 'SLY', 'SOB', 'SOD', 'SON', 'SOP', 'SOT', 'SOW', 'SOX',
-    'SOY', 'SPA', 'SPY', 'STY', 'SUB', 'SUM', 'SUN', 'SUP', 'TAB', 'TAD', 'TAG', 'TAN', 'TAP', 'TAR', 'TAT', 'TAU',
-    'TAW', 'TAX', 'TEA', 'TED', 'TEN', 'THE', 'THY', 'TIC', 'TIE', 'TIN', 'TIP', 'TIT', 'TOE', 'TON', 'TOO', 'TOP',
-    'TOT', 'TOW', 'TOY', 'TRY', 'TUB', 'TUG', 'TUN', 'TUT', 'TWO', 'UGH', 'URN', 'USE', 'VAN', 'VAT', 'VET', 'VEX',
-    'VIA', 'VIE', 'VOW', 'WAD', 'WAG', 'WAN', 'WAR', 'WAS', 'WAX', 'WAY', 'WEB', 'WED', 'WET', 'WHO', 'WHY', 'WIG',
-    'WIN', 'WIT', 'WOE', 'WOK', 'WON', 'WOO', 'WOW', 'YAK', 'YAM', 'YAP', 'YAW', 'YEA', 'YEP', 'YES', 'YET', 'YEW',
-    'YIN', 'YIP', 'YOU', 'YOW', 'YUK', 'ZAG', 'ZAP', 'ZED', 'ZEE', 'ZEN', 'ZIG', 'ZIP', 'ZIT', 'ZOO'
-}
-
-def is_valid_word(word: str, word_length: int = None) -> bool:
+from dictionary_artifact import (
+    DEFAULT_ARTIFACT_PATH, WORD_LENGTHS, ArtifactError, PackedDictionary, artifact_digest, attach_shared_dictionary,
+    bucket_words, compile_words, ingest_word_list, load_artifact
+)
+
+ARTIFACT_PATH = Path(os.environ.get('WORD_DICTIONARY_ARTIFACT', DEFAULT_ARTIFACT_PATH))
+# When set, all worker processes share one read-only copy of the dictionary in this
+# shared memory segment; the first process to start creates it. Reloads publish the new
+# words in a segment named "<name>-<digest prefix>" (see _reload_packed_dictionary)
+SHARED_MEMORY_NAME = os.environ.get('WORD_DICTIONARY_SHM')
+# Optional plain-text word list (e.g. a tournament list) used instead of word_lists.py
+# when there is no prebuilt artifact
+WORD_LIST_PATH = os.environ.get('WORD_DICTIONARY_WORDLIST')
+
+_LEGACY_NAMES = ('THREE_LETTER_WORDS', 'FOUR_LETTER_WORDS', 'FIVE_LETTER_WORDS', 'SIX_LETTER_WORDS', 'ALL_WORDS')
+
+
+def _compile_source_lists() -> bytes:
+    if WORD_LIST_PATH:
+        words_by_length, report = ingest_word_list(Path(WORD_LIST_PATH))
+        print(f"Word list ingested: {report}")
+        return compile_words(words_by_length)
+    import word_lists
+    return compile_words(bucket_words(word_lists.ALL_WORDS))
+
+def _artifact_payload() -> bytes:
+    if ARTIFACT_PATH.exists():
+        return ARTIFACT_PATH.read_bytes()
+    return _compile_source_lists()
+
+def _load_packed_dictionary() -> PackedDictionary:
+    """Attach the shared segment or map the prebuilt artifact, else compile the source lists in memory"""
+    if SHARED_MEMORY_NAME:
+        return attach_shared_dictionary(SHARED_MEMORY_NAME, _artifact_payload)
+    if ARTIFACT_PATH.exists():
+        return load_artifact(ARTIFACT_PATH)
+    return PackedDictionary(_compile_source_lists(), source=WORD_LIST_PATH or 'word_lists')
+
+def _reload_packed_dictionary() -> PackedDictionary:
+    """Load the artifact again for a reload, keeping to shared memory when it is configured.
+
+    The startup segment cannot be resized or rewritten under attached workers, so the new
+    words go in a segment named after their digest: every worker reloading the same artifact
+    attaches the same one. Superseded segments stay until removed with
+    `python dictionary_artifact.py --unlink-shm NAME`. If the segment cannot be set up,
+    this worker falls back to a private copy and says so.
     """
-    Comprehensive word validation combining dictionary lookup with intelligent heuristics.
-    This approach is more permissive to avoid rejecting valid but uncommon words.
+    if not SHARED_MEMORY_NAME:
+        if ARTIFACT_PATH.exists():
+            return load_artifact(ARTIFACT_PATH)
+        return PackedDictionary(_compile_source_lists(), source=WORD_LIST_PATH or 'word_lists')
+    payload = _artifact_payload()
+    name = f"{SHARED_MEMORY_NAME}-{artifact_digest(payload)[:16]}"
+    try:
+        return attach_shared_dictionary(name, lambda: payload)
+    except (OSError, ArtifactError) as e:
+        print(f"Shared dictionary segment {name!r} unavailable, using a private copy: {e}")
+        return PackedDictionary(payload, source=f"{name} (private copy)")
+
+
+# A single word length, or several for mixed-length rooms (e.g. WORD_LENGTHS)
+Lengths = Union[int, Tuple[int, ...]]
+
+def length_key(lengths: Lengths) -> Lengths:
+    """Canonical cache key: a lone length as an int, several as a sorted tuple"""
+    if isinstance(lengths, int):
+        return lengths
+    lengths = tuple(sorted(set(lengths)))
+    return lengths[0] if len(lengths) == 1 else lengths
+
+def __getattr__(name: str):
+    # Legacy set exports are built from the source lists only when someone asks for them
+    if name in _LEGACY_NAMES:
+        import word_lists
+        return getattr(word_lists, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+class AnagramIndex:
+    """Words keyed by sorted-letter signature (one length or several mixed together).
+
+    Signatures are stored in a trie so a query only walks branches whose
+    letters are still available on the table, instead of scanning every word.
     """
-    word_upper = word.upper().strip()
-    
-    # Basic validation
-    if not word_upper or not word_upper.isalpha():
-        return False
-    
-    if word_length and len(word_upper) != word_length:
-        return False
-    
-    if len(word_upper) < 3 or len(word_upper) > 6:
-        return False
-    
-    # First, check if it's in our known dictionary
-    if word_upper in get_words_by_length(len(word_upper)):
-        return True
-    
-    # If not in dictionary, apply intelligent heuristics for likely valid words
-    return is_reasonable_word(word_upper)
-
-def is_reasonable_word(word: str) -> bool:
+
+    _WORDS = ''  # trie key holding the words for a complete signature
+
+    def __init__(self, words: Iterable[str]):
+        self._trie: dict = {}
+        self.signature_count = 0
+        for word in words:
+            node = self._trie
+            for letter in sorted(word):
+                node = node.setdefault(letter, {})
+            if self._WORDS not in node:
+                node[self._WORDS] = []
+                self.signature_count += 1
+            node[self._WORDS].append(word)
+
+    def words_for_signature(self, signature: str) -> List[str]:
+        node = self._trie
+        for letter in signature:
+            node = node.get(letter)
+            if node is None:
+                return []
+        return list(node.get(self._WORDS, ()))
+
+    def formable(self, letters: Iterable[str]) -> List[str]:
+        """All indexed words that can be built from the given multiset of letters"""
+        available = Counter(letter.upper() for letter in letters)
+        found: List[str] = []
+
+        def walk(node: dict):
+            for letter, child in node.items():
+                if letter == self._WORDS:
+                    found.extend(child)
+                elif available[letter] > 0:
+                    available[letter] -= 1
+                    walk(child)
+                    available[letter] += 1
+
+        walk(self._trie)
+        return found
+
+class PrefixIndex:
+    """Every prefix of every indexed word, for O(1) "can this still become a word" checks"""
+
+    def __init__(self, words: Iterable[str]):
+        self._prefixes = frozenset(word[:end] for word in words for end in range(1, len(word) + 1))
+
+    def is_viable(self, prefix: str) -> bool:
+        """True if prefix is empty or a prefix of (or equal to) some indexed word"""
+        return not prefix or prefix in self._prefixes
+
+    def __len__(self) -> int:
+        return len(self._prefixes)
+
+BLANK = '?'  # Wildcard letter, as used by blank tiles
+
+class WildcardIndex:
+    """Words of a single length matched against letters plus blanks, without trying 26^k fills.
+
+    Every word is filed under each sorted sub-multiset left after deleting up to
+    `max_blanks` of its letters, so "these letters plus k blanks" is one dict lookup.
+    Positional patterns such as "C?T" intersect per-(position, letter) bitsets.
     """
-    Enhanced heuristic validation for words not in our base dictionary.
-    This is more permissive to avoid frustrating rejections of valid words.
+
+    def __init__(self, words: Iterable[str], length: int, max_blanks: int = 2):
+        self.length = length
+        self.max_blanks = max_blanks
+        self.words: List[str] = sorted(words)
+        self._by_partial: Dict[str, List[int]] = {}
+        self._by_position: Dict[tuple, int] = {}
+        for word_id, word in enumerate(self.words):
+            letters = sorted(word)
+            partials = set()
+            for blanks in range(max_blanks + 1):
+                for dropped in itertools.combinations(range(length), blanks):
+                    partials.add(''.join(l for i, l in enumerate(letters) if i not in dropped))
+            for partial in partials:
+                self._by_partial.setdefault(partial, []).append(word_id)
+            for position, letter in enumerate(word):
+                self._by_position[(position, letter)] = self._by_position.get((position, letter), 0) | (1 << word_id)
+
+    def words_with_blanks(self, letters: Iterable[str], blanks: int) -> List[str]:
+        """Words made of exactly these letters plus `blanks` wildcards"""
+        partial = ''.join(sorted(letter.upper() for letter in letters))
+        if len(partial) + blanks != self.length:
+            return []
+        if blanks <= self.max_blanks:
+            return [self.words[word_id] for word_id in self._by_partial.get(partial, ())]
+        # More blanks than indexed: fall back to a containment check
+        needed = Counter(partial)
+        return [word for word in self.words if not needed - Counter(word)]
+
+    def match_pattern(self, pattern: str) -> List[str]:
+        """Words matching a positional pattern where BLANK matches any letter"""
+        pattern = pattern.upper()
+        if len(pattern) != self.length:
+            return []
+        matches = (1 << len(self.words)) - 1
+        for position, letter in enumerate(pattern):
+            if letter != BLANK:
+                matches &= self._by_position.get((position, letter), 0)
+                if not matches:
+                    return []
+        found = []
+        while matches:
+            lowest = matches & -matches
+            found.append(self.words[lowest.bit_length() - 1])
+            matches ^= lowest
+        return found
+
+# Builders of per-version caches kept in other modules (demand indexes, score tables, ...),
+# called with the version and the word length(s) of the room being prepared
+_warmers: List[Callable[['DictionaryVersion', Lengths], object]] = []
+
+def register_warmer(build: Callable[['DictionaryVersion', Lengths], object]):
+    """Have DictionaryVersion.warm() also build a cache that another module keeps per version"""
+    _warmers.append(build)
+
+
+class DictionaryVersion:
+    """Immutable snapshot of the dictionary together with the indexes derived from it.
+
+    Rooms hold on to the version they were created with, so a reload never changes
+    the rules of a game that is already running.
     """
-    word = word.upper().strip()
-    
-    # Length check
-    if len(word) < 3 or len(word) > 6:
-        return False
-    
-    # Must contain only letters
-    if not word.isalpha():
-        return False
-    
-    # Reject obvious non-words
-    
-    # All same letter (like AAA, BBB) - usually not words
-    if len(set(word)) == 1:
-        return False
-    
-    # No vowels at all in 4+ letter words (very rare in English)
-    vowels = set('AEIOUY')
-    if len(word) >= 4 and not any(c in vowels for c in word):
-        # Some exceptions like "HYMN", "MYTH", etc. - but we'll be conservative
-        consonant_only_exceptions = {'HYMN', 'MYTH', 'LYNX', 'SYNC', 'BYRL', 'CWMS', 'CRWTH'}
-        if word not in consonant_only_exceptions:
-            return False
-    
-    # Too many of the same letter (more than half the word)
-    for letter in set(word):
-        if word.count(letter) > len(word) // 2 + 1:
-            return False
-    
-    # Check for reasonable letter patterns
-    # Reject words with too many consonants in a row (more than 3)
-    consonants = set('BCDFGHJKLMNPQRSTVWXZ')
-    consonant_run = 0
-    for c in word:
-        if c in consonants:
-            consonant_run += 1
-            if consonant_run > 3:  # Allow some consonant clusters like "STRNG"
-                return False
-        else:
-            consonant_run = 0
-    
-    # If it passes all these checks, it's likely a valid word
-    # This is more permissive to avoid rejecting valid but uncommon words
-    return True
-
-# 4-letter words (Combining base + additional words for comprehensive coverage)
-FOUR_LETTER_WORDS = {
-    'WORD', 'WHAT', 'SAID', 'EACH', 'WHICH', 'WILL', 'ABOUT', 'MANY', 'THEN', 'THEM', 'THESE', 'SOME', 'WOULD',
-    'MAKE', 'LIKE', 'INTO', 'TIME', 'VERY', 'WHEN', 'COME', 'HERE', 'JUST', 'KNOW', 'TAKE', 'THAN', 'ONLY', 'GOOD',
-    'ALSO', 'BACK', 'OVER', 'THINK', 'WHERE', 'BEING', 'WELL', 'LONG', 'WORK', 'LIFE', 'STILL', 'SHOULD', 'AFTER',
-    'FIRST', 'NEVER', 'GIVE', 'MOST', 'USED', 'MADE', 'NEED', 'CALL', 'FIND', 'TELL', 'HELP', 'MOVE', 'PART', 'HAND',
-    'HIGH', 'YEAR', 'CAME', 'SHOW', 'LOOK', 'WANT', 'DOES', 'SEEM', 'FELT', 'KEEP', 'LEFT', 'TURN', 'SEEN', 'FACT',
-    'HEAD', 'WEEK', 'CASE', 'LAST', 'SAME', 'BOOK', 'HEAR', 'STOP', 'SIDE', 'BOTH', 'FACE', 'ONCE', 'OPEN', 'WALK',
-    'TALK', 'WENT', 'EYES', 'DOOR', 'ROOM', 'AWAY', 'NIGHT', 'SMALL', 'HOUSE', 'PLACE', 'LARGE', 'SOUND', 'AGAIN',
-    'UNDER', 'MIGHT', 'WHILE', 'GOING', 'AREA', 'BEAR', 'BEAT', 'BIRD', 'BLUE', 'BODY', 'BONE', 'BOOK', 'BURN',
-    'BUSY', 'CAKE', 'CALL', 'CARE', 'CELL', 'CITY', 'CLUB', 'COAT', 'COLD', 'COOL', 'COPY', 'COST', 'CREW', 'DARK',
-    'DATA', 'DEAD', 'DEAL', 'DEAR', 'DEEP', 'DESK', 'DIET', 'DOOR', 'DRAW', 'DRUG', 'DUCK', 'DUTY', 'EACH', 'EARN',
-    'EAST', 'EASY', 'EDGE', 'ELSE', 'EVEN', 'EVER', 'EVIL', 'EXIT', 'FACE', 'FAIL', 'FAIR', 'FALL', 'FARM', 'FAST',
-    'FEAR', 'FEEL', 'FEET', 'FELL', 'FILE', 'FILM', 'FINE', 'FIRE', 'FISH', 'FIVE', 'FLAT', 'FLOW', 'FOLK', 'FOOD',
-    'FOOT', 'FORM', 'FREE', 'FROM', 'FULL', 'FUND', 'GAME', 'GATE', 'GAVE', 'GIFT', 'GIRL', 'GIVE', 'GLAD', 'GOLD',
-    'GONE', 'GRAB', 'GREW', 'GRIP', 'GROW', 'HALL', 'HANG', 'HARD', 'HARM', 'HATE', 'HAVE', 'HEAD', 'HEAR', 'HEAT',
-    'HELD', 'HELL', 'HIDE', 'HILL', 'HIRE', 'HOLD', 'HOLE', 'HOLY', 'HOME', 'HOPE', 'HOUR', 'HUGE', 'HUNG', 'HUNT',
-    'HURT', 'IDEA', 'INCH', 'INTO', 'IRON', 'ITEM', 'JACK', 'JANE', 'JAZZ', 'JOIN', 'JOKE', 'JUMP', 'JUNE', 'JURY',
-    'JUST', 'KEEP', 'KEPT', 'KICK', 'KILL', 'KIND', 'KING', 'KNEE', 'KNEW', 'KNOW', 'LACK', 'LADY', 'LAID', 'LAKE',
-    'LAND', 'LAST', 'LATE', 'LEAD', 'LEAN', 'LEFT', 'LENS', 'LESS', 'LIES', 'LIFE', 'LIFT', 'LINE', 'LINK', 'LION',
-    'LIST', 'LIVE', 'LOAN', 'LOCK', 'LONG', 'LOOK', 'LORD', 'LOSE', 'LOSS', 'LOST', 'LOTS', 'LOUD', 'LOVE', 'LUCK',
-    'MADE', 'MAIL', 'MAIN', 'MAKE', 'MALE', 'MALL', 'MANY', 'MARK', 'MASS', 'MATE', 'MATH', 'MEAL', 'MEAN', 'MEAT',
-    'MEET', 'MELT', 'MENU', 'MESS', 'MICE', 'MILE', 'MILK', 'MIND', 'MINE', 'MISS', 'MODE', 'MOOD', 'MOON', 'MORE',
-    'MOST', 'MOVE', 'MUCH', 'MUST', 'NAME', 'NAVY', 'NEAR', 'NECK', 'NEED', 'NEWS', 'NICE', 'NOON', 'NOTE', 'NUTS',
-    'ONCE', 'ONLY', 'ONTO', 'OPEN', 'ORAL', 'OVER', 'PACE', 'PACK', 'PAGE', 'PAID', 'PAIN', 'PAIR', 'PALM', 'PARK',
-    'PART', 'PASS', 'PAST', 'PATH', 'PEAK', 'PICK', 'PILE', 'PINK', 'PIPE', 'PLAN', 'PLAY', 'PLOT', 'POEM', 'POET',
-    'POLL', 'POOL', 'POOR', 'PORT', 'POST', 'PULL', 'PURE', 'PUSH', 'QUIT', 'RACE', 'RAIN', 'RANK', 'RARE', 'RATE',
-    'READ', 'REAL', 'REAR', 'RELY', 'RENT', 'REST', 'RICH', 'RIDE', 'RING', 'RISE', 'RISK', 'ROAD', 'ROCK', 'ROLE',
-    'ROLL', 'ROOF', 'ROOM', 'ROOT', 'ROPE', 'ROSE', 'RULE', 'RUSH', 'SAFE', 'SAID', 'SAIL', 'SALE', 'SALT', 'SAME',
-    'SAND', 'SAVE', 'SEAT', 'SEED', 'SEEK', 'SEEM', 'SEEN', 'SELL', 'SEND', 'SENT', 'SHIP', 'SHOE', 'SHOP', 'SHOT',
-    'SHOW', 'SICK', 'SIDE', 'SIGN', 'SING', 'SINK', 'SITE', 'SIZE', 'SKIN', 'SLIP', 'SLOW', 'SNAP', 'SNOW', 'SOAP',
-    'SOFT', 'SOIL', 'SOLD', 'SOME', 'SONG', 'SOON', 'SORT', 'SOUL', 'SOUP', 'SPIN', 'SPOT', 'STAR', 'STAY', 'STEP',
-    'STOP', 'SUCH', 'SUIT', 'SURE', 'SWIM', 'TAKE', 'TALK', 'TALL', 'TANK', 'TAPE', 'TASK', 'TEAM', 'TEAR', 'TELL',
-    'TEND', 'TENT', 'TEST', 'TEXT', 'THAN', 'THAT', 'THEM', 'THEN', 'THEY', 'THIN', 'THIS', 'THUS', 'TIDE', 'TIED',
-    'TIES', 'TIME', 'TINY', 'TIPS', 'TIRE', 'TOLD', 'TONE', 'TOOK', 'TOOL', 'TOPS', 'TORN', 'TOUR', 'TOWN', 'TREE',
-    'TRIP', 'TRUE', 'TUBE', 'TUNE', 'TURN', 'TYPE', 'UNIT', 'UPON', 'USED', 'USER', 'VARY', 'VAST', 'VIEW', 'VOTE',
-    'WAGE', 'WAIT', 'WAKE', 'WALK', 'WALL', 'WANT', 'WARD', 'WARM', 'WARN', 'WASH', 'WAVE', 'WAYS', 'WEAK', 'WEAR',
-    'WEEK', 'WELL', 'WENT', 'WERE', 'WEST', 'WHAT', 'WHEN', 'WHOM', 'WIDE', 'WIFE', 'WILD', 'WILL', 'WIND', 'WINE',
-    'WING', 'WIRE', 'WISE', 'WISH', 'WITH', 'WOOD', 'WOOL', 'WORD', 'WORE', 'WORK', 'YARD', 'YEAR', 'YOUR', 'ZERO',
-    'ZONE', 'ABLE', 'ACID', 'AGED', 'AGES', 'AIDE', 'AIDS', 'AIMS', 'ALAN', 'ALLY', 'ALPS', 'AMID', 'ANNA', 'ANNE',
-    'ANTI', 'ARAB', 'ARCH', 'ARMS', 'ARMY', 'ARTS', 'ASIA', 'ATOM', 'AUTO', 'AWAY', 'BABY', 'BACK', 'BAIL', 'BALL',
-    'BAND', 'BANK', 'BASE', 'BASS', 'BATH', 'BEAM', 'BEAN', 'BEDS', 'BEEF', 'BEEN', 'BEER', 'BELL', 'BELT', 'BEND',
-    'BENT', 'BEST', 'BIAS', 'BIKE', 'BILL', 'BIND', 'BINS', 'BITS', 'BLOW', 'BOAT', 'BOMB', 'BOND', 'BOOT', 'BORE',
-    'BORN', 'BOSS', 'BOWL', 'BOYS', 'BRAD', 'BUCK', 'BUGS', 'BULK', 'BUMP', 'BURN', 'BUSH', 'BUST', 'BUSY', 'BUYS',
-    'CAFE', 'CAGE', 'CAKE', 'CALM', 'CAME', 'CAMP', 'CANE', 'CAPS', 'CARD', 'CARE', 'CARS', 'CART', 'CASE', 'CASH',
-    'CAST', 'CATS', 'CAVE', 'CELL', 'CHAR', 'CHAT', 'CHEF', 'CHIP', 'CITE', 'CLAY', 'CLIP', 'COAL', 'CODE', 'COIN',
-    'COKE', 'COLD', 'COME', 'CONE', 'COOK', 'COOL', 'COPE', 'COPS', 'CORD', 'CORE', 'CORN', 'COST', 'COUP', 'CREW',
-    'CROP', 'CUBE', 'CUPS', 'CURE', 'CUTS', 'DAMN', 'DARE', 'DARK', 'DAWN', 'DAYS', 'DEAD', 'DEAF', 'DEAL', 'DEAN',
-    'DEBT', 'DECK', 'DEER', 'DEMO', 'DENY', 'DESK', 'DIAL', 'DICE', 'DIED', 'DIET', 'DIME', 'DIRE', 'DIRT', 'DISH',
-    'DIVE', 'DOCK', 'DOES', 'DOGS', 'DOME', 'DONE', 'DOOM', 'DOSE', 'DOTS', 'DOWN', 'DOZE', 'DRAG', 'DREW', 'DROP',
-    'DRUG', 'DRUM', 'DUAL', 'DUCK', 'DUDE', 'DUEL', 'DUMB', 'DUMP', 'DUNE', 'DUSK', 'DUST', 'DUTY', 'EACH', 'EARL',
-    'EARN', 'EARS', 'EASE', 'EAST', 'EASY', 'EATS', 'ECHO', 'EGGS', 'ELSE', 'EMIT', 'ENDS', 'EPIC', 'EURO', 'EVEN',
-    'EVIL', 'EXAM', 'EXIT', 'EYES', 'FACE', 'FACT', 'FADE', 'FAIL', 'FAIR', 'FALL', 'FAME', 'FANS', 'FARE', 'FARM',
-    'FAST', 'FATE', 'FEAR', 'FEAT', 'FEED', 'FEEL', 'FEES', 'FEET', 'FELL', 'FELT', 'FERN', 'FEST', 'FEUD', 'FIAT',
-    'FIDO', 'FIGS', 'FILE', 'FILL', 'FILM', 'FIND', 'FINE', 'FINS', 'FIRE', 'FIRM', 'FISH', 'FIST', 'FITS', 'FIVE',
-    'FIZZ', 'FLAG', 'FLAP', 'FLAT', 'FLAW', 'FLED', 'FLEE', 'FLEW', 'FLIP', 'FLOW', 'FLUX', 'FOAM', 'FOES', 'FOLK',
-    'FOND', 'FONT', 'FOOD', 'FOOL', 'FOOT', 'FORD', 'FORE', 'FORK', 'FORM', 'FORT', 'FOUL', 'FOUR', 'FOWL', 'FREE',
-    'FROG', 'FROM', 'FUEL', 'FULL', 'FUND', 'FUNK', 'FURY', 'FUSE', 'FUSS', 'GAIN', 'GALE', 'GAME', 'GANG', 'GAPS',
-    'GATE', 'GAVE', 'GAZE', 'GEAR', 'GEEK', 'GEMS', 'GENE', 'GETS', 'GIFT', 'GIRL', 'GIVE', 'GLAD', 'GLOW', 'GLUE',
-    'GOAL', 'GOAT', 'GOES', 'GOLD', 'GOLF', 'GONE', 'GOOD', 'GRAB', 'GRAD', 'GRAM', 'GRAY', 'GREW', 'GRID', 'GRIM',
-    'GRIP', 'GROW', 'GULF', 'GURU', 'GUYS', 'HACK', 'HAIL', 'HAIR', 'HALF', 'HALL', 'HALT', 'HAND', 'HANG', 'HARD',
-    'HARM', 'HATE', 'HAVE', 'HAWK', 'HAZE', 'HEAD', 'HEAL', 'HEAP', 'HEAR', 'HEAT', 'HEEL', 'HEIR', 'HELD', 'HELL',
-    'HELP', 'HEMP', 'HERD', 'HERE', 'HERO', 'HIDE', 'HIGH', 'HIKE', 'HILL', 'HINT', 'HIRE', 'HITS', 'HIVE', 'HOAX',
-    'HOLD', 'HOLE', 'HOLY', 'HOME', 'HOOD', 'HOOK', 'HOPE', 'HORN', 'HOST', 'HOUR', 'HUGE', 'HULL', 'HUNG', 'HUNT',
-    'HURT', 'HYMN', 'IBEX', 'ICED', 'ICON', 'IDEA', 'IDLE', 'IDOL', 'INCH', 'INFO', 'INIT', 'IRON', 'ISLE', 'ITEM',
-    'JABS', 'JACK', 'JADE', 'JAIL', 'JANE', 'JAZZ', 'JEAN', 'JEST', 'JETS', 'JOBS', 'JOGS', 'JOIN', 'JOKE', 'JOLT',
-    'JOSE', 'JUMP', 'JUNE', 'JUNK', 'JURY', 'JUST', 'JUTE', 'KEEN', 'KEEP', 'KEPT', 'KEYS', 'KICK', 'KIDS', 'KILL',
-    'KIND', 'KING', 'KISS', 'KITE', 'KNEE', 'KNEW', 'KNIT', 'KNOT', 'KNOW', 'LABS', 'LACE', 'LACK', 'LADS', 'LADY',
-    'LAID', 'LAKE', 'LAMB', 'LAMP', 'LAND', 'LANE', 'LAPS', 'LAST', 'LATE', 'LAWN', 'LAZY', 'LEAD', 'LEAF', 'LEAK',
-    'LEAN', 'LEAP', 'LEFT', 'LEGS', 'LENS', 'LESS', 'LEST', 'LEVY', 'LIAR', 'LICE', 'LICK', 'LIDS', 'LIES', 'LIFE',
-    'LIFT', 'LIME', 'LIMP', 'LINE', 'LINK', 'LION', 'LIPS', 'LIST', 'LIVE', 'LOAN', 'LOBE', 'LOCK', 'LOGO', 'LONE',
-    'LONG', 'LOOK', 'LOOP', 'LORD', 'LOSE', 'LOSS', 'LOST', 'LOTS', 'LOUD', 'LOVE', 'LUCK', 'LUNG', 'LURE', 'LYNX',
-    'MADE', 'MAID', 'MAIL', 'MAIN', 'MAKE', 'MALE', 'MALL', 'MALT', 'MAMA', 'MANE', 'MANY', 'MAPS', 'MARE', 'MARK',
-    'MARS', 'MASK', 'MASS', 'MAST', 'MATE', 'MATH', 'MAYO', 'MAZE', 'MEAL', 'MEAN', 'MEAT', 'MEEK', 'MEET', 'MELT',
-    'MEMO', 'MEND', 'MENU', 'MERE', 'MESH', 'MESS', 'MICE', 'MILD', 'MILE', 'MILK', 'MILL', 'MIME', 'MIND', 'MINE',
-    'MINT', 'MISS', 'MIST', 'MITT', 'MOAN', 'MOAT', 'MOCK', 'MODE', 'MOLD', 'MOLE', 'MONK', 'MOOD', 'MOON', 'MOOR',
-    'MOPE', 'MOPS', 'MORE', 'MOSS', 'MOST', 'MOTH', 'MOVE', 'MUCH', 'MULE', 'MUST', 'MUTE', 'MYTH', 'NAIL', 'NAME',
-    'NAPE', 'NAVY', 'NEAR', 'NEAT', 'NECK', 'NEED', 'NEST', 'NEWS', 'NEXT', 'NICE', 'NICK', 'NINE', 'NODE', 'NOON',
-    'NORM', 'NOSE', 'NOTE', 'NUMB', 'NUTS', 'OAKS', 'OATH', 'OATS', 'OBEY', 'ODDS', 'OILS', 'OKAY', 'ONCE', 'ONLY',
-    'ONTO', 'OPEN', 'OPTS', 'ORAL', 'ORBS', 'OVAL', 'OVEN', 'OVER', 'OWES', 'OWLS', 'OWNS', 'PACE', 'PACK', 'PACT',
-    'PAGE', 'PAID', 'PAIL', 'PAIN', 'PAIR', 'PALE', 'PALM', 'PANE', 'PAPA', 'PARK', 'PART', 'PASS', 'PAST', 'PATH',
-    'PAVE', 'PAYS', 'PEAK', 'PEAR', 'PEAS', 'PEEK', 'PEEL', 'PEER', 'PENS', 'PEST', 'PETS', 'PICK', 'PIES', 'PILE',
-    'PILL', 'PINE', 'PINK', 'PINS', 'PIPE', 'PITS', 'PLAN', 'PLAY', 'PLEA', 'PLOT', 'PLUG', 'PLUS', 'POEM', 'POET',
-    'POLE', 'POLL', 'POLO', 'POND', 'POOL', 'POOR', 'POPE', 'PORK', 'PORT', 'POSE', 'POST', 'POUR', 'PREP', 'PREY',
-    'PROS', 'PUFF', 'PULL', 'PUMP', 'PUNK', 'PURE', 'PUSH', 'PUTS', 'QUAD', 'QUIZ', 'QUIT', 'RACE', 'RACK', 'RAGE',
-    'RAIL', 'RAIN', 'RANK', 'RARE', 'RATE', 'RAYS', 'READ', 'REAL', 'REAP', 'REAR', 'RELY', 'RENT', 'REST', 'RICE',
-    'RICH', 'RIDE', 'RIDS', 'RING', 'RINK', 'RIOT', 'RIPE', 'RISE', 'RISK', 'ROAD', 'ROAM', 'ROBE', 'ROCK', 'RODE',
-    'ROLE', 'ROLL', 'ROME', 'ROOF', 'ROOM', 'ROOT', 'ROPE', 'ROSE', 'ROTE', 'RUBS', 'RUDE', 'RULE', 'RUNS', 'RUSH',
-    'RUST', 'RUTH', 'SAFE', 'SAGE', 'SAID', 'SAIL', 'SAKE', 'SALE', 'SALT', 'SAME', 'SAND', 'SANE', 'SAVE', 'SCAN',
-    'SEAL', 'SEAM', 'SEAT', 'SEED', 'SEEK', 'SEEM', 'SEEN', 'SELF', 'SELL', 'SEND', 'SENT', 'SETS', 'SEWN', 'SHED',
-    'SHIP', 'SHOE', 'SHOP', 'SHOT', 'SHOW', 'SHUT', 'SICK', 'SIDE', 'SIGH', 'SIGN', 'SILK', 'SING', 'SINK', 'SITE',
-    'SIZE', 'SKIP', 'SKIN', 'SLAM', 'SLIP', 'SLOT', 'SLOW', 'SNAP', 'SNOW', 'SOAP', 'SOAR', 'SOCK', 'SODA', 'SOFA',
-    'SOFT', 'SOIL', 'SOLD', 'SOLE', 'SOME', 'SONG', 'SOON', 'SORE', 'SORT', 'SOUL', 'SOUP', 'SOUR', 'SPAN', 'SPIN',
-    'SPIT', 'SPOT', 'STAB', 'STAG', 'STAR', 'STAY', 'STEM', 'STEP', 'STEW', 'STIR', 'STOP', 'STUB', 'STUD', 'SUCH',
-    'SUIT', 'SUNG', 'SUNK', 'SURE', 'SURF', 'SWAP', 'SWIM', 'TABS', 'TACT', 'TAIL', 'TAKE', 'TALE', 'TALK', 'TALL',
-    'TAME', 'TANK', 'TAPE', 'TAPS', 'TART', 'TASK', 'TAXI', 'TEAM', 'TEAR', 'TELL', 'TEMP', 'TEND', 'TENT', 'TEST',
-    'TEXT', 'THAN', 'THAT', 'THAW', 'THEM', 'THEN', 'THEY', 'THIN', 'THIS', 'THUS', 'TIDE', 'TIED', 'TIES', 'TILE',
-    'TILL', 'TILT', 'TIME', 'TINY', 'TIPS', 'TIRE', 'TOAD', 'TOLL', 'TOMB', 'TONE', 'TOOK', 'TOOL', 'TOPS', 'TORN',
-    'TOUR', 'TOWN', 'TOYS', 'TRAP', 'TREE', 'TRIM', 'TRIO', 'TRIP', 'TRUE', 'TUBE', 'TUCK', 'TUNE', 'TURF', 'TURN',
-    'TWIN', 'TYPE', 'UNIT', 'UPON', 'URGE', 'USED', 'USER', 'USES', 'VARY', 'VAST', 'VEAL', 'VEIN', 'VERY', 'VEST',
-    'VETO', 'VICE', 'VIEW', 'VINE', 'VISA', 'VOID', 'VOTE', 'WADE', 'WAGE', 'WAIT', 'WAKE', 'WALK', 'WALL', 'WANT',
-    'WARD', 'WARM', 'WARN', 'WARP', 'WARS', 'WASH', 'WAVE', 'WAYS', 'WEAK', 'WEAR', 'WEEK', 'WELL', 'WENT', 'WERE',
-    'WEST', 'WHAT', 'WHEN', 'WHEY', 'WHIP', 'WHOM', 'WICK', 'WIDE', 'WIFE', 'WILD', 'WILL', 'WIND', 'WINE', 'WING',
-    'WINK', 'WINS', 'WIPE', 'WIRE', 'WISE', 'WISH', 'WITH', 'WOKE', 'WOLF', 'WOOD', 'WOOL', 'WORD', 'WORE', 'WORK',
-    'WORM', 'WORN', 'WRAP', 'YARD', 'YARN', 'YEAR', 'YELL', 'YOGA', 'YOUR', 'ZERO', 'ZEST', 'ZINC', 'ZONE', 'ZOOM'
-} | ADDITIONAL_FOUR_LETTER_WORDS
-
-# 5-letter words (Combining base + additional words)
-FIVE_LETTER_WORDS = {
-    'ABOUT', 'ABOVE', 'ABUSE', 'ACTOR', 'ACUTE', 'ADMIT', 'ADOPT', 'ADULT', 'AFTER', 'AGAIN', 'AGENT', 'AGREE',
-    'AHEAD', 'ALARM', 'ALBUM', 'ALERT', 'ALIEN', 'ALIGN', 'ALIKE', 'ALIVE', 'ALLOW', 'ALONE', 'ALONG', 'ALTER',
-    'ANGEL', 'ANGER', 'ANGLE', 'ANGRY', 'APART', 'APPLE', 'APPLY', 'ARENA', 'ARGUE', 'ARISE', 'ARRAY', 'ARROW',
-    'ASIDE', 'ASSET', 'AVOID', 'AWAKE', 'AWARD', 'AWARE', 'BADLY', 'BAKER', 'BASES', 'BASIC', 'BEACH', 'BEGAN',
-    'BEGIN', 'BEING', 'BELLY', 'BELOW', 'BENCH', 'BILLY', 'BIRTH', 'BLACK', 'BLAME', 'BLANK', 'BLAST', 'BLIND',
-    'BLOCK', 'BLOOD', 'BOARD', 'BOAST', 'BOBBY', 'BOUND', 'BRAIN', 'BRAND', 'BRASS', 'BRAVE', 'BREAD', 'BREAK',
-    'BREED', 'BRIEF', 'BRING', 'BROAD', 'BROKE', 'BROWN', 'BUILD', 'BUILT', 'BUYER', 'CABLE', 'CALIF', 'CARRY',
-    'CATCH', 'CAUSE', 'CHAIN', 'CHAIR', 'CHAOS', 'CHARM', 'CHART', 'CHASE', 'CHEAP', 'CHECK', 'CHEST', 'CHIEF',
-    'CHILD', 'CHINA', 'CHOSE', 'CIVIC', 'CIVIL', 'CLAIM', 'CLASS', 'CLEAN', 'CLEAR', 'CLICK', 'CLIMB', 'CLOCK',
-    'CLOSE', 'CLOUD', 'COACH', 'COAST', 'COULD', 'COUNT', 'COURT', 'COVER', 'CRAFT', 'CRASH', 'CRAZY', 'CREAM',
-    'CRIME', 'CROSS', 'CROWD', 'CROWN', 'CRUDE', 'CURVE', 'CYCLE', 'DAILY', 'DANCE', 'DATED', 'DEALT', 'DEATH',
-    'DEBUT', 'DELAY', 'DEPTH', 'DOING', 'DOUBT', 'DOZEN', 'DRAFT', 'DRAMA', 'DRANK', 'DRAWN', 'DREAM', 'DRESS',
-    'DRILL', 'DRINK', 'DRIVE', 'DROVE', 'DYING', 'EAGER', 'EARLY', 'EARTH', 'EIGHT', 'ELITE', 'EMPTY', 'ENEMY',
-    'ENJOY', 'ENTER', 'ENTRY', 'EQUAL', 'ERROR', 'EVENT', 'EVERY', 'EXACT', 'EXIST', 'EXTRA', 'FAITH', 'FALSE',
-    'FAULT', 'FIBER', 'FIBRE', 'FIELD', 'FIFTH', 'FIFTY', 'FIGHT', 'FINAL', 'FIRST', 'FIXED', 'FLASH', 'FLEET',
-    'FLOOR', 'FLUID', 'FOCUS', 'FORCE', 'FORTH', 'FORTY', 'FORUM', 'FOUND', 'FRAME', 'FRANK', 'FRAUD', 'FRESH',
-    'FRONT', 'FROST', 'FRUIT', 'FULLY', 'FUNNY', 'GIANT', 'GIVEN', 'GLASS', 'GLOBE', 'GLORY', 'GOODS', 'GRACE',
-    'GRADE', 'GRAIN', 'GRAND', 'GRANT', 'GRASS', 'GRAVE', 'GREAT', 'GREEN', 'GROSS', 'GROUP', 'GROWN', 'GUARD',
-    'GUESS', 'GUEST', 'GUIDE', 'HAPPY', 'HARRY', 'HEART', 'HEAVY', 'HENRY', 'HORSE', 'HOTEL', 'HOUSE', 'HUMAN',
-    'IDEAL', 'IMAGE', 'INDEX', 'INNER', 'INPUT', 'ISSUE', 'JAPAN', 'JIMMY', 'JOINT', 'JONES', 'JUDGE', 'KNOWN',
-    'LABEL', 'LARGE', 'LASER', 'LATER', 'LAUGH', 'LAYER', 'LEARN', 'LEASE', 'LEAST', 'LEAVE', 'LEGAL', 'LEVEL',
-    'LEWIS', 'LIGHT', 'LIMIT', 'LINKS', 'LIVES', 'LOCAL', 'LOOSE', 'LOWER', 'LUCKY', 'LUNCH', 'LYING', 'MAGIC',
-    'MAJOR', 'MAKER', 'MARCH', 'MARIA', 'MATCH', 'MAYBE', 'MAYOR', 'MEANT', 'MEDIA', 'METAL', 'MIGHT', 'MINOR',
-    'MINUS', 'MIXED', 'MODEL', 'MONEY', 'MONTH', 'MORAL', 'MOTOR', 'MOUNT', 'MOUSE', 'MOUTH', 'MOVED', 'MOVIE',
-    'MUSIC', 'NEEDS', 'NEVER', 'NEWLY', 'NIGHT', 'NOISE', 'NORTH', 'NOTED', 'NOVEL', 'NURSE', 'OCCUR', 'OCEAN',
-    'OFFER', 'OFTEN', 'ORDER', 'OTHER', 'OUGHT', 'PAINT', 'PANEL', 'PAPER', 'PARIS', 'PARTY', 'PEACE', 'PETER',
-    'PHASE', 'PHONE', 'PHOTO', 'PIANO', 'PIECE', 'PILOT', 'PITCH', 'PLACE', 'PLAIN', 'PLANE', 'PLANT', 'PLATE',
-    'POINT', 'POUND', 'POWER', 'PRESS', 'PRICE', 'PRIDE', 'PRIME', 'PRINT', 'PRIOR', 'PRIZE', 'PROOF', 'PROUD',
-    'PROVE', 'QUEEN', 'QUICK', 'QUIET', 'QUITE', 'RADIO', 'RAISE', 'RANGE', 'RAPID', 'RATIO', 'REACH', 'READY',
-    'REALM', 'REBEL', 'REFER', 'RELAX', 'REPAY', 'REPLY', 'RIGHT', 'RIVAL', 'RIVER', 'ROBIN', 'ROGER', 'ROMAN',
-    'ROUGH', 'ROUND', 'ROUTE', 'ROYAL', 'RURAL', 'SCALE', 'SCENE', 'SCOPE', 'SCORE', 'SENSE', 'SERVE', 'SETUP',
-    'SEVEN', 'SHALL', 'SHAPE', 'SHARE', 'SHARP', 'SHEET', 'SHELF', 'SHELL', 'SHIFT', 'SHINE', 'SHIRT', 'SHOCK',
-    'SHOOT', 'SHORT', 'SHOWN', 'SIGHT', 'SIMON', 'SIXTH', 'SIXTY', 'SIZED', 'SKILL', 'SLEEP', 'SLIDE', 'SMALL',
-    'SMART', 'SMILE', 'SMITH', 'SMOKE', 'SNAKE', 'SNOW', 'SOLAR', 'SOLID', 'SOLVE', 'SORRY', 'SOUND', 'SOUTH',
-    'SPACE', 'SPARE', 'SPEAK', 'SPEED', 'SPEND', 'SPENT', 'SPLIT', 'SPOKE', 'SPORT', 'SQUAD', 'STAFF', 'STAGE',
-    'STAKE', 'STAND', 'START', 'STATE', 'STEAM', 'STEEL', 'STEEP', 'STEER', 'STICK', 'STILL', 'STOCK', 'STONE',
-    'STOOD', 'STORE', 'STORM', 'STORY', 'STRIP', 'STUCK', 'STUDY', 'STUFF', 'STYLE', 'SUGAR', 'SUITE', 'SUPER',
-    'SWEET', 'SWIFT', 'SWING', 'SWISS', 'TABLE', 'TAKEN', 'TASTE', 'TAXES', 'TEACH', 'TEETH', 'TERRY', 'TEXAS',
-    'THANK', 'THEFT', 'THEIR', 'THEME', 'THERE', 'THESE', 'THICK', 'THING', 'THINK', 'THIRD', 'THOSE', 'THREE',
-    'THREW', 'THROW', 'THUMB', 'TIGER', 'TIGHT', 'TIRED', 'TITLE', 'TODAY', 'TOKEN', 'TOMMY', 'TOPIC', 'TOTAL',
-    'TOUCH', 'TOUGH', 'TOWER', 'TRACK', 'TRADE', 'TRAIN', 'TREAT', 'TREND', 'TRIAL', 'TRIBE', 'TRICK', 'TRIED',
-    'TRIES', 'TRUCK', 'TRULY', 'TRUNK', 'TRUST', 'TRUTH', 'TWICE', 'TWIST', 'TYLER', 'UNCLE', 'UNDUE', 'UNION',
-    'UNITY', 'UNTIL', 'UPPER', 'UPSET', 'URBAN', 'USAGE', 'USUAL', 'VALUE', 'VIDEO', 'VIRUS', 'VISIT', 'VITAL',
-    'VOCAL', 'VOICE', 'WASTE', 'WATCH', 'WATER', 'WHEEL', 'WHERE', 'WHICH', 'WHILE', 'WHITE', 'WHOLE', 'WHOSE',
-    'WIDOW', 'WIDTH', 'WOMAN', 'WOMEN', 'WORLD', 'WORRY', 'WORSE', 'WORST', 'WORTH', 'WOULD', 'WRITE', 'WRONG',
-    'WROTE', 'YARDS', 'YEAH', 'YOUNG', 'YOURS', 'YOUTH', 'ACTOR', 'ADULT', 'ALBUM', 'ALIEN', 'ALPHA', 'AMBER',
-    'ANGEL', 'ANIMAL', 'ANKLE', 'APPLE', 'ARENA', 'ARMOR', 'ARROW', 'ATLAS', 'BADGE', 'BASIC', 'BEACH', 'BENCH',
-    'BERRY', 'BIRTH', 'BLANK', 'BLAST', 'BLIND', 'BLOCK', 'BLOOM', 'BOARD', 'BONUS', 'BOOTH', 'BOUND', 'BOXER',
-    'BRAIN', 'BRAND', 'BRAVE', 'BREAD', 'BREAK', 'BRICK', 'BRIDE', 'BRIEF', 'BRING', 'BROAD', 'BROKE', 'BROWN',
-    'BRUSH', 'BUILD', 'BUNCH', 'BUYER', 'CABLE', 'CANDY', 'CARGO', 'CARRY', 'CATCH', 'CAUSE', 'CHAIR', 'CHAOS',
-    'CHARM', 'CHART', 'CHASE', 'CHEAP', 'CHECK', 'CHEST', 'CHILD', 'CHINA', 'CHOSE', 'CLAIM', 'CLASS', 'CLEAN',
-    'CLEAR', 'CLICK', 'CLIMB', 'CLOCK', 'CLOSE', 'CLOTH', 'CLOUD', 'COACH', 'COAST', 'COLON', 'COLOR', 'COMET',
-    'CORAL', 'COUCH', 'COUNT', 'COURT', 'COVER', 'CRAFT', 'CRANE', 'CRASH', 'CRAZY', 'CREAM', 'CREEK', 'CRIME',
-    'CRISP', 'CROSS', 'CROWD', 'CROWN', 'CRUDE', 'CRUSH', 'CURVE', 'CYCLE', 'DAILY', 'DANCE', 'DATED', 'DEALT',
-    'DEATH', 'DEBUT', 'DELAY', 'DEMON', 'DENSE', 'DEPOT', 'DEPTH', 'DERBY', 'DESK', 'DEVIL', 'DIARY', 'DIGIT',
-    'DINER', 'DIRTY', 'DISCO', 'DOING', 'DONOR', 'DOUBT', 'DOZEN', 'DRAFT', 'DRAIN', 'DRAMA', 'DRANK', 'DRAWN',
-    'DREAM', 'DRESS', 'DRIED', 'DRILL', 'DRINK', 'DRIVE', 'DRONE', 'DROVE', 'DRUNK', 'DRIED', 'DYING', 'EAGER',
-    'EAGLE', 'EARLY', 'EARTH', 'EIGHT', 'ELDER', 'ELITE', 'EMPTY', 'ENEMY', 'ENJOY', 'ENTER', 'ENTRY', 'EQUAL',
-    'ERROR', 'EVENT', 'EVERY', 'EXACT', 'EXCEL', 'EXIST', 'EXTRA', 'FABLE', 'FAITH', 'FALSE', 'FANCY', 'FATAL',
-    'FAULT', 'FAVOR', 'FENCE', 'FERRY', 'FIBER', 'FIELD', 'FIERY', 'FIFTH', 'FIFTY', 'FIGHT', 'FINAL', 'FIRST',
-    'FIXED', 'FLAME', 'FLASH', 'FLEET', 'FLESH', 'FLOAT', 'FLOOD', 'FLOOR', 'FLOUR', 'FLUID', 'FOCUS', 'FORCE',
-    'FORGE', 'FORTH', 'FORTY', 'FORUM', 'FOUND', 'FRAME', 'FRANK', 'FRAUD', 'FRESH', 'FRIED', 'FRONT', 'FROST',
-    'FRUIT', 'FULLY', 'FUNNY', 'FUZZY', 'GAINS', 'GAMMA', 'GATES', 'GAUGE', 'GHOST', 'GIANT', 'GIVEN', 'GLASS',
-    'GLEAM', 'GLOBE', 'GLORY', 'GLOVE', 'GOODS', 'GRACE', 'GRADE', 'GRAIN', 'GRAND', 'GRANT', 'GRAPE', 'GRASS',
-    'GRAVE', 'GREAT', 'GREED', 'GREEN', 'GREET', 'GRIEF', 'GRILL', 'GRIND', 'GROAN', 'GROSS', 'GROUP', 'GROWN',
-    'GUARD', 'GUESS', 'GUEST', 'GUIDE', 'GUILD', 'GUILT', 'HAPPY', 'HARSH', 'HASTE', 'HEARD', 'HEART', 'HEAVY',
-    'HEDGE', 'HENCE', 'HENRY', 'HERBS', 'HILLS', 'HINGE', 'HITCH', 'HOBBY', 'HONEY', 'HONOR', 'HOPES', 'HORSE',
-    'HOTEL', 'HOUSE', 'HOVER', 'HUMAN', 'HUMOR', 'HURRY', 'IDEAL', 'IMAGE', 'IMPLY', 'INDEX', 'INDIE', 'INNER',
-    'INPUT', 'INTEL', 'INTER', 'INTRO', 'IRONY', 'ISSUE', 'IVORY', 'JAPAN', 'JEANS', 'JERRY', 'JIMMY', 'JOINT',
-    'JONES', 'JUDGE', 'JUICE', 'JUMBO', 'JUNKY', 'KARMA', 'KEEPS', 'KENNY', 'KNIFE', 'KNOCK', 'KNOWN', 'LABEL',
-    'LABOR', 'LANCE', 'LANDS', 'LARGE', 'LASER', 'LATER', 'LAUGH', 'LAYER', 'LEADS', 'LEARN', 'LEASE', 'LEAST',
-    'LEAVE', 'LEDGE', 'LEGAL', 'LEMON', 'LEVEL', 'LEWIS', 'LIGHT', 'LIMIT', 'LINED', 'LINKS', 'LIONS', 'LISTS',
-    'LIVED', 'LIVES', 'LOADS', 'LOANS', 'LOCAL', 'LOCKS', 'LOGIC', 'LOOSE', 'LORDS', 'LOSES', 'LOVED', 'LOVER',
-    'LOVES', 'LOWER', 'LOYAL', 'LUCKY', 'LUNCH', 'LYING', 'MAGIC', 'MAJOR', 'MAKER', 'MALES', 'MANGA', 'MAPLE',
-    'MARCH', 'MARIA', 'MARKS', 'MARRY', 'MASON', 'MATCH', 'MATES', 'MATHS', 'MAYBE', 'MAYOR', 'MEALS', 'MEANS',
-    'MEANT', 'MEATS', 'MEDAL', 'MEDIA', 'MELON', 'MEMES', 'MERCY', 'MERGE', 'MERIT', 'MERRY', 'METAL', 'METER',
-    'MICRO', 'MIDST', 'MIGHT', 'MILES', 'MINDS', 'MINES', 'MINOR', 'MINUS', 'MIXED', 'MODAL', 'MODEL', 'MODES',
-    'MODEM', 'MONEY', 'MONKS', 'MONTH', 'MOODS', 'MORAL', 'MOSES', 'MOTOR', 'MOTTO', 'MOULD', 'MOUND', 'MOUNT',
-    'MOUSE', 'MOUTH', 'MOVED', 'MOVES', 'MOVIE', 'MUSIC', 'MYTHS', 'NAMED', 'NAMES', 'NANCY', 'NASTY', 'NEEDS',
-    'NERVE', 'NEVER', 'NEWLY', 'NIGHT', 'NINE', 'NODES', 'NOISE', 'NORMS', 'NORTH', 'NOTED', 'NOTES', 'NOVEL',
-    'NURSE', 'OATHS', 'OCCUR', 'OCEAN', 'ODDS', 'OFFER', 'OFTEN', 'OLDER', 'OLIVE', 'OPENS', 'OPERA', 'ORDER',
-    'ORGAN', 'OTHER', 'OUGHT', 'OUTER', 'OWNED', 'OWNER', 'PAGES', 'PAINS', 'PAINT', 'PAIRS', 'PALMS', 'PANEL',
-    'PANIC', 'PANTS', 'PAPA', 'PAPER', 'PARIS', 'PARKS', 'PARTS', 'PARTY', 'PASTA', 'PASTE', 'PATCH', 'PATHS',
-    'PAUSE', 'PEACE', 'PEACH', 'PEAKS', 'PEARL', 'PEERS', 'PENNY', 'PERKS', 'PETER', 'PHASE', 'PHONE', 'PHOTO',
-    'PIANO', 'PIECE', 'PILES', 'PILOT', 'PINCH', 'PIPES', 'PITCH', 'PIZZA', 'PLACE', 'PLAIN', 'PLANE', 'PLANS',
-    'PLANT', 'PLATE', 'PLAYS', 'PLAZA', 'PLOTS', 'POEMS', 'POETS', 'POINT', 'POLES', 'POOLS', 'PORCH', 'POSES',
-    'POUND', 'POWER', 'PRESS', 'PRICE', 'PRIDE', 'PRIME', 'PRINT', 'PRIOR', 'PRIZE', 'PROOF', 'PROPS', 'PROUD',
-    'PROVE', 'PROXY', 'PSALM', 'PULLS', 'PULSE', 'PUMPS', 'PUNCH', 'PURSE', 'QUEEN', 'QUERY', 'QUEST', 'QUEUE',
-    'QUICK', 'QUIET', 'QUILT', 'QUITE', 'QUOTA', 'QUOTE', 'RADIO', 'RAILS', 'RAINS', 'RAISE', 'RANKS', 'RAPID',
-    'RATES', 'RATIO', 'REACH', 'READS', 'READY', 'REALM', 'REBEL', 'REFER', 'REIGN', 'RELAX', 'RELAY', 'REMIT',
-    'REPAY', 'REPLY', 'RESET', 'RIGHT', 'RINGS', 'RISES', 'RISKS', 'RIVAL', 'RIVER', 'ROADS', 'ROAST', 'ROBIN',
-    'ROBOT', 'ROCKS', 'ROGER', 'ROLES', 'ROLLS', 'ROMAN', 'ROOMS', 'ROOTS', 'ROSES', 'ROUGH', 'ROUND', 'ROUTE',
-    'ROYAL', 'RUINS', 'RULES', 'RURAL', 'SAFER', 'SAINT', 'SALES', 'SALTS', 'SANDY', 'SAUCE', 'SAVES', 'SCALE',
-    'SCARE', 'SCENE', 'SCOPE', 'SCORE', 'SCOTS', 'SCRUB', 'SEALS', 'SEATS', 'SEEDS', 'SEEKS', 'SEEMS', 'SELLS',
-    'SENDS', 'SENSE', 'SERVE', 'SETUP', 'SEVEN', 'SHADE', 'SHAFT', 'SHAKE', 'SHALL', 'SHAME', 'SHAPE', 'SHARE',
-    'SHARK', 'SHARP', 'SHAVE', 'SHEET', 'SHELF', 'SHELL', 'SHINE', 'SHIPS', 'SHIRT', 'SHOCK', 'SHOES', 'SHOOT',
-    'SHOPS', 'SHORT', 'SHOTS', 'SHOUT', 'SHOWN', 'SHOWS', 'SIDES', 'SIGHT', 'SIGNS', 'SILLY', 'SIMON', 'SINCE',
-    'SINGS', 'SITES', 'SIXTH', 'SIXTY', 'SIZED', 'SIZES', 'SKILL', 'SKINS', 'SKULL', 'SLATE', 'SLAVE', 'SLEEP',
-    'SLICE', 'SLIDE', 'SLOPE', 'SMALL', 'SMART', 'SMILE', 'SMITH', 'SMOKE', 'SNAKE', 'SNAPS', 'SNEAK', 'SNOW',
-    'SOCKS', 'SOLAR', 'SOLID', 'SOLVE', 'SONGS', 'SORRY', 'SORTS', 'SOULS', 'SOUND', 'SOUTH', 'SPACE', 'SPARE',
-    'SPARK', 'SPEAK', 'SPECS', 'SPEED', 'SPELL', 'SPEND', 'SPENT', 'SPINE', 'SPLIT', 'SPOKE', 'SPORT', 'SPOTS',
-    'SPRAY', 'SQUAD', 'STACK', 'STAFF', 'STAGE', 'STAKE', 'STALL', 'STAMP', 'STAND', 'STARS', 'START', 'STATE',
-    'STAYS', 'STEAL', 'STEAM', 'STEEL', 'STEEP', 'STEER', 'STEMS', 'STEPS', 'STERN', 'STICK', 'STILL', 'STING',
-    'STOCK', 'STONE', 'STOOD', 'STOPS', 'STORE', 'STORM', 'STORY', 'STRIP', 'STUCK', 'STUDY', 'STUFF', 'STYLE',
-    'SUGAR', 'SUITE', 'SUPER', 'SWEAR', 'SWEEP', 'SWEET', 'SWIFT', 'SWING', 'SWISS', 'SWORD', 'TABLE', 'TAKEN',
-    'TAKES', 'TALES', 'TALKS', 'TANKS', 'TAPES', 'TASKS', 'TASTE', 'TAXES', 'TEACH', 'TEAMS', 'TEARS', 'TEENS',
-    'TEETH', 'TELLS', 'TERMS', 'TERRY', 'TESTS', 'TEXAS', 'TEXTS', 'THANK', 'THEFT', 'THEIR', 'THEME', 'THERE',
-    'THESE', 'THICK', 'THING', 'THINK', 'THIRD', 'THOSE', 'THREE', 'THREW', 'THROW', 'THUMB', 'TIGER', 'TIGHT',
-    'TILES', 'TIMES', 'TINY', 'TIRED', 'TITLE', 'TODAY', 'TOKEN', 'TOMMY', 'TOOLS', 'TOPIC', 'TOTAL', 'TOUCH',
-    'TOUGH', 'TOURS', 'TOWER', 'TOWNS', 'TOYS', 'TRACK', 'TRADE', 'TRAIL', 'TRAIN', 'TRAIT', 'TRASH', 'TREAT',
-    'TREES', 'TREND', 'TRIAL', 'TRIBE', 'TRICK', 'TRIED', 'TRIES', 'TRIPS', 'TRUCK', 'TRULY', 'TRUMP', 'TRUNK',
-    'TRUST', 'TRUTH', 'TUBES', 'TUNED', 'TURNS', 'TWICE', 'TWIST', 'TYLER', 'TYPES', 'ULTRA', 'UNCLE', 'UNDER',
-    'UNDUE', 'UNION', 'UNITS', 'UNITY', 'UNTIL', 'UPPER', 'UPSET', 'URBAN', 'URGED', 'USAGE', 'USERS', 'USES',
-    'USUAL', 'VALUE', 'VENUE', 'VERSO', 'VIDEO', 'VIEWS', 'VINYL', 'VIRUS', 'VISIT', 'VITAL', 'VOCAL', 'VOICE',
-    'VOTED', 'VOTES', 'WAGES', 'WAIST', 'WALKS', 'WALLS', 'WANTS', 'WARNS', 'WASTE', 'WATCH', 'WATER', 'WAVES',
-    'WEEKS', 'WEIRD', 'WELLS', 'WHEEL', 'WHERE', 'WHICH', 'WHILE', 'WHITE', 'WHOLE', 'WHOSE', 'WIDER', 'WIDOW',
-    'WIDTH', 'WINDS', 'WINES', 'WINGS', 'WIPES', 'WIRED', 'WIRES', 'WITCH', 'WIVES', 'WOMAN', 'WOMEN', 'WOODS',
-    'WORDS', 'WORKS', 'WORLD', 'WORMS', 'WORRY', 'WORSE', 'WORST', 'WORTH', 'WOULD', 'WRIST', 'WRITE', 'WRONG',
-    'WROTE', 'YARDS', 'YEARS', 'YOUNG', 'YOURS', 'YOUTH', 'ZONES'
-} | ADDITIONAL_FIVE_LETTER_WORDS
-
-# 6-letter words (Combining base + additional words)
-SIX_LETTER_WORDS = {
-    'ACCEPT', 'ACCESS', 'ACCORD', 'ACROSS', 'ACTION', 'ACTIVE', 'ACTUAL', 'ADJUST', 'ADVICE', 'ADVISE', 'AFFECT',
-    'AFFORD', 'AFRAID', 'AFRICA', 'AGENCY', 'AGENDA', 'AGREED', 'ALMOST', 'ALWAYS', 'AMOUNT', 'ANIMAL', 'ANNUAL',
-    'ANSWER', 'ANYONE', 'ANYWAY', 'APPEAR', 'AROUND', 'ARRIVE', 'ARTIST', 'ASPECT', 'ASSUME', 'ATTACK', 'ATTEND',
-    'AUGUST', 'AUTHOR', 'AVENUE', 'BANNED', 'BATTLE', 'BEAUTY', 'BECAME', 'BECOME', 'BEFORE', 'BEHALF', 'BEHAVE',
-    'BEHIND', 'BELIEF', 'BELONG', 'BESIDE', 'BETTER', 'BETWEEN', 'BEYOND', 'BISHOP', 'BLOODY', 'BORDER', 'BOTTLE',
-    'BOTTOM', 'BOUGHT', 'BRANCH', 'BREATH', 'BRIDGE', 'BRIGHT', 'BRINGS', 'BROKEN', 'BUDGET', 'BURDEN', 'BUREAU',
-    'BUTTON', 'CAMERA', 'CANCER', 'CANNOT', 'CANVAS', 'CAREER', 'CARING', 'CASTLE', 'CASUAL', 'CAUGHT', 'CAUSED',
-    'CENTRE', 'CHANCE', 'CHANGE', 'CHARGE', 'CHOSEN', 'CHURCH', 'CIRCLE', 'CLIENT', 'CLOSED', 'CLOSER', 'COFFEE',
-    'COLUMN', 'COMBAT', 'COMING', 'COMMON', 'COMPLY', 'COPPER', 'CORNER', 'COSTLY', 'COUNTY', 'COUPLE', 'COURSE',
-    'COVERS', 'CREATE', 'CREDIT', 'CRISIS', 'CUSTOM', 'DAMAGE', 'DANGER', 'DEALER', 'DEBATE', 'DECADE', 'DECIDE',
-    'DEFEAT', 'DEFEND', 'DEFINE', 'DEGREE', 'DELIVER', 'DEMAND', 'DEPEND', 'DEPUTY', 'DESERT', 'DESIGN', 'DESIRE',
-    'DETAIL', 'DETECT', 'DEVICE', 'DIFFER', 'DINNER', 'DIRECT', 'DOCTOR', 'DOLLAR', 'DOMAIN', 'DOUBLE', 'DRAGON',
-    'DRAWER', 'DRIVER', 'DURING', 'EASILY', 'EATING', 'EDITOR', 'EFFECT', 'EFFORT', 'EIGHTH', 'EITHER', 'ELEVEN',
-    'EMPIRE', 'EMPLOY', 'ENABLE', 'ENDING', 'ENERGY', 'ENGINE', 'ENOUGH', 'ENSURE', 'ENTIRE', 'EQUITY', 'ERROR',
-    'ESCAPE', 'ESTATE', 'ETHNIC', 'EUROPE', 'EVENTS', 'EXCEPT', 'EXCUSE', 'EXPAND', 'EXPECT', 'EXPERT', 'EXPORT',
-    'EXTEND', 'EXTENT', 'FABRIC', 'FACIAL', 'FACTOR', 'FAILED', 'FAIRLY', 'FALLEN', 'FAMILY', 'FAMOUS', 'FATHER',
-    'FAULTY', 'FEATURE', 'FELLOW', 'FEMALE', 'FIGURE', 'FILING', 'FINGER', 'FINISH', 'FISCAL', 'FLIGHT', 'FLOWER',
-    'FLYING', 'FOLDER', 'FOLLOW', 'FORGET', 'FORMAT', 'FORMER', 'FOUGHT', 'FOURTH', 'FRIDAY', 'FRIEND', 'FROZEN',
-    'FUTURE', 'GALAXY', 'GARAGE', 'GARDEN', 'GATHER', 'GENDER', 'GENTLE', 'GERMAN', 'GLOBAL', 'GOLDEN', 'GROUND',
-    'GROWTH', 'GUITAR', 'HANDED', 'HANDLE', 'HAPPEN', 'HARDLY', 'HEADED', 'HEALTH', 'HEATED', 'HEIGHT', 'HELPED',
-    'HEREBY', 'HIDDEN', 'HOLDER', 'HOPING', 'HORROR', 'HORSES', 'HOTELS', 'HOURS', 'HOUSES', 'HOWEVER', 'HUNGER',
-    'HUNTER', 'HURRIED', 'HUSHED', 'HYBRID', 'IGNORE', 'IMPACT', 'IMPORT', 'INCOME', 'INDEED', 'INDIAN', 'INDOOR',
-    'INFANT', 'INFORM', 'INJECT', 'INJURY', 'INLINE', 'INSECT', 'INSIDE', 'INSIST', 'INTAKE', 'INTEND', 'INTENT',
-    'INVEST', 'INVITE', 'ISLAND', 'ITSELF', 'JACKET', 'JOINED', 'JUNIOR', 'KILLED', 'KILLER', 'KINDLY', 'LADIES',
-    'LAPTOP', 'LARGER', 'LATEST', 'LATTER', 'LAUNCH', 'LAWYER', 'LEADER', 'LEAGUE', 'LEARNS', 'LEGACY', 'LENGTH',
-    'LESSON', 'LETTER', 'LIFTED', 'LIKELY', 'LINKED', 'LIQUID', 'LISTEN', 'LITTLE', 'LIVING', 'LOCKED', 'LONDON',
-    'LONGER', 'LOOKED', 'LOSING', 'LOVELY', 'LOVING', 'LUCKY', 'LUMBER', 'LUXURY', 'LYRICS', 'MACHINE', 'MAINLY',
-    'MAKING', 'MANAGE', 'MANNER', 'MARBLE', 'MARGIN', 'MARINE', 'MARKED', 'MARKER', 'MARKET', 'MARTIN', 'MASTER',
-    'MATTER', 'MATURE', 'MEDALS', 'MEDIUM', 'MEMBER', 'MEMORY', 'MENTAL', 'MERELY', 'MERGER', 'METHOD', 'METRIC',
-    'MIDDLE', 'MILLER', 'MINING', 'MINUTE', 'MIRROR', 'MOBILE', 'MODERN', 'MODIFY', 'MODULE', 'MOMENT', 'MONDAY',
-    'MONTHS', 'MOSTLY', 'MOTHER', 'MOTION', 'MOVIES', 'MOVING', 'MURDER', 'MUSCLE', 'MUSEUM', 'MUTUAL', 'MYSELF',
-    'NATION', 'NATIVE', 'NATURE', 'NEARBY', 'NEARLY', 'NEEDED', 'NEPHEW', 'NICELY', 'NIGHTS', 'NOBODY', 'NORMAL',
-    'NOTICE', 'NOTION', 'NOVELS', 'NUMBER', 'NURSES', 'OBJECT', 'OBTAIN', 'OBVIOUS', 'OCCUPY', 'OCCURS', 'OFFICE',
-    'OFFSET', 'ONLINE', 'OPENED', 'OPTION', 'ORANGE', 'ORDERS', 'ORIGIN', 'OUTPUT', 'OUTSET', 'OXYGEN', 'PACKED',
-    'PALACE', 'PANELS', 'PAPERS', 'PARADE', 'PARENT', 'PARTLY', 'PASSED', 'PATENT', 'PATROL', 'PAYING', 'PEACE',
-    'PEOPLE', 'PERIOD', 'PERMIT', 'PERSON', 'PHONES', 'PHOTOS', 'PHRASE', 'PICKED', 'PIECES', 'PLACED', 'PLACES',
-    'PLANET', 'PLANTS', 'PLATES', 'PLAYED', 'PLAYER', 'PLEASE', 'PLENTY', 'POCKET', 'POINTS', 'POLICE', 'POLICY',
-    'POLISH', 'POORLY', 'PORTER', 'POSTED', 'POTATO', 'POWDER', 'POWERS', 'PRAISE', 'PRAYER', 'PREFER', 'PRETTY',
-    'PRICES', 'PRIME', 'PRINCE', 'PRINTS', 'PRISON', 'PROFIT', 'PROPER', 'PROVEN', 'PUBLIC', 'PUERTO', 'PURPLE',
-    'PURSUE', 'PUSHED', 'PUZZLE', 'QUEENS', 'QUOTES', 'RACING', 'RARELY', 'RATHER', 'RATING', 'REALLY', 'REASON',
-    'REBELS', 'RECALL', 'RECENT', 'RECORD', 'REDUCE', 'REFORM', 'REFUSE', 'REGARD', 'REGION', 'RELATE', 'RELIED',
-    'RELIEF', 'REMAIN', 'REMOTE', 'REMOVE', 'REPAIR', 'REPEAT', 'REPLACE', 'REPLY', 'REPORT', 'RESCUE', 'RESULT',
-    'RETAIL', 'RETIRE', 'RETURN', 'REVEAL', 'REVIEW', 'REVOLT', 'REWARD', 'RIDING', 'RIGHTS', 'RISING', 'ROBUST',
-    'ROCKET', 'ROLLED', 'RONALD', 'ROSTER', 'ROTATE', 'ROUTER', 'RUBBER', 'RULING', 'RUMORS', 'RUNNER', 'RUSHED',
-    'RUSSIA', 'SACRED', 'SADDLE', 'SAFELY', 'SAFETY', 'SAILED', 'SALARY', 'SAMPLE', 'SAVING', 'SAYING', 'SCALES',
-    'SCARED', 'SCENES', 'SCHEME', 'SCHOOL', 'SCORES', 'SCREEN', 'SCRIPT', 'SEARCH', 'SEASON', 'SECOND', 'SECRET',
-    'SECTOR', 'SECURE', 'SEEING', 'SELDOM', 'SELECT', 'SENATE', 'SENIOR', 'SEQUEL', 'SERIES', 'SERVED', 'SERVER',
-    'SETTLE', 'SEVERE', 'SHADOW', 'SHARED', 'SHEETS', 'SHIELD', 'SHIRTS', 'SHORTS', 'SHOULD', 'SHOWED', 'SHOWER',
-    'SHRINK', 'SHUTUP', 'SIGNED', 'SILENT', 'SILVER', 'SIMPLE', 'SIMPLY', 'SINGLE', 'SISTER', 'SITTING', 'SLIGHT',
-    'SLOWLY', 'SMALLER', 'SMOOTH', 'SOCCER', 'SOCIAL', 'SOCKET', 'SODIUM', 'SOFTER', 'SOLELY', 'SOLVED', 'SOMEWHAT',
-    'SOUNDS', 'SOURCE', 'SOVIET', 'SPEAKS', 'SPEECH', 'SPIRIT', 'SPOKEN', 'SPORTS', 'SPREAD', 'SPRING', 'SQUARE',
-    'STABLE', 'STAGED', 'STAIRS', 'STANCE', 'STANDS', 'STARTS', 'STATED', 'STATES', 'STATIC', 'STATUS', 'STAYED',
-    'STEADY', 'STOLEN', 'STONES', 'STORAGE', 'STORED', 'STORES', 'STORMS', 'STRAND', 'STREAM', 'STREET', 'STRESS',
-    'STRICT', 'STRIKE', 'STRING', 'STRONG', 'STRUCK', 'STUDIO', 'STUPID', 'STYLES', 'SUBMIT', 'SUDDEN', 'SUFFER',
-    'SUMMER', 'SUNDAY', 'SUPPLY', 'SURELY', 'SURVEY', 'SWITCH', 'SYMBOL', 'SYSTEM', 'TABLES', 'TACKLE', 'TAKING',
-    'TALENT', 'TALKED', 'TARGET', 'TAUGHT', 'TEMPLE', 'TENDER', 'TENNIS', 'TERRIBLE', 'THANKS', 'THEORY', 'THIRTY',
-    'THOUGH', 'THREAD', 'THREAT', 'THRONE', 'THROWN', 'THRUST', 'TICKET', 'TIMBER', 'TIMING', 'TISSUE', 'TITLES',
-    'TOILET', 'TOMATO', 'TONGUE', 'TOPICS', 'TOWARD', 'TRACKS', 'TRADED', 'TRAGIC', 'TRAVEL', 'TREATY', 'TROOPS',
-    'TROPHY', 'TRUCKS', 'TURNED', 'TWELVE', 'TWENTY', 'TYPING', 'UNABLE', 'UNFAIR', 'UNIQUE', 'UNITED', 'UNLESS',
-    'UNLIKE', 'UNLOCK', 'UNUSED', 'UPDATE', 'UPLOAD', 'URGENT', 'USEFUL', 'VALLEY', 'VALUES', 'VARIED', 'VARIES',
-    'VECTOR', 'VENDOR', 'VERIFY', 'VERSUS', 'VESSEL', 'VICTIM', 'VIDEOS', 'VIEWED', 'VIEWER', 'VIOLET', 'VIRGIN',
-    'VIRTUE', 'VISION', 'VISUAL', 'VOLUME', 'VOTING', 'WAITED', 'WALKED', 'WALKER', 'WALLET', 'WANTED', 'WARDEN',
-    'WARMTH', 'WARNED', 'WASHER', 'WASTED', 'WATERS', 'WEALTH', 'WEAPON', 'WEEKLY', 'WEIGHT', 'WHEELS', 'WHILST',
-    'WHISKY', 'WIDELY', 'WILSON', 'WINDOW', 'WINTER', 'WISDOM', 'WISHED', 'WITHIN', 'WIZARD', 'WOLVES', 'WONDER',
-    'WOODEN', 'WORKED', 'WORKER', 'WORTHY', 'WRITER', 'WRITES', 'YEARLY', 'YELLOW', 'YIELDS', 'YOUNGER'
-} | ADDITIONAL_SIX_LETTER_WORDS
-
-# Combined dictionary for easy lookup
-ALL_WORDS = THREE_LETTER_WORDS | FOUR_LETTER_WORDS | FIVE_LETTER_WORDS | SIX_LETTER_WORDS
-
-def get_words_by_length(length: int) -> set:
-    """Get all words of specified length (including additional words)"""
-    if length == 3:
-        return THREE_LETTER_WORDS
-    elif length == 4:
-        return FOUR_LETTER_WORDS  # This now includes ADDITIONAL_FOUR_LETTER_WORDS
-    elif length == 5:
-        return FIVE_LETTER_WORDS  # This now includes ADDITIONAL_FIVE_LETTER_WORDS  
-    elif length == 6:
-        return SIX_LETTER_WORDS   # This now includes ADDITIONAL_SIX_LETTER_WORDS
-    else:
-        return set()
-
-def is_valid_word(word: str, word_length: int = None) -> bool:
+
+    def __init__(self, packed: PackedDictionary, version: int):
+        self.packed = packed
+        self.version = version
+        self.source = packed.source
+        self.digest = packed.digest
+        self.loaded_at = time.time()
+        self._anagram_indexes: Dict[Lengths, AnagramIndex] = {}
+        self._prefix_indexes: Dict[Lengths, PrefixIndex] = {}
+        self._wildcard_indexes: Dict[int, WildcardIndex] = {}
+        self.warmed: Set[Tuple[Lengths, bool]] = set()  # (lengths, blank_tiles) of the rooms warmed for
+        _versions.setdefault(self.digest, self)
+
+    def words(self, length: int) -> AbstractSet[str]:
+        return self.packed.words(length)
+
+    def words_of(self, lengths: Lengths) -> List[str]:
+        """Words of one or several lengths, as one list"""
+        lengths = length_key(lengths)
+        if isinstance(lengths, int):
+            return list(self.words(lengths))
+        return [word for length in lengths for word in self.words(length)]
+
+    def is_valid_word(self, word: str, word_length: Lengths = None) -> bool:
+        word_upper = word.upper()
+        if isinstance(word_length, tuple):
+            # One probe into the length-partitioned artifact, whatever the length
+            return len(word_upper) in word_length and word_upper in self.packed
+        if word_length:
+            return word_upper in self.words(word_length)
+        return word_upper in self.packed
+
+    def anagram_index(self, length: Lengths) -> AnagramIndex:
+        """Signature index for words of the given length(s), built on first use"""
+        key = length_key(length)
+        index = self._anagram_indexes.get(key)
+        if index is None:
+            index = self._anagram_indexes[key] = AnagramIndex(self.words_of(key))
+        return index
+
+    def find_formable_words(self, letters: Iterable[str], word_length: Lengths) -> List[str]:
+        return self.anagram_index(word_length).formable(letters)
+
+    def prefix_index(self, length: Lengths) -> PrefixIndex:
+        """Prefix index for words of the given length(s), built on first use"""
+        key = length_key(length)
+        index = self._prefix_indexes.get(key)
+        if index is None:
+            index = self._prefix_indexes[key] = PrefixIndex(self.words_of(key))
+        return index
+
+    def is_viable_prefix(self, prefix: str, word_length: Lengths) -> bool:
+        return self.prefix_index(word_length).is_viable(prefix.upper())
+
+    def wildcard_index(self, length: int) -> WildcardIndex:
+        """Blank-tile index for words of the given length, built on first use"""
+        index = self._wildcard_indexes.get(length)
+        if index is None:
+            index = self._wildcard_indexes[length] = WildcardIndex(self.words(length), length)
+        return index
+
+    def warm(self, lengths: Lengths, blank_tiles: bool = False) -> 'DictionaryVersion':
+        """Build the indexes and registered caches a room playing `lengths` uses.
+
+        Only those lengths are built, so a worker holds indexes for the rooms it serves and
+        not for the whole dictionary. Blocks while building, so call it from a worker thread:
+        the server does before creating a room, and reload_dictionary does for the new version.
+        """
+        key = length_key(lengths)
+        self.prefix_index(key)
+        if blank_tiles:
+            for length in key if isinstance(key, tuple) else (key,):
+                self.wildcard_index(length)
+        for build in list(_warmers):
+            build(self, key)
+        self.warmed.add((key, blank_tiles))
+        return self
+
+    def __len__(self) -> int:
+        return len(self.packed)
+
+    def __repr__(self) -> str:
+        return f"<DictionaryVersion v{self.version} {self.source} words={len(self)}>"
+
+
+class DictionaryUnavailable(LookupError):
+    """Raised when a game needs a dictionary version that is not loaded in this process"""
+
+
+# Every live version by content digest, so a game's pinned version can be found again
+_versions: 'weakref.WeakValueDictionary[str, DictionaryVersion]' = weakref.WeakValueDictionary()
+# Versions rebuilt from a payload sent by another process (see dictionary_for_digest)
+_received_versions: 'OrderedDict[str, DictionaryVersion]' = OrderedDict()
+RECEIVED_VERSIONS_KEPT = 2
+
+_version_numbers = itertools.count(1)
+_current = DictionaryVersion(_load_packed_dictionary(), next(_version_numbers))
+_reload_lock = threading.Lock()
+
+def current_dictionary() -> DictionaryVersion:
+    """The latest dictionary version; new rooms should pin this"""
+    return _current
+
+def reload_dictionary() -> DictionaryVersion:
+    """Build a new version from the artifact (or source lists) and swap it in atomically.
+
+    This blocks while the new version is built and warmed for the room types the old one
+    served, so call it from a worker thread. Readers never see a half-built version: the
+    module-level reference is only replaced once the new one is complete.
+    """
+    global _current
+    with _reload_lock:
+        version = DictionaryVersion(_reload_packed_dictionary(), next(_version_numbers))
+        for lengths, blank_tiles in list(_current.warmed):
+            version.warm(lengths, blank_tiles)
+        _current = version
+        return _current
+
+def dictionary_for_digest(digest: str, payload: Optional[bytes] = None) -> DictionaryVersion:
+    """The loaded version with this content digest, rebuilt from `payload` if this process has none.
+
+    Raises DictionaryUnavailable when the version is not loaded here and no payload was given.
+    """
+    version = _current if _current.digest == digest else _versions.get(digest)
+    if version is not None:
+        return version
+    if payload is None:
+        raise DictionaryUnavailable(f"Dictionary {digest} is not loaded in this process")
+    packed = PackedDictionary(payload, source=f"payload:{digest[:12]}")
+    if packed.digest != digest:
+        raise DictionaryUnavailable(f"Payload for dictionary {digest} has digest {packed.digest}")
+    version = DictionaryVersion(packed, next(_version_numbers))
+    _received_versions[digest] = version
+    while len(_received_versions) > RECEIVED_VERSIONS_KEPT:
+        _received_versions.popitem(last=False)
+    return version
+
+def get_words_by_length(length: int) -> AbstractSet[str]:
+    """Get all words of specified length (read-only set view over the packed dictionary)"""
+    return _current.words(length)
+
+def is_valid_word(word: str, word_length: Lengths = None) -> bool:
     """Check if a word is valid, optionally checking specific length"""
-    word_upper = word.upper()
-    if word_length:
-        return word_upper in get_words_by_length(word_length)
-    return word_upper in ALL_WORDS
+    return _current.is_valid_word(word, word_length)
+
+def get_anagram_index(length: Lengths) -> AnagramIndex:
+    """Signature index for words of the given length(s) in the current dictionary version"""
+    return _current.anagram_index(length)
+
+def find_formable_words(letters: Iterable[str], word_length: Lengths) -> List[str]:
+    """Words of word_length (one length or a tuple of them) that can be formed from letters"""
+    return _current.find_formable_words(letters, word_length)
+
+def is_viable_prefix(prefix: str, word_length: Lengths) -> bool:
+    """Whether prefix can still be extended into a word of word_length (one length or a tuple)"""
+    return _current.is_viable_prefix(prefix, word_length)
+
+def get_wildcard_index(length: int) -> WildcardIndex:
+    """Blank-tile index for words of the given length in the current dictionary"""
+    return _current.wildcard_index(length)
 
 # Statistics
-print(f"Dictionary loaded: {len(ALL_WORDS)} total words")
-print(f"3-letter words: {len(THREE_LETTER_WORDS)}")
-print(f"4-letter words: {len(FOUR_LETTER_WORDS)}")
-print(f"5-letter words: {len(FIVE_LETTER_WORDS)}")
-print(f"6-letter words: {len(SIX_LETTER_WORDS)}")
\ No newline at end of file
+print(f"Dictionary loaded from {_current.source}: {len(_current)} total words")
+print(f"3-letter words: {len(get_words_by_length(3))}")
+print(f"4-letter words: {len(get_words_by_length(4))}")
+print(f"5-letter words: {len(get_words_by_length(5))}")
+print(f"6-letter words: {len(get_words_by_length(6))}")
@@ -0,0 +1,326 @@
+# Packed dictionary artifact
+# Compiles the word lists into a compact binary file (sorted, length-partitioned
+# fixed-width records) that workers mmap instead of rebuilding Python sets on import.
+#
+# Layout (little-endian):
+#   magic            8 bytes   b'WRDICT01'
+#   section count    u32
+#   sections         count * (u32 word length, u32 word count, u64 data offset)
+#   data             per section, `word count` ASCII records of `word length` bytes, sorted
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import time
+from collections.abc import Set
+from multiprocessing import resource_tracker, shared_memory
+from pathlib import Path
+from typing import AbstractSet, Callable, Dict, FrozenSet, Iterable, Iterator, Optional
+
+MAGIC = b'WRDICT01'
+WORD_LENGTHS = (3, 4, 5, 6)
+DEFAULT_ARTIFACT_PATH = Path(__file__).parent / 'dictionary.bin'
+
+_HEADER = struct.Struct('<8sI')
+_SECTION = struct.Struct('<IIQ')
+
+
+class ArtifactError(ValueError):
+    """Raised when a dictionary artifact is missing sections or corrupted"""
+
+
+def artifact_digest(buffer) -> str:
+    """Content hash of artifact bytes (or any buffer holding them)"""
+    return hashlib.blake2b(buffer, digest_size=16).hexdigest()
+
+
+def bucket_words(words: Iterable[str], stats: Optional[dict] = None) -> Dict[int, list]:
+    """Normalize words and bucket them by their actual length (3-6 letters only).
+
+    If `stats` is given it is filled with counts of seen, rejected and duplicate entries.
+    """
+    buckets = {length: set() for length in WORD_LENGTHS}
+    seen = rejected = 0
+    for word in words:
+        seen += 1
+        word = word.strip().upper()
+        if len(word) in buckets and word.isalpha() and word.isascii():
+            buckets[len(word)].add(word)
+        else:
+            rejected += 1
+    if stats is not None:
+        stats['entries'] = seen
+        stats['rejected'] = rejected
+        stats['duplicates'] = seen - rejected - sum(len(bucket) for bucket in buckets.values())
+    return {length: sorted(bucket) for length, bucket in buckets.items()}
+
+
+def iter_word_list(path: Path) -> Iterator[str]:
+    """Stream entries from a plain-text word list, one per line.
+
+    Blank lines and '#' comments are skipped; only the first token of a line is used,
+    so lists with definitions after the word ("AA rough lava") load as well.
+    """
+    with open(path, encoding='utf-8', errors='replace') as f:
+        for line in f:
+            entry = line.split(None, 1)
+            if entry and not entry[0].startswith('#'):
+                yield entry[0]
+
+
+def _peak_rss_kb() -> int:
+    try:
+        import resource
+    except ImportError:  # not available on Windows
+        return 0
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def ingest_word_list(path: Path) -> tuple:
+    """Load an external word list into length buckets, returning (words_by_length, report)"""
+    started = time.perf_counter()
+    rss_before = _peak_rss_kb()
+    report = {'source': str(path)}
+    words_by_length = bucket_words(iter_word_list(path), report)
+    report['words_by_length'] = {length: len(words) for length, words in words_by_length.items()}
+    report['seconds'] = round(time.perf_counter() - started, 3)
+    report['peak_rss_growth_kb'] = max(0, _peak_rss_kb() - rss_before)
+    report['packed_bytes'] = sum(length * len(words) for length, words in words_by_length.items())
+    return words_by_length, report
+
+
+def compile_words(words_by_length: Dict[int, list]) -> bytes:
+    """Pack sorted, length-bucketed word lists into artifact bytes"""
+    lengths = sorted(words_by_length)
+    offset = _HEADER.size + _SECTION.size * len(lengths)
+    header = [_HEADER.pack(MAGIC, len(lengths))]
+    data = []
+    for length in lengths:
+        words = words_by_length[length]
+        header.append(_SECTION.pack(length, len(words), offset))
+        chunk = ''.join(words).encode('ascii')
+        data.append(chunk)
+        offset += len(chunk)
+    return b''.join(header + data)
+
+
+def write_artifact(words_by_length: Dict[int, list], path: Path = DEFAULT_ARTIFACT_PATH) -> int:
+    """Write the artifact atomically so running workers never see a partial file"""
+    path = Path(path)
+    payload = compile_words(words_by_length)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    return len(payload)
+
+
+class PackedWordSet(Set):
+    """Read-only set view over one length section of a packed artifact.
+
+    Membership is a binary search over the mmapped records (a few microseconds,
+    against tens of nanoseconds for a frozenset) in exchange for sharing one copy of
+    the words between processes. Set operators return plain frozensets.
+    """
+
+    __slots__ = ('_buffer', '_length', '_count', '_offset')
+
+    def __init__(self, buffer, length: int, count: int, offset: int):
+        self._buffer = buffer
+        self._length = length
+        self._count = count
+        self._offset = offset
+
+    def _record(self, index: int) -> bytes:
+        start = self._offset + index * self._length
+        return self._buffer[start:start + self._length]
+
+    @classmethod
+    def _from_iterable(cls, iterable: Iterable[str]) -> FrozenSet[str]:
+        # Used by the Set mixins (|, &, -, ^) to build their result
+        return frozenset(iterable)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(self._count):
+            yield self._record(i).decode('ascii')
+
+    def __contains__(self, word) -> bool:
+        if not isinstance(word, str) or len(word) != self._length or not word.isascii():
+            return False
+        target = word.encode('ascii')
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            record = self._record(mid)
+            if record < target:
+                lo = mid + 1
+            elif record > target:
+                hi = mid
+            else:
+                return True
+        return False
+
+    def __repr__(self) -> str:
+        return f"<PackedWordSet length={self._length} words={self._count}>"
+
+
+class PackedDictionary:
+    """Dictionary backed by an artifact buffer (bytes, mmap or shared memory)"""
+
+    def __init__(self, buffer, source: Optional[str] = None):
+        self._buffer = buffer
+        self.source = source
+        self._digest: Optional[str] = None
+        self.sections: Dict[int, PackedWordSet] = {}
+
+        if len(buffer) < _HEADER.size:
+            raise ArtifactError("Dictionary artifact is truncated")
+        magic, count = _HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise ArtifactError(f"Unknown dictionary artifact format: {magic!r}")
+        for i in range(count):
+            length, word_count, offset = _SECTION.unpack_from(buffer, _HEADER.size + i * _SECTION.size)
+            if offset + length * word_count > len(buffer):
+                raise ArtifactError(f"Section for {length}-letter words runs past end of artifact")
+            self.sections[length] = PackedWordSet(buffer, length, word_count, offset)
+
+    def words(self, length: int) -> AbstractSet[str]:
+        return self.sections.get(length, frozenset())
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.words(len(word))
+
+    def __len__(self) -> int:
+        return sum(len(section) for section in self.sections.values())
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._buffer)
+
+    @property
+    def digest(self) -> str:
+        """Content hash of the artifact, the same in every process that loaded the same words"""
+        if self._digest is None:
+            self._digest = artifact_digest(self._buffer)
+        return self._digest
+
+    def payload(self) -> bytes:
+        """A copy of the artifact bytes, e.g. to rebuild this dictionary in another process"""
+        return bytes(self._buffer)
+
+
+def load_artifact(path: Path = DEFAULT_ARTIFACT_PATH) -> PackedDictionary:
+    """Memory-map an artifact file read-only; pages are shared through the OS page cache"""
+    path = Path(path)
+    with open(path, 'rb') as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return PackedDictionary(buffer, source=str(path))
+
+
+def _untrack(segment: shared_memory.SharedMemory):
+    # The resource tracker would unlink the segment when this process exits, pulling
+    # it out from under the other workers; its lifetime is managed explicitly instead.
+    try:
+        resource_tracker.unregister(segment._name, 'shared_memory')
+    except Exception:
+        pass
+
+
+def _open_shared_segment(name: str, build_payload: Callable[[], bytes]):
+    """(segment, created) for the named segment, or (None, False) while another process is creating it"""
+    try:
+        segment = shared_memory.SharedMemory(name=name)
+        created = False
+    except FileNotFoundError:
+        payload = build_payload()
+        try:
+            segment = shared_memory.SharedMemory(name=name, create=True, size=len(payload))
+        except FileExistsError:  # Another process created it first
+            return None, False
+        created = True
+        segment.buf[len(MAGIC):len(payload)] = payload[len(MAGIC):]
+        segment.buf[:len(MAGIC)] = payload[:len(MAGIC)]
+    except ValueError:  # Opened between the creator's shm_open and ftruncate, so still empty
+        return None, False
+    _untrack(segment)
+    return segment, created
+
+
+def attach_shared_dictionary(name: str, build_payload: Callable[[], bytes],
+                             timeout: float = 10.0) -> PackedDictionary:
+    """Attach read-only to a shared dictionary segment, creating it if this is the first process.
+
+    The creator copies the artifact into the segment and writes the magic bytes last,
+    so attaching processes wait until the segment has been sized and the header is
+    valid before reading.
+    """
+    deadline = time.monotonic() + timeout
+    segment, created = _open_shared_segment(name, build_payload)
+    while segment is None or bytes(segment.buf[:len(MAGIC)]) != MAGIC:
+        if time.monotonic() > deadline:
+            if segment is not None:
+                segment.close()
+            raise ArtifactError(f"Shared dictionary segment {name!r} was never initialised")
+        time.sleep(0.01)
+        if segment is None:
+            segment, created = _open_shared_segment(name, build_payload)
+
+    # Map the segment again read-only; the mapping outlives the SharedMemory handle
+    buffer = mmap.mmap(segment._fd, segment.size, access=mmap.ACCESS_READ)
+    segment.close()
+    source = f"shm:{name}" + (" (created)" if created else "")
+    return PackedDictionary(buffer, source=source)
+
+
+def unlink_shared_dictionary(name: str) -> bool:
+    """Remove a shared dictionary segment (e.g. on deploy); attached workers keep their mapping"""
+    try:
+        segment = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        return False
+    segment.close()
+    segment.unlink()
+    return True
+
+
+def build_artifact(path: Path = DEFAULT_ARTIFACT_PATH, word_list: Optional[Path] = None) -> int:
+    """Compile the source word lists (or an external plain-text word list) into an artifact file"""
+    if word_list is not None:
+        words_by_length, report = ingest_word_list(word_list)
+        print(f"Ingested {report['entries']} entries from {word_list} in {report['seconds']}s "
+              f"({report['rejected']} rejected, {report['duplicates']} duplicates, "
+              f"peak RSS +{report['peak_rss_growth_kb']} KB)")
+        return write_artifact(words_by_length, path)
+
+    import word_lists
+
+    return write_artifact(bucket_words(word_lists.ALL_WORDS), path)
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build or manage the packed dictionary artifact")
+    parser.add_argument('output', nargs='?', type=Path, default=DEFAULT_ARTIFACT_PATH)
+    parser.add_argument('--from', dest='word_list', type=Path, help="plain-text word list to ingest")
+    parser.add_argument('--unlink-shm', metavar='NAME', help="remove a shared dictionary segment and exit")
+    args = parser.parse_args()
+
+    if args.unlink_shm:
+        removed = unlink_shared_dictionary(args.unlink_shm)
+        print(f"Shared dictionary {args.unlink_shm!r} {'removed' if removed else 'not found'}")
+        sys.exit(0)
+
+    target = args.output
+    started = time.perf_counter()
+    size = build_artifact(target, args.word_list)
+    packed = load_artifact(target)
+    print(f"Wrote {target} ({size} bytes, {len(packed)} words) in {time.perf_counter() - started:.3f}s")
+    for length, section in sorted(packed.sections.items()):
+        print(f"{length}-letter words: {len(section)}")
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Dictionary benchmark and memory-footprint suite.
+
+Measures import time of the dictionary module, per-lookup latency for hits and
+misses at each word length, and the retained memory of each word structure. The
+plain `set` per length is the baseline every index is compared against.
+
+Usage: python dictionary_benchmark.py [--repeat N] [--json results.json]
+"""
+import argparse
+import itertools
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from dictionary import WORD_LENGTHS, AnagramIndex, PrefixIndex, WildcardIndex, current_dictionary
+from dictionary_artifact import PackedDictionary, build_artifact, bucket_words, compile_words
+
+BACKEND_DIR = Path(__file__).parent
+ALPHABET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+
+def time_per_call(func, args_list, repeat: int) -> float:
+    """Average seconds per call of func over args_list, best of `repeat` passes"""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for args in args_list:
+            func(*args)
+        best = min(best, (time.perf_counter() - started) / len(args_list))
+    return best
+
+
+def retained_bytes(build):
+    """Build a structure and return (structure, bytes still allocated for it afterwards)"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    structure = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return structure, after - before
+
+
+def bench_import(repeat: int) -> dict:
+    """Cold import time of the dictionary module in a fresh interpreter, per load mode"""
+    code = "import time; t = time.perf_counter(); import dictionary; print(time.perf_counter() - t)"
+
+    def run(env_overrides: dict) -> float:
+        env = {k: v for k, v in os.environ.items() if not k.startswith('WORD_DICTIONARY_')}
+        env.update(env_overrides)
+        samples = []
+        for _ in range(repeat):
+            out = subprocess.run([sys.executable, '-c', code], cwd=BACKEND_DIR, env=env,
+                                 capture_output=True, text=True, check=True).stdout
+            samples.append(float(out.strip().splitlines()[-1]))
+        return min(samples) * 1e3
+
+    with tempfile.TemporaryDirectory() as tmp:
+        artifact = Path(tmp) / 'dictionary.bin'
+        build_artifact(artifact)
+        missing = Path(tmp) / 'missing.bin'
+        return {
+            "source_lists_ms": run({'WORD_DICTIONARY_ARTIFACT': str(missing)}),
+            "artifact_mmap_ms": run({'WORD_DICTIONARY_ARTIFACT': str(artifact)}),
+        }
+
+
+def bench_lookups(repeat: int, samples: int = 20000) -> dict:
+    """Per-lookup latency of hits and misses for the set baseline and the packed artifact"""
+    dictionary = current_dictionary()
+    packed = PackedDictionary(compile_words(bucket_words(
+        word for length in WORD_LENGTHS for word in dictionary.words(length))))
+    rng = random.Random(7)
+    results = {}
+    for length in WORD_LENGTHS:
+        words = list(dictionary.words(length))
+        baseline = set(words)
+        hits = [(w,) for w in rng.choices(words, k=samples)]
+        misses = []
+        while len(misses) < samples:
+            candidate = ''.join(rng.choices(ALPHABET, k=length))
+            if candidate not in baseline:
+                misses.append((candidate,))
+        section = packed.words(length)
+        results[length] = {
+            "set_hit_ns": time_per_call(baseline.__contains__, hits, repeat) * 1e9,
+            "set_miss_ns": time_per_call(baseline.__contains__, misses, repeat) * 1e9,
+            "packed_hit_ns": time_per_call(section.__contains__, hits, repeat) * 1e9,
+            "packed_miss_ns": time_per_call(section.__contains__, misses, repeat) * 1e9,
+            "is_valid_word_hit_ns": time_per_call(dictionary.is_valid_word, [(w, length) for (w,) in hits], repeat) * 1e9,
+            "is_valid_word_miss_ns": time_per_call(dictionary.is_valid_word, [(w, length) for (w,) in misses], repeat) * 1e9,
+            "get_words_by_length_ns": time_per_call(dictionary.words, [(length,)] * samples, repeat) * 1e9,
+        }
+    return results
+
+
+def bench_prefix_lookups(repeat: int, samples: int = 20000) -> dict:
+    """Per-lookup cost of is_viable_prefix for viable and random prefixes at each length"""
+    dictionary = current_dictionary()
+    rng = random.Random(7)
+    results = {}
+    for length in WORD_LENGTHS:
+        index = dictionary.prefix_index(length)
+        words = list(dictionary.words(length))
+        viable = [(w[:rng.randint(1, length)],) for w in rng.choices(words, k=samples)]
+        dead = [(''.join(rng.choices(ALPHABET, k=rng.randint(2, length))),) for _ in range(samples)]
+        results[length] = {
+            "prefixes": len(index),
+            "viable_ns": time_per_call(index.is_viable, viable, repeat) * 1e9,
+            "random_ns": time_per_call(index.is_viable, dead, repeat) * 1e9,
+        }
+    return results
+
+
+def bench_formable(repeat: int, samples: int = 200) -> dict:
+    """Cost of finding every formable word on a full 26-tile table"""
+    dictionary = current_dictionary()
+    rng = random.Random(7)
+    tiles = list('AAAAAAAAABBCCDDDDEEEEEEEEEEEEFFGGGHHIIIIIIIIIJKLLLLMMNNNNNNOOOOOOOOPPQRRRRRRSSSSTTTTTTUUUUVVWWXYYZ')
+    tables = [(rng.sample(tiles, 26),) for _ in range(samples)]
+    results = {}
+    for length in WORD_LENGTHS:
+        words = list(dictionary.words(length))
+        index = dictionary.anagram_index(length)
+
+        def scan(letters, words=words):
+            # Baseline: check every word of the length against the table counts
+            available = {}
+            for letter in letters:
+                available[letter] = available.get(letter, 0) + 1
+            return [w for w in words if all(w.count(c) <= available.get(c, 0) for c in set(w))]
+
+        results[length] = {
+            "set_scan_us": time_per_call(scan, tables, max(1, repeat // 2)) * 1e6,
+            "anagram_index_us": time_per_call(index.formable, tables, repeat) * 1e6,
+        }
+    return results
+
+
+def bench_wildcards(repeat: int, samples: int = 5000) -> dict:
+    """Blank-tile lookups (letters plus two blanks, positional patterns) against trying every fill"""
+    dictionary = current_dictionary()
+    rng = random.Random(7)
+    results = {}
+    for length in WORD_LENGTHS:
+        words = list(dictionary.words(length))
+        started = time.perf_counter()
+        index = WildcardIndex(words, length)
+        build_ms = (time.perf_counter() - started) * 1e3
+        partials = []
+        patterns = []
+        for word in rng.choices(words, k=samples):
+            partials.append((rng.sample(word, length - 2), 2))
+            blanked = rng.sample(range(length), 2)
+            patterns.append((''.join('?' if i in blanked else c for i, c in enumerate(word)),))
+
+        def every_fill(letters, blanks):
+            # Baseline: 26^k substitutions, each checked against the anagram index
+            found = set()
+            for fill in itertools.product(ALPHABET, repeat=blanks):
+                found.update(dictionary.find_formable_words(list(letters) + list(fill), length))
+            return found
+
+        results[length] = {
+            "build_ms": build_ms,
+            "two_blanks_us": time_per_call(index.words_with_blanks, partials, repeat) * 1e6,
+            "pattern_us": time_per_call(index.match_pattern, patterns, repeat) * 1e6,
+            "every_fill_us": time_per_call(every_fill, partials[:20], 1) * 1e6,
+        }
+    return results
+
+
+def bench_memory() -> dict:
+    """Memory retained by each word structure, per length"""
+    dictionary = current_dictionary()
+    results = {}
+    for length in WORD_LENGTHS:
+        words = sorted(dictionary.words(length))
+        row = {"words": len(words)}
+        _, row["set_bytes"] = retained_bytes(lambda: {''.join(w) for w in words})
+        row["packed_bytes"] = len(words) * length
+        _, row["anagram_index_bytes"] = retained_bytes(lambda: AnagramIndex(words))
+        _, row["prefix_index_bytes"] = retained_bytes(lambda: PrefixIndex(words))
+        _, row["wildcard_index_bytes"] = retained_bytes(lambda: WildcardIndex(words, length))
+        try:
+            from letter_counts import LetterCountMatrix
+            row["letter_matrix_bytes"] = LetterCountMatrix(words, length).matrix.nbytes
+        except ImportError:  # NumPy not installed
+            pass
+        results[length] = row
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--json', type=Path, help="write results to this file instead of stdout")
+    args = parser.parse_args()
+
+    results = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "dictionary": repr(current_dictionary()),
+        "import": bench_import(args.repeat),
+        "lookups": bench_lookups(args.repeat),
+        "prefix_lookups": bench_prefix_lookups(args.repeat),
+        "formable": bench_formable(args.repeat),
+        "wildcards": bench_wildcards(args.repeat),
+        "memory": bench_memory(),
+    }
+
+    output = json.dumps(results, indent=2)
+    if args.json:
+        args.json.write_text(output + '\n')
+        print(f"Benchmark results written to {args.json}")
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+# Post-game analysis
+# Runs in worker processes (see server.analyze_missed_words), so everything here is
+# plain data in, plain data out.
+from collections import Counter
+from typing import Dict, List, Optional
+
+from dictionary import DictionaryVersion, Lengths, current_dictionary, dictionary_for_digest
+from tiles import SCRABBLE_SCORES
+
+DEFAULT_MISSED_WORDS = 10
+
+
+def missed_words(table_history: List[str], played_words: List[str], word_length: Lengths,
+                 limit: int = DEFAULT_MISSED_WORDS, dictionary: Optional[DictionaryVersion] = None) -> List[dict]:
+    """Best words that were formable at some point in the game but never played.
+
+    `table_history` holds the table letters after every change (one string per state).
+    Words are ranked by Scrabble score, then by how many table states offered them.
+    """
+    dictionary = dictionary or current_dictionary()
+    played = {word.upper() for word in played_words}
+    available_in: Dict[str, int] = {}
+    for table, states in Counter(table_history).items():
+        for word in set(dictionary.find_formable_words(table, word_length)):
+            if word not in played:
+                available_in[word] = available_in.get(word, 0) + states
+
+    ranked = sorted(
+        available_in.items(),
+        key=lambda item: (-sum(SCRABBLE_SCORES[c] for c in item[0]), -item[1], item[0])
+    )
+    return [
+        {"word": word, "score": sum(SCRABBLE_SCORES[c] for c in word), "table_states": states}
+        for word, states in ranked[:limit]
+    ]
+
+
+def missed_words_in_version(digest: str, payload: Optional[bytes], table_history: List[str],
+                            played_words: List[str], word_length: Lengths,
+                            limit: int = DEFAULT_MISSED_WORDS) -> List[dict]:
+    """missed_words against the dictionary version the game was pinned to, identified by digest.
+
+    A worker keeps the version it started with, so after a reload it may not have the game's
+    version; `payload` (the pinned artifact bytes) lets it rebuild and cache that version.
+    Without one, a missing version raises DictionaryUnavailable.
+    """
+    dictionary = dictionary_for_digest(digest, payload)
+    return missed_words(table_history, played_words, word_length, limit, dictionary)
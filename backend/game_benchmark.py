@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Game hot-path benchmark.
+
+Measures, at the 26-tile cap:
+- the per-tick cost of dealing a tile and broadcasting the table (time, memory
+  allocated and retained, JSON bytes), with the old per-tile dicts with uuid4
+  string ids as the baseline for the compact Tile;
+- the cost of validating and removing a submitted word, with the old full-table
+  scan and list rebuild as the baseline for GameState's id index;
+- the overhead of recording every mutation as an event, and of a snapshot.
+
+Usage: python game_benchmark.py [--repeat N] [--json results.json]
+"""
+import argparse
+import json
+import platform
+import random
+import time
+import tracemalloc
+import uuid
+from pathlib import Path
+
+from tiles import Tile, create_deck, serialize_tiles
+
+TABLE_CAP = 26  # Same cap as GameState.add_letter_to_table
+
+
+def legacy_tile(tile_id: int, letter: str) -> dict:
+    return {'letter': letter, 'id': str(uuid.uuid4()), 'timestamp': time.time()}
+
+
+def compact_tile(tile_id: int, letter: str) -> Tile:
+    return Tile(tile_id, letter, time.time())
+
+
+def legacy_serialize(table: list) -> list:
+    return table
+
+
+def tick(make_tile, serialize, table: list, tile_id: int, letter: str) -> str:
+    """One letter_generation_timer tick: replace the oldest tile, then build the new_letter message"""
+    table.pop(0)
+    table.append(make_tile(tile_id, letter))
+    return json.dumps({"type": "new_letter", "letter": letter, "letters": serialize(table)})
+
+
+def legacy_can_form_word(game, table: list, selected_letters: list, word: str) -> bool:
+    """Submission check as it was: scan the table, then list.remove per letter"""
+    if len(word) != game.word_length or not game.dictionary.is_valid_word(word, game.word_length):
+        return False
+    available_letters = [l['letter'] for l in table if l['id'] in selected_letters]
+    for letter in word:
+        if letter in available_letters:
+            available_letters.remove(letter)
+        else:
+            return False
+    return True
+
+
+def legacy_remove_letters(game, table: list, letter_ids: list) -> list:
+    """Tile removal as it was: rebuild the table with an `in` check against the id list"""
+    remaining = []
+    for l in table:
+        if l['id'] in letter_ids:
+            game.solver.remove(l['letter'])
+        else:
+            remaining.append(l)
+    game.table_history.append(''.join(l['letter'] for l in remaining))
+    return remaining
+
+
+def full_table(word_length: int, seed: int):
+    """A GameState with 26 tiles dealt, a formable word and the ids of its tiles (or None)"""
+    from server import GameState
+
+    game = GameState('BENCH', word_length, deck_seed=seed)
+    while len(game.tiles_by_id) < TABLE_CAP:
+        game.add_letter_to_table()
+    words = game.solver.words()
+    if not words:
+        return None
+    word = words[seed % len(words)]
+    ids = []
+    for letter in word:
+        ids.append(next(t.id for t in game.tiles_by_id.values() if t.letter == letter and t.id not in ids))
+    return game, word, ids
+
+
+def bench_submission(repeat: int, samples: int = 300) -> dict:
+    """Per-submission cost of validating and removing a word on a full table"""
+    results = {}
+    for word_length in (3, 6):
+        tables = [t for t in (full_table(word_length, seed) for seed in range(samples)) if t]
+        legacy = [
+            (game, [{'letter': t.letter, 'id': str(uuid.uuid4()), 'timestamp': t.timestamp}
+                    for t in game.tiles_by_id.values()], word, ids)
+            for game, word, ids in tables
+        ]
+        for game, table, word, ids in legacy:
+            by_id = {t.id: l['id'] for t, l in zip(game.tiles_by_id.values(), table)}
+            ids[:] = [by_id[i] for i in ids]
+
+        def timed(calls) -> float:
+            best = float('inf')
+            for _ in range(repeat):
+                started = time.perf_counter()
+                for call in calls:
+                    call()
+                best = min(best, (time.perf_counter() - started) / len(calls))
+            return best
+
+        row = {
+            "tables": len(tables),
+            "legacy_validate_us": timed([
+                lambda g=g, t=t, w=w, i=i: legacy_can_form_word(g, t, i, w) for g, t, w, i in legacy
+            ]) * 1e6,
+            "indexed_validate_us": timed([
+                lambda g=g, w=w, i=i: g.can_form_word(i, w) for g, w, i in tables
+            ]) * 1e6,
+        }
+
+        # Removal mutates the table, so each sample is timed once on its own copy
+        started = time.perf_counter()
+        for game, table, word, ids in legacy:
+            legacy_remove_letters(game, table, ids)
+        row["legacy_remove_us"] = (time.perf_counter() - started) / len(legacy) * 1e6
+        tables = [t for t in (full_table(word_length, seed) for seed in range(samples)) if t]
+        started = time.perf_counter()
+        for game, word, ids in tables:
+            game.remove_letters(ids)
+        row["indexed_remove_us"] = (time.perf_counter() - started) / len(tables) * 1e6
+        results[word_length] = row
+    return results
+
+
+def bench_events(repeat: int, games: int = 200) -> dict:
+    """Dealing through the event log against calling the reducer step directly"""
+    from server import SNAPSHOT_INTERVAL, GameState
+
+    def deal_all(recorded: bool) -> float:
+        rooms = [GameState('BENCH', 4, deck_seed=seed) for seed in range(games)]
+        started = time.perf_counter()
+        for game in rooms:
+            for _ in range(TABLE_CAP):
+                if recorded:
+                    game.add_letter_to_table()
+                else:
+                    game._letter_dealt({"deck_index": len(game.deck) - 1, "dealt_at": time.time()})
+        return (time.perf_counter() - started) / (games * TABLE_CAP)
+
+    game = GameState('BENCH', 4, deck_seed=0)
+    for _ in range(TABLE_CAP):
+        game.add_letter_to_table()
+    started = time.perf_counter()
+    for _ in range(1000):
+        game.snapshot()
+    snapshot = (time.perf_counter() - started) / 1000
+
+    return {
+        "direct_deal_us": min(deal_all(False) for _ in range(repeat)) * 1e6,
+        "recorded_deal_us": min(deal_all(True) for _ in range(repeat)) * 1e6,
+        "snapshot_us": snapshot * 1e6,
+        "snapshot_interval": SNAPSHOT_INTERVAL,
+    }
+
+
+def bench_tiles(repeat: int, ticks: int = 20000) -> dict:
+    """Per-tick time, allocation and message size for dict tiles against Tile at the table cap"""
+    letters = create_deck(random.Random(7))
+    results = {}
+    for name, make_tile, serialize in (("dict_uuid", legacy_tile, legacy_serialize),
+                                       ("tile_slots", compact_tile, serialize_tiles)):
+        table = [make_tile(i, letters[i]) for i in range(TABLE_CAP)]
+        best = float('inf')
+        for _ in range(repeat):
+            started = time.perf_counter()
+            for i in range(ticks):
+                tick(make_tile, serialize, table, TABLE_CAP + i, letters[i % len(letters)])
+            best = min(best, (time.perf_counter() - started) / ticks)
+
+        started = time.perf_counter()
+        for i in range(ticks):
+            make_tile(i, 'E')
+        deal = (time.perf_counter() - started) / ticks
+
+        tracemalloc.start()
+        for i in range(1000):
+            tick(make_tile, serialize, table, TABLE_CAP + i, letters[i % len(letters)])
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        message = tick(make_tile, serialize, table, TABLE_CAP + 1000, 'E')
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        tracemalloc.start()
+        retained = [make_tile(i, letters[i]) for i in range(TABLE_CAP)]
+        table_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del retained
+
+        results[name] = {
+            "tick_us": best * 1e6,
+            "new_tile_us": deal * 1e6,
+            "tick_peak_alloc_bytes": peak - before,
+            "table_bytes": table_bytes,
+            "message_bytes": len(message.encode()),
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--json', type=Path, help="write results to this file instead of stdout")
+    args = parser.parse_args()
+
+    results = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "tiles": bench_tiles(args.repeat),
+        "submission": bench_submission(args.repeat),
+        "events": bench_events(args.repeat),
+    }
+
+    output = json.dumps(results, indent=2)
+    if args.json:
+        args.json.write_text(output + '\n')
+        print(f"Benchmark results written to {args.json}")
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Full bot games at accelerated speed on a virtual clock.
+
+Creates rooms full of bots the same way as the /admin/load-test route and starts
+them through server.start_game, but the room timers and the bot scheduler run on
+a VirtualClock. Every sleep returns as soon as the rest of the simulation is
+idle, so hours of game time take seconds of wall time while the games see the
+same sequence of deals, moves and timeouts as in production. That requires the
+games to do no real I/O, so they are created with persist=False: nothing is written
+to the database and no missed-words analysis is sent to the worker pool.
+
+Usage: python game_simulation.py [--games 1000] [--bots 4] [--word-length 4] [--timer-minutes 2] [--seed 0]
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+
+import server
+from bots import BotProfile, BotScheduler
+from clock import VirtualClock
+
+
+async def simulate(games: int, bots_per_room: int, word_length: int, timer_minutes: int,
+                   seed: int = 0, profile: BotProfile = BotProfile()) -> dict:
+    """Play `games` bot rooms to the end on one virtual clock and summarise them"""
+    clock = VirtualClock()
+    scheduler = BotScheduler(server.games.get, server.submit_word, seed, clock)
+    rng = random.Random(seed)
+    rooms = []
+    for _ in range(games):
+        game_seed = rng.getrandbits(63)
+        room_code = server.generate_room_code(game_seed)
+        game = server.games[room_code] = server.GameState(room_code, word_length, timer_minutes,
+                                                          seed=game_seed, clock=clock, persist=False)
+        for _ in range(bots_per_room):
+            scheduler.add_bot(game, profile)
+        await server.start_game(room_code)
+        rooms.append(game)
+
+    started = time.perf_counter()
+    await clock.advance()  # Runs until every timer and bot has finished
+    wall_seconds = time.perf_counter() - started
+    # Real I/O would have run behind virtual time; the worker pool is only created for analysis
+    assert server.analysis_pool is None, "simulated games must not start missed-words analysis"
+
+    for game in rooms:
+        server.games.pop(game.room_code, None)
+    words = [len(game.words_played) for game in rooms]
+    return {
+        "games": games,
+        "ended": sum(game.game_ended for game in rooms),
+        "virtual_seconds": round(clock.time(), 1),
+        "wall_seconds": round(wall_seconds, 2),
+        "words_per_game": round(sum(words) / max(len(words), 1), 2),
+        "tiles_dealt_per_game": round(sum(game.deals for game in rooms) / max(len(rooms), 1), 2),
+        "bot_moves": scheduler.stats(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--games', type=int, default=1000)
+    parser.add_argument('--bots', type=int, default=4)
+    parser.add_argument('--word-length', type=int, default=4, choices=range(3, 7))
+    parser.add_argument('--timer-minutes', type=int, default=2, choices=(2, 4, 6))
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    result = asyncio.run(simulate(args.games, args.bots, args.word_length, args.timer_minutes, args.seed))
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == '__main__':
+    main()
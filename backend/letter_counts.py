@@ -0,0 +1,86 @@
+# Vectorized letter-count matrices for bulk formability checks
+# Each word length gets an N x 26 uint8 matrix of per-letter counts, so "which
+# words fit inside these table counts" is a single broadcast comparison that can
+# be evaluated for a whole batch of rooms at once.
+import weakref
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from dictionary import BLANK, DictionaryVersion, current_dictionary
+
+ALPHABET_SIZE = 26
+# Rooms are compared in chunks so the (rooms x words x 26) intermediate stays bounded
+DEFAULT_CHUNK_ROOMS = 256
+
+
+def letter_counts(letters: Iterable[str]) -> np.ndarray:
+    """Count vector (26,) uint8 for a sequence of letters; blank tiles are not counted"""
+    letters = ''.join(letters).upper().replace(BLANK, '')
+    codes = np.frombuffer(letters.encode('ascii'), dtype=np.uint8) - ord('A')
+    return np.bincount(codes, minlength=ALPHABET_SIZE).astype(np.uint8)
+
+
+def table_counts(tables: Sequence[Iterable[str]]) -> np.ndarray:
+    """Stack the letter counts of many tables (one row per room) into an (R, 26) array"""
+    batch = np.zeros((len(tables), ALPHABET_SIZE), dtype=np.uint8)
+    for row, letters in enumerate(tables):
+        batch[row] = letter_counts(letters)
+    return batch
+
+
+class LetterCountMatrix:
+    """Letter counts for every dictionary word of one length"""
+
+    def __init__(self, words: Iterable[str], length: int):
+        self.length = length
+        self.words: List[str] = sorted(words)
+        codes = np.frombuffer(''.join(self.words).encode('ascii'), dtype=np.uint8)
+        codes = codes.reshape(len(self.words), length) - ord('A')
+        self.matrix = np.zeros((len(self.words), ALPHABET_SIZE), dtype=np.uint8)
+        rows = np.arange(len(self.words))
+        for col in range(length):
+            np.add.at(self.matrix, (rows, codes[:, col]), 1)
+
+    def formable_mask(self, counts: np.ndarray, chunk_rooms: int = DEFAULT_CHUNK_ROOMS) -> np.ndarray:
+        """Boolean mask of formable words.
+
+        `counts` is either a single (26,) table or an (R, 26) batch; the result is
+        (N,) or (R, N) respectively.
+        """
+        counts = np.asarray(counts, dtype=np.uint8)
+        if counts.ndim == 1:
+            return np.all(self.matrix <= counts, axis=1)
+
+        mask = np.empty((counts.shape[0], len(self.words)), dtype=bool)
+        for start in range(0, counts.shape[0], chunk_rooms):
+            chunk = counts[start:start + chunk_rooms]
+            mask[start:start + chunk_rooms] = np.all(self.matrix[None, :, :] <= chunk[:, None, :], axis=2)
+        return mask
+
+    def count_formable(self, counts: np.ndarray) -> np.ndarray:
+        """Number of formable words per table (scalar array for a single table)"""
+        return self.formable_mask(counts).sum(axis=-1)
+
+    def formable_words(self, counts: np.ndarray) -> List[str]:
+        """Words formable from a single (26,) table"""
+        return [self.words[i] for i in np.flatnonzero(self.formable_mask(counts))]
+
+
+# Matrices are cached per dictionary version and dropped when that version is released
+_matrices: 'weakref.WeakKeyDictionary[DictionaryVersion, Dict[int, LetterCountMatrix]]' = weakref.WeakKeyDictionary()
+
+def get_letter_matrix(length: int, dictionary: Optional[DictionaryVersion] = None) -> LetterCountMatrix:
+    """Letter-count matrix for words of the given length, built on first use"""
+    if dictionary is None:
+        dictionary = current_dictionary()
+    by_length = _matrices.setdefault(dictionary, {})
+    matrix = by_length.get(length)
+    if matrix is None:
+        matrix = by_length[length] = LetterCountMatrix(dictionary.words(length), length)
+    return matrix
+
+def batch_formable_counts(tables: Sequence[Iterable[str]], word_length: int,
+                          dictionary: Optional[DictionaryVersion] = None) -> np.ndarray:
+    """Formable-word count for every table in a batch of rooms, in one vectorized call"""
+    return get_letter_matrix(word_length, dictionary).count_formable(table_counts(tables))
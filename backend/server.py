@@ -1,21 +1,37 @@
-from fastapi import FastAPI, APIRouter, WebSocket, WebSocketDisconnect, HTTPException, Depends, Cookie, Response
+from fastapi import FastAPI, APIRouter, WebSocket, WebSocketDisconnect, HTTPException, Depends, Cookie, Header, Response
 from fastapi.responses import HTMLResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne
 import os
 import logging
 import json
 import asyncio
 import random
-import time
+import secrets
 from pathlib import Path
 from pydantic import BaseModel, Field
 from typing import List, Dict, Set, Optional
 import uuid
 import requests
+import multiprocessing
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone, timedelta
-from dictionary import is_valid_word, get_words_by_length, ALL_WORDS
+from dictionary import (
+    is_valid_word, get_words_by_length, current_dictionary, reload_dictionary, ARTIFACT_PATH, WORD_LENGTHS,
+    DictionaryUnavailable, dictionary_for_digest
+)
+from table_solver import TableSolver
+from clock import SYSTEM_CLOCK, Clock
+from bots import BotProfile, BotScheduler
+from tiles import (
+    BLANK_TILE, BLANK_TILE_COUNT, MIXED_LENGTH_BONUS, SCRABBLE_SCORES, Tile, create_deck, draw_ranked_deck_seed,
+    parse_tile_ids, serialize_tiles
+)
+from word_scores import current_rarity, get_score_table, update_rarity
+from game_analysis import missed_words_in_version
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
@@ -27,6 +43,22 @@ db = client.word_rush_db
 users_collection = db.users
 sessions_collection = db.sessions
 game_history_collection = db.game_history
+word_plays_collection = db.word_plays  # {"word": str, "plays": int}, aggregated at game end
+game_records_collection = db.game_records  # One document per finished game, enough to replay it
+
+# Dictionary hot reload
+ADMIN_TOKEN = os.environ.get('ADMIN_TOKEN')  # Admin routes are disabled when unset
+DICTIONARY_WATCH_INTERVAL = float(os.environ.get('DICTIONARY_WATCH_INTERVAL', '10'))  # 0 disables the watcher
+
+# Post-game analysis
+ANALYSIS_WORKERS = int(os.environ.get('ANALYSIS_WORKERS', '2'))
+MISSED_WORDS_CACHE_SIZE = int(os.environ.get('MISSED_WORDS_CACHE_SIZE', '10000'))
+
+# Word rarity bonus
+RARITY_REFRESH_INTERVAL = float(os.environ.get('RARITY_REFRESH_INTERVAL', '600'))  # 0 disables the refresh
+
+# Game event log
+SNAPSHOT_INTERVAL = int(os.environ.get('GAME_SNAPSHOT_INTERVAL', '50'))  # Snapshot a room every N events
 
 # Authentication Models
 class User(BaseModel):
@@ -53,11 +85,15 @@ class GameHistoryEntry(BaseModel):
     final_score: int
     placement: int  # 1st, 2nd, 3rd, etc.
     word_length: int
+    mixed_lengths: bool = False  # Room accepted every length from 3 to 6
     timer_minutes: int
     opponent_count: int
     elo_change: int
     new_elo_rating: int
     played_at: datetime
+    config: Optional[dict] = None  # GameState.config(), including the game's seed
+    deals: Optional[int] = None  # Tiles dealt by the end of the game
+    word_log: List[dict] = []  # Accepted words; with config and deals they replay the game
 
 # Create the main app
 app = FastAPI()
@@ -224,103 +260,426 @@ async def get_leaderboard(limit: int = 50):
     
     return leaderboard
 
-# Scrabble tile distribution
-SCRABBLE_TILES = {
-    'A': 9, 'B': 2, 'C': 2, 'D': 4, 'E': 12, 'F': 2, 'G': 3, 'H': 2,
-    'I': 9, 'J': 1, 'K': 1, 'L': 4, 'M': 2, 'N': 6, 'O': 8, 'P': 2,
-    'Q': 1, 'R': 6, 'S': 4, 'T': 6, 'U': 4, 'V': 2, 'W': 2, 'X': 1, 'Y': 2, 'Z': 1
-}
-
-# Scrabble tile scores
-SCRABBLE_SCORES = {
-    'A': 1, 'E': 1, 'I': 1, 'O': 1, 'U': 1, 'L': 1, 'N': 1, 'S': 1, 'T': 1, 'R': 1,
-    'D': 2, 'G': 2,
-    'B': 3, 'C': 3, 'M': 3, 'P': 3,
-    'F': 4, 'H': 4, 'V': 4, 'W': 4, 'Y': 4,
-    'K': 5,
-    'J': 8, 'X': 8,
-    'Q': 10, 'Z': 10
-}
-
 # Game state storage
 games: Dict[str, dict] = {}
 connections: Dict[str, List[WebSocket]] = {}
 
+def load_trigram_model(dictionary):
+    """Plausibility model for a dictionary version; imports NumPy on first use"""
+    from ngram_model import get_trigram_model
+    return get_trigram_model(dictionary)
+
 class GameState:
-    def __init__(self, room_code: str, word_length: int = 3, timer_minutes: int = 4, creator_user: Optional[User] = None):
+    """One room's game. Every mutation is an event appended to `events` and applied by `apply`.
+
+    Events are (kind, data) tuples. A plain-data snapshot is taken every
+    SNAPSHOT_INTERVAL events, so a room can be rebuilt with `from_snapshot` from the
+    latest snapshot plus the events after it. Only those are kept, so a long-running
+    room holds at most one snapshot and SNAPSHOT_INTERVAL events.
+
+    All randomness comes from the room's own generator, seeded with `seed`, so the
+    seed plus `word_log` also determine the game (see `replay`).
+    """
+
+    def __init__(self, room_code: str, word_length: int = 3, timer_minutes: int = 4, creator_user: Optional[User] = None,
+                 plausibility_threshold: Optional[float] = None, dealer_lookahead: int = 0,
+                 deck_seed: Optional[int] = None, blank_tiles: bool = False, mixed_lengths: bool = False,
+                 seed: Optional[int] = None, dictionary_digest: Optional[str] = None,
+                 clock: Optional[Clock] = None, persist: bool = True):
         self.room_code = room_code
-        self.word_length = word_length  # Required word length for this game
+        self.clock = clock or SYSTEM_CLOCK  # All game timing goes through this (VirtualClock in simulations)
+        self.persist = persist  # False for simulated games: the end of the game writes and analyzes nothing
+        self.seed = seed if seed is not None else new_game_seed()  # Recorded in game_history for replay
+        self.rng = random.Random(self.seed)  # The only source of randomness for this game
+        self.mixed_lengths = mixed_lengths  # Accept every length from 3 to 6, longer words score a bonus
+        self.word_lengths = WORD_LENGTHS if mixed_lengths else (word_length,)  # Accepted word lengths
+        self.word_length = self.word_lengths[0]  # Required (mixed rooms: shortest accepted) word length
+        self.plausibility_threshold = plausibility_threshold  # Accept unknown words scoring above this (None = dictionary only)
+        self.dealer_lookahead = dealer_lookahead  # Deal the most useful of the next N tiles (0 or 1 = deal in deck order)
         self.timer_minutes = timer_minutes  # Game timer in minutes (2, 4, or 6)
         self.creator_user = creator_user  # User who created the room
         self.game_start_time = None  # When the game actually started
         self.game_id = str(uuid.uuid4())  # Unique game ID for history tracking
+        # Dictionary version pinned for the whole game; a digest (from config()) must name a loaded version
+        self.dictionary = current_dictionary() if dictionary_digest is None else dictionary_for_digest(dictionary_digest)
+        self.score_table = get_score_table(self.dictionary)  # Precomputed base score of every word
         self.players = {}  # {websocket_id: {"name": str, "score": int, "user": Optional[User]}}
-        self.letters_on_table = []  # List of available letters
+        self.tiles_by_id: Dict[int, Tile] = {}  # Tiles available on the table, in deal order
+        self.letter_counts: Counter = Counter()  # How many of each letter are on the table
+        self.next_tile_id = 1  # Tile ids are small integers, unique within the room
+        self.deals = 0  # Tiles dealt so far
+        self.word_log: List[dict] = []  # Accepted words with the deal count they followed, for replay
+        self.table_history = []  # Table letters after every deal or accepted word, for post-game analysis
+        self.words_played = []  # Accepted words in order
+        self.solver = TableSolver(self.dictionary, self.word_lengths)  # Words currently formable from the table
+        self.deck_seed = deck_seed  # Seed of a calibrated deck (ranked rooms), None = fresh shuffle
+        self.blank_tiles = blank_tiles  # Deck includes blank tiles that stand for any letter and score 0
         self.deck = self._create_deck()
         self.game_started = False
         self.game_ended = False
         self.last_letter_time = None
         self.last_word_time = None
         self.timer_task = None
+        self.events: List[tuple] = []  # (kind, data) for every mutation since the latest snapshot, in order
+        self.event_offset = 0  # Events before `events`, all covered by the latest snapshot
+        self.latest_snapshot: Optional[dict] = None  # Taken every SNAPSHOT_INTERVAL events
 
     def _create_deck(self) -> List[str]:
-        deck = []
-        for letter, count in SCRABBLE_TILES.items():
-            deck.extend([letter] * count)
-        random.shuffle(deck)
-        return deck
+        blanks = BLANK_TILE_COUNT if self.blank_tiles else 0
+        if self.deck_seed is not None:
+            return create_deck(random.Random(self.deck_seed), blanks)  # Pre-vetted, reproducible deck
+        return create_deck(self.rng, blanks)
+
+    # Commands: decide what happens, then record it as an event
+
+    def join(self, player_id: str, name: str, user: Optional[User] = None, is_bot: bool = False):
+        self.record('player_joined', player_id=player_id, name=name, user=user, is_bot=is_bot)
+
+    def leave(self, player_id: str):
+        if player_id in self.players:
+            self.record('player_left', player_id=player_id)
+
+    def start(self):
+        self.record('game_started', started_at=self.clock.time())
 
     def add_letter_to_table(self):
-        if self.deck and len(self.letters_on_table) < 26:
-            letter = self.deck.pop()
-            self.letters_on_table.append({
-                'letter': letter,
-                'id': str(uuid.uuid4()),
-                'timestamp': time.time()
-            })
-            self.last_letter_time = time.time()
+        if self.deck and len(self.tiles_by_id) < 26:
+            deck_index = self._choose_deck_index()
+            letter = self.deck[deck_index]
+            self.record('letter_dealt', deck_index=deck_index, dealt_at=self.clock.time())
             return letter
         return None
 
-    def can_form_word(self, selected_letters: List[str], word: str) -> bool:
-        if len(word) != self.word_length:  # Must be exactly the required length
-            return False
-        if not is_valid_word(word, self.word_length):  # Use comprehensive dictionary
+    def accept_word(self, player_id: str, word: str, blank_letters: List[str], score: int, letter_ids: List[int]):
+        self.record('word_accepted', player_id=player_id, word=word, blank_letters=blank_letters,
+                    score=score, letter_ids=letter_ids, accepted_at=self.clock.time())
+
+    def end(self):
+        self.record('game_ended', ended_at=self.clock.time())
+
+    # Event log and reducer
+
+    def record(self, kind: str, **data):
+        event = (kind, data)
+        self.apply(event)
+        self.events.append(event)
+        if self.event_count % SNAPSHOT_INTERVAL == 0:
+            # The snapshot covers every event so far, so only later events need keeping
+            self.latest_snapshot = self.snapshot()
+            self.event_offset = self.event_count
+            self.events = []
+
+    @property
+    def event_count(self) -> int:
+        return self.event_offset + len(self.events)
+
+    def apply(self, event: tuple):
+        """The single place room state changes"""
+        kind, data = event
+        self._REDUCERS[kind](self, data)
+
+    def _player_joined(self, data: dict):
+        user = data["user"]
+        player = {
+            "name": data["name"],
+            "score": 0,
+            "user": user,  # Store user object for ELO tracking
+            "elo_rating": user.elo_rating if user else None
+        }
+        if data["is_bot"]:
+            player["is_bot"] = True
+        self.players[data["player_id"]] = player
+
+    def _player_left(self, data: dict):
+        self.players.pop(data["player_id"], None)
+
+    def _game_started(self, data: dict):
+        self.game_started = True
+        self.game_start_time = data["started_at"]  # Record when game actually started
+
+    def _letter_dealt(self, data: dict):
+        letter = self.deck.pop(data["deck_index"])
+        self.solver.add(letter)
+        self.tiles_by_id[self.next_tile_id] = Tile(self.next_tile_id, letter, data["dealt_at"])
+        self.letter_counts[letter] += 1
+        self.next_tile_id += 1
+        self.deals += 1
+        self.record_table_state()
+        self.last_letter_time = data["dealt_at"]
+
+    def _word_accepted(self, data: dict):
+        self.players[data["player_id"]]["score"] += data["score"]
+        self.words_played.append(data["word"])
+        self.word_log.append({"deals": self.deals, "player_id": data["player_id"], "word": data["word"],
+                              "blank_letters": list(data["blank_letters"]), "letter_ids": list(data["letter_ids"]),
+                              "score": data["score"]})
+        self.remove_letters(data["letter_ids"])
+        self.last_word_time = data["accepted_at"]
+
+    def _game_ended(self, data: dict):
+        self.game_ended = True
+
+    _REDUCERS = {
+        'player_joined': _player_joined,
+        'player_left': _player_left,
+        'game_started': _game_started,
+        'letter_dealt': _letter_dealt,
+        'word_accepted': _word_accepted,
+        'game_ended': _game_ended,
+    }
+
+    def config(self) -> dict:
+        """Constructor options of this room, as plain data"""
+        return {
+            "word_length": self.word_length,
+            "timer_minutes": self.timer_minutes,
+            "plausibility_threshold": self.plausibility_threshold,
+            "dealer_lookahead": self.dealer_lookahead,
+            "deck_seed": self.deck_seed,
+            "blank_tiles": self.blank_tiles,
+            "mixed_lengths": self.mixed_lengths,
+            "seed": self.seed,
+            "dictionary_digest": self.dictionary.digest,
+        }
+
+    def snapshot(self) -> dict:
+        """Full room state as plain data (JSON- and pickle-friendly)"""
+        def plain(user: Optional[User]):
+            return user.model_dump(mode='json') if user else None
+
+        return {
+            "event_count": self.event_count,
+            "room_code": self.room_code,
+            "game_id": self.game_id,
+            "dictionary_version": self.dictionary.version,
+            "config": self.config(),
+            "creator_user": plain(self.creator_user),
+            "players": {player_id: {**player, "user": plain(player["user"])} for player_id, player in self.players.items()},
+            "deck": list(self.deck),
+            "tiles": [(tile.id, tile.letter, tile.timestamp) for tile in self.tiles_by_id.values()],
+            "next_tile_id": self.next_tile_id,
+            "deals": self.deals,
+            "word_log": [dict(entry) for entry in self.word_log],
+            "table_history": list(self.table_history),
+            "words_played": list(self.words_played),
+            "game_started": self.game_started,
+            "game_ended": self.game_ended,
+            "game_start_time": self.game_start_time,
+            "last_letter_time": self.last_letter_time,
+            "last_word_time": self.last_word_time,
+        }
+
+    @classmethod
+    def from_snapshot(cls, snapshot: dict, events: List[tuple] = (), clock: Optional[Clock] = None) -> 'GameState':
+        """Rebuild a room from a snapshot and the events recorded after it.
+
+        The rebuilt room uses the dictionary version recorded in the snapshot's config, and
+        raises DictionaryUnavailable if that version is not loaded in this process.
+        """
+        def user(data: Optional[dict]) -> Optional[User]:
+            return User(**data) if data else None
+
+        game = cls(snapshot["room_code"], creator_user=user(snapshot["creator_user"]), clock=clock, **snapshot["config"])
+        game.game_id = snapshot["game_id"]
+        game.event_offset = snapshot["event_count"]
+        game.latest_snapshot = snapshot
+        game.players = {player_id: {**player, "user": user(player["user"])}
+                        for player_id, player in snapshot["players"].items()}
+        game.deck = list(snapshot["deck"])
+        for tile_id, letter, timestamp in snapshot["tiles"]:
+            game.tiles_by_id[tile_id] = Tile(tile_id, letter, timestamp)
+            game.letter_counts[letter] += 1
+            game.solver.add(letter)
+        game.next_tile_id = snapshot["next_tile_id"]
+        game.deals = snapshot["deals"]
+        game.word_log = [dict(entry) for entry in snapshot["word_log"]]
+        game.table_history = list(snapshot["table_history"])
+        game.words_played = list(snapshot["words_played"])
+        for field in ("game_started", "game_ended", "game_start_time", "last_letter_time", "last_word_time"):
+            setattr(game, field, snapshot[field])
+        for event in events:
+            game.apply(event)
+            game.events.append(event)
+        return game
+
+    @classmethod
+    def replay(cls, room_code: str, config: dict, word_log: List[dict], deals: Optional[int] = None,
+               clock: Optional[Clock] = None) -> 'GameState':
+        """Recompute a game from its config (which holds the seed) and accepted-word log.
+
+        Tiles are dealt until each word's recorded deal count and then the word is
+        applied with its recorded score. `deals` is the total dealt by the end of the game.
+        Players are seated under their ids, and tile timestamps are those of the replay.
+        Dealing and word acceptance depend on the dictionary, so the replay uses the version
+        named in the config and raises DictionaryUnavailable if it is not loaded here.
+        """
+        game = cls(room_code, clock=clock, **config)
+        game.start()
+
+        def deal_until(count: int):
+            while game.deals < count and game.add_letter_to_table():
+                pass
+
+        for entry in word_log:
+            deal_until(entry["deals"])
+            if entry["player_id"] not in game.players:
+                game.join(entry["player_id"], entry["player_id"])
+            game.accept_word(entry["player_id"], entry["word"], entry["blank_letters"], entry["score"],
+                             entry["letter_ids"])
+        if deals is not None:
+            deal_until(deals)
+        return game
+
+    def restore_point(self) -> tuple:
+        """Latest snapshot (taken now if there is none yet) and the events recorded since"""
+        snapshot = self.latest_snapshot or self.snapshot()
+        return snapshot, self.events[snapshot["event_count"] - self.event_offset:]
+
+    @property
+    def letters_on_table(self) -> List[Tile]:
+        return list(self.tiles_by_id.values())
+
+    def _choose_deck_index(self) -> int:
+        """Index of the next tile to deal; with a lookahead, the one that opens up the most words"""
+        if self.dealer_lookahead <= 1 or len(self.deck) <= 1:
+            return len(self.deck) - 1
+        window_start = max(0, len(self.deck) - self.dealer_lookahead)
+        # Scan from the top of the deck so ties keep the normal dealing order
+        return max(range(len(self.deck) - 1, window_start - 1, -1),
+                   key=lambda i: self.solver.gain_if_added(self.deck[i]))
+
+    def can_form_word(self, selected_letters: List[int], word: str) -> bool:
+        return self.resolve_word(selected_letters, word) is not None
+
+    def resolve_word(self, selected_letters: List[int], word: str) -> Optional[tuple]:
+        """The word the selected tiles spell and the letters played by blanks, or None if invalid.
+
+        A '?' in the submitted word leaves the letter to the server, which picks the
+        highest-scoring dictionary word the selected tiles can spell.
+        """
+        word = word.upper()
+        if len(word) not in self.word_lengths:  # Must be one of the accepted lengths
+            return None
+        if BLANK_TILE in word and not self.blank_tiles:
+            return None
+
+        tiles = self.tiles_by_id
+        available_letters = [tiles[tile_id].letter for tile_id in set(selected_letters) if tile_id in tiles]
+
+        if BLANK_TILE not in word:
+            # Common case: one candidate, matched letter by letter against the k selected tiles
+            blank_letters = []
+            for letter in word:
+                if letter in available_letters:
+                    available_letters.remove(letter)
+                else:
+                    blank_letters.append(letter)
+            if len(blank_letters) > available_letters.count(BLANK_TILE) or not self.is_acceptable_word(word):
+                return None
+            return word, blank_letters
+
+        blanks = available_letters.count(BLANK_TILE)
+        letters = Counter(l for l in available_letters if l != BLANK_TILE)
+        real_letters = list(letters.elements())
+        if len(word) - len(real_letters) > blanks:  # The selected tiles cannot fill the word
+            return None
+        index = self.dictionary.wildcard_index(len(word))
+        candidates = [
+            w for w in index.words_with_blanks(real_letters, len(word) - len(real_letters))
+            if all(p == BLANK_TILE or p == c for p, c in zip(word, w))
+        ]
+        candidates.sort(key=lambda w: (self.calculate_word_score(w), w), reverse=True)
+
+        for candidate in candidates:
+            if not self.is_acceptable_word(candidate):
+                continue
+            missing = Counter(candidate) - letters
+            if sum(missing.values()) <= blanks:
+                return candidate, list(missing.elements())
+        return None
+
+    def is_acceptable_word(self, word: str) -> bool:
+        lengths = self.word_lengths if self.mixed_lengths else self.word_length
+        if self.dictionary.is_valid_word(word, lengths):  # Use this room's dictionary version
+            return True
+        if self.plausibility_threshold is None or len(word) not in self.word_lengths:
             return False
-        
-        word_letters = list(word.upper())
-        available_letters = [l['letter'] for l in self.letters_on_table if l['id'] in selected_letters]
-        
-        for letter in word_letters:
-            if letter in available_letters:
-                available_letters.remove(letter)
-            else:
-                return False
-        return True
+        # Opt-in fallback; NumPy is only imported once a room actually uses it
+        return load_trigram_model(self.dictionary).is_plausible(word.upper(), self.plausibility_threshold)
+
+    def remove_letters(self, letter_ids: List[int]):
+        for tile_id in set(letter_ids):
+            tile = self.tiles_by_id.pop(tile_id, None)
+            if tile is not None:
+                self.solver.remove(tile.letter)
+                self.letter_counts[tile.letter] -= 1
+        self.record_table_state()
+
+    def table_signature(self) -> str:
+        """Table letters in sorted order, built from the letter counts"""
+        return ''.join(letter * count for letter, count in sorted(self.letter_counts.items()))
 
-    def remove_letters(self, letter_ids: List[str]):
-        self.letters_on_table = [l for l in self.letters_on_table if l['id'] not in letter_ids]
-        self.last_word_time = time.time()
+    def record_table_state(self):
+        self.table_history.append(self.table_signature())
 
     def get_time_remaining(self) -> int:
         """Get remaining time in seconds, returns 0 if game not started"""
-        if not self.game_started or not self.game_start_time:
+        if not self.game_started or self.game_start_time is None:
             return self.timer_minutes * 60
         
-        elapsed_seconds = time.time() - self.game_start_time
+        elapsed_seconds = self.clock.time() - self.game_start_time
         total_seconds = self.timer_minutes * 60
         remaining_seconds = max(0, total_seconds - elapsed_seconds)
         return int(remaining_seconds)
 
-    def calculate_word_score(self, word: str) -> int:
-        return sum(SCRABBLE_SCORES[letter.upper()] for letter in word)
+    def calculate_word_score(self, word: str, blank_letters: List[str] = ()) -> int:
+        """Scrabble score plus rarity bonus; letters played by blank tiles are worth 0"""
+        score = self.score_table.score(word) + current_rarity().bonus(word)
+        if blank_letters:
+            score -= sum(SCRABBLE_SCORES[letter.upper()] for letter in blank_letters)
+        if self.mixed_lengths:
+            score += MIXED_LENGTH_BONUS[len(word)]
+        return score
+
+    def get_hint(self) -> Optional[dict]:
+        """Highest-scoring formable word and the tiles that spell it, or None if the table is dead"""
+        key = (self.dictionary.version, current_rarity().generation, self.word_lengths, self.table_signature())
+
+        def best_word():
+            words = self.solver.words()
+            if not words:
+                return None
+            word = max(words, key=lambda w: (self.calculate_word_score(w), w))
+            return word, self.calculate_word_score(word)
+
+        best = hint_cache.get_or_compute(key, best_word)
+        if best is None:
+            return None
+        word, score = best
+        letter_ids = []
+        used = set()
+        for letter in word:
+            tile = next(t for t in self.tiles_by_id.values() if t.letter == letter and t.id not in used)
+            used.add(tile.id)
+            letter_ids.append(str(tile.id))  # Wire format, as in Tile.to_json
+        return {"word": word, "score": score, "letter_ids": letter_ids}
     
     async def end_game_and_update_stats(self):
         """End game and update player statistics and ELO ratings"""
         if self.game_ended:
             return
             
-        self.game_ended = True
+        self.end()
+        if not self.persist:
+            return
+        # Runs in a worker process; the game_ended broadcast does not wait for it
+        schedule_missed_words_analysis(self)
+        # Play counts (human players only, bots would skew rarity) are written in the background too
+        asyncio.create_task(record_word_plays([
+            entry["word"] for entry in self.word_log if not self.players.get(entry["player_id"], {}).get("is_bot")
+        ]))
+        # Every game keeps its seed and word log, whoever played it
+        asyncio.create_task(record_game(self))
         
         # Sort players by score
         sorted_players = sorted(
@@ -401,28 +760,41 @@ class GameState:
                 "final_score": player["score"],
                 "placement": placement,
                 "word_length": self.word_length,
+                "mixed_lengths": self.mixed_lengths,
                 "timer_minutes": self.timer_minutes,
                 "opponent_count": len(authenticated_players) - 1,
                 "elo_change": elo_change,
                 "new_elo_rating": new_elo,
-                "played_at": datetime.utcnow()
+                "played_at": datetime.utcnow(),
+                # With the seed inside config, these replay the game (GameState.replay)
+                "config": self.config(),
+                "deals": self.deals,
+                "word_log": self.word_log
             }
             
             await game_history_collection.insert_one(history_entry)
 
+    def is_table_dead(self) -> bool:
+        """Table is full and no dictionary word can be formed, so nothing can change any more"""
+        # Rooms with the plausibility fallback or blank tiles may still accept words the solver cannot see
+        return (len(self.tiles_by_id) >= 26 and self.solver.count == 0
+                and self.plausibility_threshold is None and not self.blank_tiles)
+
     def should_end_game(self) -> bool:
-        # Game ends if deck is empty, 26 letters on table with 26 seconds timeout, or timer expires
+        # Game ends if deck is empty, the full table is dead, 26 letters on table with 26 seconds timeout, or timer expires
         if not self.deck:
             return True
-        if len(self.letters_on_table) >= 26:
-            if self.last_word_time:
-                return time.time() - self.last_word_time >= 26
-            elif self.last_letter_time:
-                return time.time() - self.last_letter_time >= 26
+        if self.is_table_dead():
+            return True
+        if len(self.tiles_by_id) >= 26:
+            if self.last_word_time is not None:
+                return self.clock.time() - self.last_word_time >= 26
+            elif self.last_letter_time is not None:
+                return self.clock.time() - self.last_letter_time >= 26
         
         # Check if timer has expired
-        if self.game_started and self.game_start_time:
-            elapsed_minutes = (time.time() - self.game_start_time) / 60
+        if self.game_started and self.game_start_time is not None:
+            elapsed_minutes = (self.clock.time() - self.game_start_time) / 60
             if elapsed_minutes >= self.timer_minutes:
                 return True
                 
@@ -445,18 +817,153 @@ class ConnectionManager:
 
     async def broadcast_to_room(self, message: dict, room_code: str):
         if room_code in self.active_connections:
+            try:
+                text = json.dumps(message)  # Serialize once for the whole room
+            except (TypeError, ValueError) as e:
+                logger.error(f"Could not serialize {message.get('type')!r} message for room {room_code}: {e}")
+                return
             for connection in self.active_connections[room_code]:
                 try:
-                    await connection.send_text(json.dumps(message))
+                    await connection.send_text(text)
                 except:
                     pass
 
 manager = ConnectionManager()
 
+# Missed-words analysis, computed off the event loop and cached per game_id
+analysis_pool: Optional[ProcessPoolExecutor] = None
+missed_words_results: OrderedDict = OrderedDict()  # {game_id: result dict, or None while pending}
+
+def schedule_missed_words_analysis(game: GameState):
+    """Mark the game's analysis as pending and start it in the background"""
+    missed_words_results[game.game_id] = None
+    while len(missed_words_results) > MISSED_WORDS_CACHE_SIZE:
+        missed_words_results.popitem(last=False)
+    asyncio.create_task(analyze_missed_words(game))
+
+async def analyze_missed_words(game: GameState):
+    global analysis_pool
+    if analysis_pool is None:
+        analysis_pool = ProcessPoolExecutor(max_workers=ANALYSIS_WORKERS,
+                                            mp_context=multiprocessing.get_context('spawn'))
+    
+    loop = asyncio.get_running_loop()
+    args = (game.dictionary.digest, None, list(game.table_history), list(game.words_played), game.word_lengths)
+    try:
+        try:
+            words = await loop.run_in_executor(analysis_pool, missed_words_in_version, *args)
+        except DictionaryUnavailable:
+            # The worker holds another version (it loaded the artifact before or after a reload):
+            # send it the words this game was pinned to
+            words = await loop.run_in_executor(
+                analysis_pool, missed_words_in_version, args[0], game.dictionary.packed.payload(), *args[2:]
+            )
+    except Exception as e:
+        logger.error(f"Missed-words analysis failed for game {game.game_id}: {e}")
+        missed_words_results.pop(game.game_id, None)
+        return
+    
+    result = {
+        "game_id": game.game_id,
+        "room_code": game.room_code,
+        "word_length": game.word_length,
+        "mixed_lengths": game.mixed_lengths,
+        "words_played": len(game.words_played),
+        "missed_words": words
+    }
+    missed_words_results[game.game_id] = result
+    await manager.broadcast_to_room({"type": "missed_words", **result}, game.room_code)
+
+async def record_word_plays(words: List[str]):
+    """Add a finished game's words to the aggregated play counts behind the rarity tiers"""
+    if not words:
+        return
+    try:
+        await word_plays_collection.bulk_write(
+            [UpdateOne({"word": word}, {"$inc": {"plays": plays}}, upsert=True)
+             for word, plays in Counter(words).items()],
+            ordered=False
+        )
+    except Exception as e:
+        logger.error(f"Recording word plays failed: {e}")
+
+async def record_game(game: GameState):
+    """Store the seed, config, deal count and word log of a finished game (GameState.replay input)"""
+    try:
+        await game_records_collection.insert_one({
+            "game_id": game.game_id,
+            "room_code": game.room_code,
+            "config": game.config(),
+            "dictionary_source": game.dictionary.source,
+            "deals": game.deals,
+            "word_log": game.word_log,
+            "players": [
+                {"player_id": player_id, "name": player["name"], "is_bot": player.get("is_bot", False),
+                 "user_id": player["user"].id if player.get("user") else None, "score": player["score"]}
+                for player_id, player in game.players.items()
+            ],
+            "played_at": datetime.utcnow()
+        })
+    except Exception as e:
+        logger.error(f"Recording game {game.game_id} failed: {e}")
+
+async def refresh_rarity_table():
+    """Rebuild the rarity tiers from the aggregated play counts every RARITY_REFRESH_INTERVAL seconds"""
+    try:
+        await word_plays_collection.create_index("word", unique=True)
+    except Exception as e:
+        logger.error(f"Creating the word_plays index failed: {e}")
+    while True:
+        try:
+            cursor = word_plays_collection.find({}, {"_id": 0, "word": 1, "plays": 1})
+            play_counts = {doc["word"]: doc["plays"] async for doc in cursor}
+            rarity = await asyncio.to_thread(update_rarity, play_counts)
+            logger.info(f"Rarity tiers refreshed from {rarity.total_plays} plays (generation {rarity.generation})")
+        except Exception as e:
+            logger.error(f"Rarity refresh failed, keeping generation {current_rarity().generation}: {e}")
+        await asyncio.sleep(RARITY_REFRESH_INTERVAL)
+
+# Hint memoization
+class HintCache:
+    """Bounded LRU of best hints keyed by (dictionary version, word length, sorted table letters)"""
+    def __init__(self, max_entries: int = 50000):
+        self.max_entries = max_entries
+        self.entries: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, key, compute):
+        if key in self.entries:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return self.entries[key]
+        self.misses += 1
+        value = self.entries[key] = compute()
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return value
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0
+        }
+
+hint_cache = HintCache(int(os.environ.get('HINT_CACHE_SIZE', '50000')))
+
 # Models
 class CreateRoomRequest(BaseModel):
     word_length: int = Field(default=3, ge=3, le=6)
     timer_minutes: int = Field(default=4, ge=2, le=6)  # 2, 4, or 6 minutes
+    plausibility_threshold: Optional[float] = Field(default=None, le=0)  # Trigram fallback for unknown words, e.g. -2.6
+    dealer_lookahead: int = Field(default=0, ge=0, le=8)  # Adaptive dealer window (0 = deal in shuffled order)
+    ranked: bool = False  # Ranked rooms deal from the calibrated deck library when one exists
+    blank_tiles: bool = False  # Add blank tiles that can stand for any letter (worth 0 points)
+    mixed_lengths: bool = False  # Accept any word from 3 to 6 letters instead of only word_length
 
 class JoinRoomRequest(BaseModel):
     room_code: str
@@ -466,11 +973,41 @@ class WordSubmission(BaseModel):
     word: str
     selected_letter_ids: List[str]
 
+class AddBotsRequest(BaseModel):
+    count: int = Field(default=1, ge=1, le=8)
+    profile: BotProfile = Field(default_factory=BotProfile)
+
+class LoadTestRequest(BaseModel):
+    rooms: int = Field(default=10, ge=1, le=5000)
+    bots_per_room: int = Field(default=4, ge=1, le=8)
+    word_length: int = Field(default=4, ge=3, le=6)
+    timer_minutes: int = Field(default=2, ge=2, le=6)
+    profile: BotProfile = Field(default_factory=BotProfile)
+
+class ValidateWordsRequest(BaseModel):
+    words: List[str] = Field(..., max_length=2000)
+    word_length: Optional[int] = Field(default=None, ge=3, le=6)  # Require this exact length if set
+
 # API Routes
 @api_router.get("/")
 async def root():
     return {"message": "WordSmith Game Server"}
 
+def new_game_seed() -> int:
+    return secrets.randbits(63)  # Fits a MongoDB int64
+
+def generate_room_code(seed: int) -> str:
+    """Room code drawn from the game's seed (on a stream separate from the deck)"""
+    rng = random.Random(f"room-code:{seed}")
+    while True:
+        room_code = ''.join(rng.choices('ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789', k=6))
+        if room_code not in games:
+            return room_code
+
+def ranked_deck_rng(seed: int) -> random.Random:
+    """Generator that picks a ranked room's calibrated deck, on its own stream of the game's seed"""
+    return random.Random(f"ranked-deck:{seed}")
+
 @api_router.post("/create-room")
 async def create_room(request: CreateRoomRequest = None, current_user: Optional[User] = Depends(get_optional_user)):
     if request is None:
@@ -480,16 +1017,130 @@ async def create_room(request: CreateRoomRequest = None, current_user: Optional[
     if request.timer_minutes not in [2, 4, 6]:
         request.timer_minutes = 4  # Default to 4 minutes if invalid
     
-    room_code = ''.join(random.choices('ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789', k=6))
-    games[room_code] = GameState(room_code, request.word_length, request.timer_minutes, current_user)
+    seed = new_game_seed()
+    room_code = generate_room_code(seed)
+    # Calibrated decks were simulated for one word length without blanks; other rooms get a fresh shuffle
+    calibrated = request.ranked and not request.blank_tiles and not request.mixed_lengths
+    deck_seed = draw_ranked_deck_seed(request.word_length, ranked_deck_rng(seed),
+                                      request.dealer_lookahead) if calibrated else None
+    # Indexes are built per dictionary version and word length on first use; keep that off the event loop
+    dictionary = current_dictionary()
+    await asyncio.to_thread(dictionary.warm, WORD_LENGTHS if request.mixed_lengths else request.word_length,
+                            request.blank_tiles)
+    if request.plausibility_threshold is not None:
+        await asyncio.to_thread(load_trigram_model, dictionary)
+    games[room_code] = GameState(room_code, request.word_length, request.timer_minutes, current_user,
+                                 request.plausibility_threshold, request.dealer_lookahead, deck_seed,
+                                 request.blank_tiles, request.mixed_lengths, seed)
     
     return {
         "room_code": room_code, 
         "word_length": request.word_length, 
         "timer_minutes": request.timer_minutes,
+        "plausibility_threshold": request.plausibility_threshold,
+        "dealer_lookahead": request.dealer_lookahead,
+        "ranked": request.ranked,
+        "calibrated_deck": deck_seed is not None,
+        "blank_tiles": request.blank_tiles,
+        "mixed_lengths": request.mixed_lengths,
         "creator": current_user.name if current_user else "Anonymous"
     }
 
+@api_router.post("/words/validate")
+async def validate_words(request: ValidateWordsRequest):
+    """Validate a batch of words and return each word's validity and Scrabble score"""
+    results = []
+    for word in request.words:
+        word_upper = word.strip().upper()
+        valid = bool(word_upper) and is_valid_word(word_upper, request.word_length)
+        results.append({
+            "word": word_upper,
+            "valid": valid,
+            "score": sum(SCRABBLE_SCORES.get(letter, 0) for letter in word_upper)
+        })
+    
+    return {
+        "word_length": request.word_length,
+        "total": len(results),
+        "valid_count": sum(1 for r in results if r["valid"]),
+        "results": results
+    }
+
+async def verify_admin_token(x_admin_token: Optional[str] = Header(None)):
+    """Require the configured admin token for admin routes"""
+    if not ADMIN_TOKEN or x_admin_token != ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Admin access required")
+
+def dictionary_info(dictionary) -> dict:
+    return {
+        "version": dictionary.version,
+        "source": dictionary.source,
+        "total_words": len(dictionary),
+        "loaded_at": dictionary.loaded_at
+    }
+
+@api_router.get("/admin/dictionary", dependencies=[Depends(verify_admin_token)])
+async def get_dictionary_status():
+    """Current dictionary version and the versions pinned by live rooms"""
+    pinned = {}
+    for game in games.values():
+        pinned[game.dictionary.version] = pinned.get(game.dictionary.version, 0) + 1
+    return {"current": dictionary_info(current_dictionary()), "rooms_by_version": pinned}
+
+@api_router.post("/admin/dictionary/reload", dependencies=[Depends(verify_admin_token)])
+async def reload_dictionary_route():
+    """Rebuild the dictionary in a worker thread and swap it in for new rooms"""
+    dictionary = await asyncio.to_thread(reload_dictionary)
+    logger.info(f"Dictionary reloaded: {dictionary!r}")
+    return dictionary_info(dictionary)
+
+@api_router.get("/rooms/{room_code}/hint")
+async def get_room_hint(room_code: str):
+    """Best word currently available on a room's table"""
+    game = games.get(room_code)
+    if not game:
+        raise HTTPException(status_code=404, detail="Room not found")
+    return {"room_code": room_code, "hint": game.get_hint()}
+
+@api_router.get("/games/{game_id}/missed-words")
+async def get_missed_words(game_id: str):
+    """Best words that were available during a finished game but never played"""
+    if game_id not in missed_words_results:
+        raise HTTPException(status_code=404, detail="No analysis for this game")
+    result = missed_words_results[game_id]
+    if result is None:
+        return {"game_id": game_id, "status": "pending"}
+    return {"status": "ready", **result}
+
+@api_router.get("/admin/hint-cache", dependencies=[Depends(verify_admin_token)])
+async def get_hint_cache_stats():
+    return hint_cache.stats()
+
+@api_router.get("/admin/rarity", dependencies=[Depends(verify_admin_token)])
+async def get_rarity_stats():
+    rarity = current_rarity()
+    return {"generation": rarity.generation, "total_plays": rarity.total_plays, "tiered_words": len(rarity)}
+
+async def watch_dictionary_artifact():
+    """Reload the dictionary whenever the artifact file is replaced"""
+    def artifact_mtime():
+        try:
+            return ARTIFACT_PATH.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    last_mtime = artifact_mtime()
+    while True:
+        await asyncio.sleep(DICTIONARY_WATCH_INTERVAL)
+        mtime = artifact_mtime()
+        if mtime is not None and mtime != last_mtime:
+            try:
+                dictionary = await asyncio.to_thread(reload_dictionary)
+                logger.info(f"Dictionary artifact changed, reloaded: {dictionary!r}")
+            except Exception as e:
+                logger.error(f"Dictionary reload failed, keeping version {current_dictionary().version}: {e}")
+        last_mtime = mtime
+
 # WebSocket endpoint (must be on main app, not router)
 @app.websocket("/api/ws/{room_code}")
 async def websocket_endpoint(websocket: WebSocket, room_code: str):
@@ -527,12 +1178,7 @@ async def websocket_endpoint(websocket: WebSocket, room_code: str):
                     except Exception as e:
                         print(f"Authentication error: {e}")
                 
-                game.players[websocket_id] = {
-                    "name": player_name, 
-                    "score": 0,
-                    "user": user,  # Store user object for ELO tracking
-                    "elo_rating": user.elo_rating if user else None
-                }
+                game.join(websocket_id, player_name, user)
                 
                 await manager.broadcast_to_room({
                     "type": "player_joined",
@@ -551,7 +1197,7 @@ async def websocket_endpoint(websocket: WebSocket, room_code: str):
                 # Send current game state to new player
                 await websocket.send_text(json.dumps({
                     "type": "game_state",
-                    "letters": game.letters_on_table,
+                    "letters": serialize_tiles(game.tiles_by_id.values()),
                     "players": [
                         {
                             "name": p["name"],
@@ -563,57 +1209,41 @@ async def websocket_endpoint(websocket: WebSocket, room_code: str):
                     ],
                     "game_started": game.game_started,
                     "word_length": game.word_length,
+                    "word_lengths": list(game.word_lengths),
                     "timer_minutes": game.timer_minutes,
                     "time_remaining": game.get_time_remaining()
                 }))
                 
             elif message["type"] == "start_game":
-                if not game.game_started:
-                    game.game_started = True
-                    game.game_start_time = time.time()  # Record when game actually started
-                    # Start letter generation timer
-                    asyncio.create_task(letter_generation_timer(room_code))
-                    # Start game timer countdown
-                    asyncio.create_task(game_timer_countdown(room_code))
-                    
-                    await manager.broadcast_to_room({
-                        "type": "game_started",
-                        "timer_minutes": game.timer_minutes,
-                        "time_remaining": game.get_time_remaining()
-                    }, room_code)
+                await start_game(room_code)
                     
             elif message["type"] == "submit_word":
                 word = message["word"]
-                selected_ids = message["selected_letter_ids"]
+                selected_ids = parse_tile_ids(message["selected_letter_ids"])
                 player_id = str(id(websocket))
                 
-                if game.can_form_word(selected_ids, word):
-                    score = game.calculate_word_score(word)
-                    game.players[player_id]["score"] += score
-                    game.remove_letters(selected_ids)
-                    
-                    await manager.broadcast_to_room({
-                        "type": "word_accepted",
-                        "word": word.upper(),
-                        "player": game.players[player_id]["name"],
-                        "score": score,
-                        "letters": game.letters_on_table,
-                        "players": [
-                            {
-                                "name": p["name"],
-                                "score": p["score"],
-                                "elo_rating": p.get("elo_rating"),
-                                "is_authenticated": p.get("user") is not None
-                            }
-                            for p in game.players.values()
-                        ]
-                    }, room_code)
-                else:
+                if not await submit_word(room_code, player_id, word, selected_ids):
                     await websocket.send_text(json.dumps({
                         "type": "word_rejected",
                         "word": word,
                         "reason": "Invalid word or letters not available"
                     }))
+            
+            elif message["type"] == "request_hint":
+                await websocket.send_text(json.dumps({
+                    "type": "hint",
+                    "hint": game.get_hint()
+                }))
+            
+            elif message["type"] == "check_prefix":
+                # Lets the client flag a dead-end selection before it submits the word
+                prefix = str(message.get("prefix", "")).upper()
+                await websocket.send_text(json.dumps({
+                    "type": "prefix_result",
+                    "prefix": prefix,
+                    "viable": game.dictionary.is_viable_prefix(prefix, game.word_lengths),
+                    "is_word": game.dictionary.is_valid_word(prefix, game.word_lengths)
+                }))
                     
     except WebSocketDisconnect:
         manager.disconnect(websocket, room_code)
@@ -621,32 +1251,99 @@ async def websocket_endpoint(websocket: WebSocket, room_code: str):
         websocket_id = str(id(websocket))
         if websocket_id in game.players:
             player_name = game.players[websocket_id]["name"]
-            del game.players[websocket_id]
+            game.leave(websocket_id)
+            if not any(not p.get("is_bot") for p in game.players.values()):
+                bot_scheduler.retire_room(game)  # The room is abandoned, so its bots stop too
             await manager.broadcast_to_room({
                 "type": "player_left",
                 "player_name": player_name,
-                "players": list(game.players.values())
+                "players": [
+                    {
+                        "name": p["name"],
+                        "score": p["score"],
+                        "elo_rating": p.get("elo_rating"),
+                        "is_authenticated": p.get("user") is not None
+                    }
+                    for p in game.players.values()
+                ]
             }, room_code)
 
+async def start_game(room_code: str) -> bool:
+    """Start a room's game and its timers; returns False if it was already running"""
+    game = games.get(room_code)
+    if not game or game.game_started:
+        return False
+    
+    game.start()
+    # Start letter generation timer
+    asyncio.create_task(letter_generation_timer(room_code))
+    # Start game timer countdown
+    asyncio.create_task(game_timer_countdown(room_code))
+    
+    await manager.broadcast_to_room({
+        "type": "game_started",
+        "timer_minutes": game.timer_minutes,
+        "time_remaining": game.get_time_remaining()
+    }, room_code)
+    return True
+
+async def submit_word(room_code: str, player_id: str, word: str, selected_ids: List[int]) -> bool:
+    """Validate and apply a word from a player (human or bot); returns whether it was accepted"""
+    game = games.get(room_code)
+    if not game or player_id not in game.players:
+        return False
+    
+    resolved = game.resolve_word(selected_ids, word)
+    if resolved:
+        word, blank_letters = resolved
+        score = game.calculate_word_score(word, blank_letters)
+        game.accept_word(player_id, word, blank_letters, score, selected_ids)
+        
+        await manager.broadcast_to_room({
+            "type": "word_accepted",
+            "word": word,
+            "blank_letters": blank_letters,
+            "player": game.players[player_id]["name"],
+            "score": score,
+            "rarity_tier": current_rarity().tier(word),
+            "letters": serialize_tiles(game.tiles_by_id.values()),
+            "playable_words": game.solver.count,
+            "players": [
+                {
+                    "name": p["name"],
+                    "score": p["score"],
+                    "elo_rating": p.get("elo_rating"),
+                    "is_authenticated": p.get("user") is not None
+                }
+                for p in game.players.values()
+            ]
+        }, room_code)
+        return True
+    return False
+
 async def letter_generation_timer(room_code: str):
     """Add letters to table every 4 seconds"""
     game = games.get(room_code)
     if not game:
         return
         
-    while game.game_started and not game.should_end_game():
+    # Loop until this task ends the game itself: the end check below runs after every deal
+    while game.game_started and not game.game_ended:
         letter = game.add_letter_to_table()
         if letter:
             await manager.broadcast_to_room({
                 "type": "new_letter",
                 "letter": letter,
-                "letters": game.letters_on_table
+                "letters": serialize_tiles(game.tiles_by_id.values()),
+                "playable_words": game.solver.count  # Words of the accepted lengths formable from the table
             }, room_code)
         
         if game.should_end_game():
             await game.end_game_and_update_stats()  # Update stats before ending
             await manager.broadcast_to_room({
                 "type": "game_ended",
+                "game_id": game.game_id,
+                "reason": "dead_table" if game.is_table_dead() else None,
                 "final_scores": [
                     {
                         "name": p["name"],
@@ -659,7 +1356,7 @@ async def letter_generation_timer(room_code: str):
             }, room_code)
             break
             
-        await asyncio.sleep(2.2)  # Generate letter every 2.2 seconds
+        await game.clock.sleep(2.2)  # Generate letter every 2.2 seconds
 
 async def game_timer_countdown(room_code: str):
     """Countdown timer for the game duration"""
@@ -681,6 +1378,7 @@ async def game_timer_countdown(room_code: str):
             await game.end_game_and_update_stats()  # Update stats before ending
             await manager.broadcast_to_room({
                 "type": "game_ended",
+                "game_id": game.game_id,
                 "reason": "time_up",
                 "final_scores": [
                     {
@@ -694,7 +1392,60 @@ async def game_timer_countdown(room_code: str):
             }, room_code)
             break
             
-        await asyncio.sleep(1)  # Update every second for smooth countdown
+        await game.clock.sleep(1)  # Update every second for smooth countdown
+
+# Bot players
+bot_scheduler = BotScheduler(games.get, submit_word)
+
+@api_router.post("/rooms/{room_code}/bots")
+async def add_bots(room_code: str, request: AddBotsRequest = None,
+                   current_user: Optional[User] = Depends(get_optional_user),
+                   x_admin_token: Optional[str] = Header(None)):
+    """Fill a room with bot players (the room's host or an admin only)"""
+    if request is None:
+        request = AddBotsRequest()
+    game = games.get(room_code)
+    if not game or game.game_ended:
+        raise HTTPException(status_code=404, detail="Room not found")
+    is_admin = bool(ADMIN_TOKEN) and x_admin_token == ADMIN_TOKEN
+    is_host = current_user is not None and game.creator_user is not None and current_user.id == game.creator_user.id
+    if not (is_admin or is_host):
+        raise HTTPException(status_code=403, detail="Only the room's host or an admin can add bots")
+    
+    bots = [bot_scheduler.add_bot(game, request.profile) for _ in range(request.count)]
+    await manager.broadcast_to_room({
+        "type": "player_joined",
+        "player_name": bots[-1].name,
+        "players": [
+            {
+                "name": p["name"],
+                "score": p["score"],
+                "elo_rating": p.get("elo_rating"),
+                "is_authenticated": p.get("user") is not None
+            }
+            for p in game.players.values()
+        ]
+    }, room_code)
+    return {"room_code": room_code, "bots": [bot.name for bot in bots]}
+
+@api_router.post("/admin/load-test", dependencies=[Depends(verify_admin_token)])
+async def start_load_test(request: LoadTestRequest):
+    """Create rooms full of bots and start them, exercising the same paths as real games"""
+    room_codes = []
+    await asyncio.to_thread(current_dictionary().warm, request.word_length)
+    for _ in range(request.rooms):
+        seed = new_game_seed()
+        room_code = generate_room_code(seed)
+        game = games[room_code] = GameState(room_code, request.word_length, request.timer_minutes, seed=seed)
+        for _ in range(request.bots_per_room):
+            bot_scheduler.add_bot(game, request.profile)
+        await start_game(room_code)
+        room_codes.append(room_code)
+    return {"rooms": room_codes, "scheduler": bot_scheduler.stats()}
+
+@api_router.get("/admin/bots", dependencies=[Depends(verify_admin_token)])
+async def get_bot_stats():
+    return bot_scheduler.stats()
 
 
 # Include the router
@@ -715,6 +1466,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def start_dictionary_watcher():
+    if DICTIONARY_WATCH_INTERVAL > 0:
+        asyncio.create_task(watch_dictionary_artifact())
+
+@app.on_event("startup")
+async def start_rarity_refresh():
+    if RARITY_REFRESH_INTERVAL > 0:
+        asyncio.create_task(refresh_rarity_table())
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
-    client.close()
\ No newline at end of file
+    client.close()
+    if analysis_pool is not None:
+        analysis_pool.shutdown(wait=False, cancel_futures=True)
\ No newline at end of file
@@ -0,0 +1,103 @@
+# Incremental table solver
+# Tracks which dictionary words of a given length can be formed from the letters
+# on a room's table. Every word keeps a deficit (how many of its letters are still
+# missing); a tile coming or going only touches the words that need that letter at
+# least as many times as it is now present, so the cost follows the change rather
+# than the size of the dictionary.
+import weakref
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Set
+
+from dictionary import DictionaryVersion, Lengths, current_dictionary, length_key, register_warmer
+
+
+class LetterDemandIndex:
+    """For each (letter, n): ids of the words that need `letter` at least n times"""
+
+    def __init__(self, words: Iterable[str]):
+        self.words: List[str] = sorted(words)
+        self.lengths = bytes(len(word) for word in self.words)  # Initial deficit of every word
+        self.demand: Dict[tuple, List[int]] = {}
+        for word_id, word in enumerate(self.words):
+            for letter, needed in Counter(word).items():
+                for n in range(1, needed + 1):
+                    self.demand.setdefault((letter, n), []).append(word_id)
+
+    def needing(self, letter: str, n: int) -> List[int]:
+        return self.demand.get((letter, n), ())
+
+
+_demand_indexes: 'weakref.WeakKeyDictionary[DictionaryVersion, Dict[Lengths, LetterDemandIndex]]' = weakref.WeakKeyDictionary()
+
+def get_demand_index(length: Lengths, dictionary: Optional[DictionaryVersion] = None) -> LetterDemandIndex:
+    """Demand index for words of the given length(s), built once per dictionary version"""
+    if dictionary is None:
+        dictionary = current_dictionary()
+    by_length = _demand_indexes.setdefault(dictionary, {})
+    key = length_key(length)
+    index = by_length.get(key)
+    if index is None:
+        index = by_length[key] = LetterDemandIndex(dictionary.words_of(key))
+    return index
+
+register_warmer(lambda dictionary, lengths: get_demand_index(lengths, dictionary))
+
+
+class TableSolver:
+    """Set of currently formable words for one room, updated tile by tile.
+
+    Mixed-length rooms pass a tuple of lengths and get one solver covering all of them.
+    """
+
+    def __init__(self, dictionary: DictionaryVersion, word_length: Lengths, letters: Iterable[str] = ()):
+        self.word_length = word_length
+        self._index = get_demand_index(word_length, dictionary)
+        self._deficits = bytearray(self._index.lengths)  # One byte per word, copied from the index
+        self._counts: Counter = Counter()
+        self._formable: Set[int] = set()
+        for letter in letters:
+            self.add(letter)
+
+    def add(self, letter: str):
+        letter = letter.upper()
+        self._counts[letter] += 1
+        deficits = self._deficits
+        formable = self._formable
+        for word_id in self._index.needing(letter, self._counts[letter]):
+            deficit = deficits[word_id] - 1
+            deficits[word_id] = deficit
+            if not deficit:
+                formable.add(word_id)
+
+    def remove(self, letter: str):
+        letter = letter.upper()
+        if self._counts[letter] <= 0:
+            return
+        deficits = self._deficits
+        formable = self._formable
+        for word_id in self._index.needing(letter, self._counts[letter]):
+            deficit = deficits[word_id]
+            if not deficit:
+                formable.discard(word_id)
+            deficits[word_id] = deficit + 1
+        self._counts[letter] -= 1
+
+    def gain_if_added(self, letter: str) -> int:
+        """How many more words would become formable if this letter were dealt"""
+        letter = letter.upper()
+        deficits = self._deficits
+        return sum(1 for word_id in self._index.needing(letter, self._counts[letter] + 1) if deficits[word_id] == 1)
+
+    def remove_many(self, letters: Iterable[str]):
+        for letter in letters:
+            self.remove(letter)
+
+    @property
+    def count(self) -> int:
+        """Number of words that can currently be formed"""
+        return len(self._formable)
+
+    def words(self) -> List[str]:
+        """Currently formable words, sorted"""
+        words = self._index.words
+        return sorted(words[word_id] for word_id in self._formable)
@@ -0,0 +1,113 @@
+# Tile distribution, scores and deck construction
+# Shared by the game server and the offline deck calibration tool.
+import json
+import os
+import random
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+# Scrabble tile distribution
+SCRABBLE_TILES = {
+    'A': 9, 'B': 2, 'C': 2, 'D': 4, 'E': 12, 'F': 2, 'G': 3, 'H': 2,
+    'I': 9, 'J': 1, 'K': 1, 'L': 4, 'M': 2, 'N': 6, 'O': 8, 'P': 2,
+    'Q': 1, 'R': 6, 'S': 4, 'T': 6, 'U': 4, 'V': 2, 'W': 2, 'X': 1, 'Y': 2, 'Z': 1
+}
+
+# Scrabble tile scores
+SCRABBLE_SCORES = {
+    'A': 1, 'E': 1, 'I': 1, 'O': 1, 'U': 1, 'L': 1, 'N': 1, 'S': 1, 'T': 1, 'R': 1,
+    'D': 2, 'G': 2,
+    'B': 3, 'C': 3, 'M': 3, 'P': 3,
+    'F': 4, 'H': 4, 'V': 4, 'W': 4, 'Y': 4,
+    'K': 5,
+    'J': 8, 'X': 8,
+    'Q': 10, 'Z': 10
+}
+
+# Bonus added to a word's score in mixed-length rooms, so longer words are worth going for
+MIXED_LENGTH_BONUS = {3: 0, 4: 2, 5: 5, 6: 10}
+
+# Blank tiles (rooms with blank_tiles enabled) stand for any letter and score 0
+BLANK_TILE = '?'
+BLANK_TILE_COUNT = 2
+
+# Calibrated deck seeds written by deck_calibration.py, one library per word length and dealer lookahead
+DECK_LIBRARY_DIR = Path(os.environ.get('DECK_LIBRARY_DIR', Path(__file__).parent / 'deck_library'))
+
+_deck_libraries: Dict[tuple, List[int]] = {}
+
+
+class Tile:
+    """A letter on the table. Ids are small integers, unique within a room"""
+    __slots__ = ('id', 'letter', 'timestamp')
+
+    def __init__(self, tile_id: int, letter: str, timestamp: float):
+        self.id = tile_id
+        self.letter = letter
+        self.timestamp = timestamp
+
+    def to_json(self) -> dict:
+        """Wire format, unchanged from the dict tiles clients already know (ids stay strings)"""
+        return {'letter': self.letter, 'id': str(self.id), 'timestamp': self.timestamp}
+
+    def __repr__(self) -> str:
+        return f"Tile({self.id}, {self.letter!r})"
+
+
+def serialize_tiles(tiles: Iterable[Tile]) -> List[dict]:
+    return [tile.to_json() for tile in tiles]
+
+
+def parse_tile_ids(ids: Iterable) -> List[int]:
+    """Tile ids from a client message (strings or ints); anything that is not an id is dropped"""
+    parsed = []
+    for tile_id in ids:
+        try:
+            parsed.append(int(tile_id))
+        except (TypeError, ValueError):
+            continue
+    return parsed
+
+
+def create_deck(rng=random, blanks: int = 0) -> List[str]:
+    """Full tile bag (plus `blanks` blank tiles) shuffled with the given random generator"""
+    deck = []
+    for letter, count in SCRABBLE_TILES.items():
+        deck.extend([letter] * count)
+    deck.extend([BLANK_TILE] * blanks)
+    rng.shuffle(deck)
+    return deck
+
+
+def dealing_order(deck: List[str]) -> List[str]:
+    """Tiles of a deck in the order a room deals them (GameState pops from the end)"""
+    return deck[::-1]
+
+
+def dealer_window(dealer_lookahead: int) -> int:
+    """Adaptive dealer window that changes the deal (0 and 1 both mean deck order)"""
+    return dealer_lookahead if dealer_lookahead > 1 else 0
+
+
+def deck_library_path(word_length: int, dealer_lookahead: int = 0) -> Path:
+    window = dealer_window(dealer_lookahead)
+    suffix = f"_lookahead{window}" if window else ""
+    return DECK_LIBRARY_DIR / f"decks_{word_length}{suffix}.json"
+
+
+def load_deck_library(word_length: int, dealer_lookahead: int = 0) -> List[int]:
+    """Seeds of the pre-vetted decks for a word length and dealer (empty if no library has been built)"""
+    key = (word_length, dealer_window(dealer_lookahead))
+    if key not in _deck_libraries:
+        try:
+            library = json.loads(deck_library_path(*key).read_text())
+            _deck_libraries[key] = [entry["seed"] for entry in library["decks"]]
+        except FileNotFoundError:
+            _deck_libraries[key] = []
+    return _deck_libraries[key]
+
+
+def draw_ranked_deck_seed(word_length: int, rng: random.Random, dealer_lookahead: int = 0) -> Optional[int]:
+    """Seed from the library calibrated for this dealer, or None to fall back to a fresh shuffle"""
+    seeds = load_deck_library(word_length, dealer_lookahead)
+    return rng.choice(seeds) if seeds else None
@@ -0,0 +1,376 @@
+# Source word lists for the game dictionary.
+# These literals are compiled into the packed artifact by dictionary_artifact.py;
+# dictionary.py only imports this module when no artifact is available.
+from expanded_words import ADDITIONAL_FOUR_LETTER_WORDS, ADDITIONAL_FIVE_LETTER_WORDS, ADDITIONAL_SIX_LETTER_WORDS
+
+# Enhanced 3-letter words (1500+ words)
+THREE_LETTER_WORDS = {
+    # Common 3-letter words
+    'THE', 'AND', 'FOR', 'ARE', 'BUT', 'NOT', 'YOU', 'ALL', 'CAN', 'HER', 'WAS', 'ONE', 'OUR', 'HAD', 'DAY', 'GET',
+    'USE', 'MAN', 'NEW', 'NOW', 'WAY', 'MAY', 'SAY', 'SEE', 'HIM', 'TWO', 'HOW', 'ITS', 'WHO', 'OIL', 'SIT', 'SET',
+    'RUN', 'EAT', 'FAR', 'SEA', 'EYE', 'RED', 'TOP', 'ARM', 'TOO', 'OLD', 'ANY', 'APP', 'ART', 'BAD', 'BAG', 'BAR',
+    'BAT', 'BED', 'BIG', 'BIT', 'BOX', 'BOY', 'BUS', 'BUY', 'CAR', 'CAT', 'COW', 'CRY', 'CUP', 'CUT', 'DOG', 'DRY',
+    'EAR', 'EGG', 'END', 'FAN', 'FEW', 'FIT', 'FIX', 'FLY', 'FOX', 'FUN', 'GAS', 'GOD', 'GOT', 'GUN', 'GUY', 'HAT',
+    'HIT', 'HOT', 'JOB', 'KEY', 'KID', 'LAW', 'LAY', 'LEG', 'LET', 'LIE', 'LOT', 'LOW', 'MAP', 'MOM', 'NET', 'OFF',
+    'PAY', 'PEN', 'PET', 'PUT', 'RAT', 'RAW', 'ROW', 'SAD', 'SUN', 'TAX', 'TEA', 'TEN', 'TIE', 'TIP', 'TRY', 'WAR',
+    'WIN', 'YES', 'YET', 'ZOO', 'ACE', 'ADD', 'AGE', 'AID', 'AIM', 'AIR', 'ASK', 'AXE', 'BAN', 'BEE', 'BET', 'BIN',
+    
+    # Extended 3-letter words including all common combinations
+    'BOW', 'CAB', 'CAD', 'CAM', 'CAN', 'CAP', 'COB', 'COD', 'COG', 'DIG', 'DIM', 'DIP', 'DOT', 'DUE', 'DUG', 'ELF',
+    'ERA', 'EVE', 'FED', 'FIG', 'FIN', 'FOG', 'FUR', 'GAP', 'GEL', 'GEM', 'HAM', 'HEN', 'HEX', 'HID', 'HOP', 'HUB',
+    'HUG', 'HUT', 'ICE', 'ILL', 'INK', 'ION', 'JAM', 'JAR', 'JAW', 'JET', 'JOG', 'JOT', 'JOY', 'JUG', 'LAB', 'LAD',
+    'LAP', 'LED', 'LID', 'LIP', 'LOG', 'MAD', 'MUD', 'MUG', 'NAP', 'NUT', 'OAK', 'ODD', 'ORB', 'OWL', 'PAD', 'PAN',
+    'PAW', 'PEA', 'PIG', 'PIN', 'PIT', 'POD', 'POT', 'PUP', 'RAG', 'RAM', 'RAN', 'RAP', 'RIB', 'RID', 'RIM', 'RIP',
+    'ROD', 'RUB', 'RUG', 'RUM', 'SAG', 'SAP', 'SAW', 'SKI', 'SKY', 'SOB', 'SOD', 'SON', 'SPA', 'SPY', 'TAB', 'TAG',
+    'TAN', 'TAP', 'TAR', 'TON', 'TOY', 'TUB', 'TUG', 'VAN', 'VAT', 'VET', 'WEB', 'WET', 'WIG', 'ZIP', 'APE', 'ARC',
+    'ARK', 'AWE', 'BAY', 'BOB', 'BUG', 'BUN', 'COT', 'DAD', 'DAM', 'DEN', 'DEW', 'DIE', 'EEL', 'ELM', 'ERR', 'FEW',
+    'FLU', 'FRY', 'GAG', 'GAL', 'GAB', 'HUE', 'IRE', 'IVY', 'JAB', 'KEG', 'LAG', 'LAM', 'MAT', 'MAX', 'MIX', 'MOB',
+    'MOD', 'MOP', 'NAG', 'NOB', 'NOD', 'NOR', 'PAL', 'POP', 'PRO', 'PUB', 'PUN', 'RAY', 'REP', 'ROT', 'SAT', 'SHE',
+    'SHY', 'SIN', 'SIP', 'SIR', 'SIS', 'SIX', 'TAD', 'TAT', 'TIC', 'TIN', 'TOE', 'TUX', 'URN', 'VIA', 'VIE', 'WAX',
+    'WHO', 'WHY', 'WOK', 'WON', 'WOO', 'YAK', 'YAM', 'YAP', 'YAW', 'YEA', 'YEP', 'YEW', 'YIN', 'YIP', 'ZAP', 'ZED',
+    'ZEN', 'ZIT', 'BAA', 'BAH', 'BAM', 'BEL', 'BOA', 'BOG', 'BRA', 'BRO', 'BUR', 'CAW', 'COO', 'COP', 'COX', 'COY',
+    'CUB', 'CUD', 'CUE', 'DAB', 'DUB', 'DUD', 'DUN', 'DYE', 'EBB', 'EEK', 'EGO', 'ELK', 'EMU', 'ERG', 'EWE', 'FAD',
+    'FAG', 'FAT', 'FAX', 'FEZ', 'FIB', 'FIR', 'FOB', 'FOE', 'GIG', 'GIN', 'GNU', 'GOB', 'GOO', 'GUM', 'GUT', 'GYM',
+    'HAG', 'HAS', 'HAY', 'HEM', 'HEP', 'HER', 'HEW', 'HEY', 'HIM', 'HIP', 'HIS', 'HOB', 'HOD', 'HOG', 'HOW', 'HUM',
+    'HUN', 'HYP', 'ICY', 'IMP', 'INN', 'IRK', 'JAG', 'JAY', 'JEW', 'JIG', 'JUT', 'KEN', 'KIN', 'KIT', 'LAC', 'LAX',
+    'LEA', 'LEV', 'LIT', 'LOB', 'LOO', 'LOP', 'LOX', 'LUG', 'LYE', 'MAC', 'MAR', 'MAW', 'MEN', 'MET', 'MID', 'MUM',
+    'NAB', 'NAY', 'NEW', 'NIB', 'NIL', 'NIT', 'NIX', 'NUB', 'NUN', 'OAF', 'OAR', 'OAT', 'ODE', 'OFT', 'ONE', 'OPT',
+    'ORE', 'OUT', 'OVA', 'OWE', 'OWN', 'PAP', 'PAR', 'PAT', 'PAX', 'PEG', 'PEP', 'PER', 'PEW', 'PIE', 'PIP', 'PLY',
+    'POW', 'POX', 'PRY', 'PUD', 'PUG', 'PUS', 'QUA', 'RED', 'REF', 'REV', 'RIG', 'ROB', 'ROE', 'RUT', 'RYE', 'SAC',
+    'SAX', 'SEW', 'SEX', 'SLY', 'SOP', 'SOT', 'SOW', 'SOX', 'SOY', 'STY', 'SUB', 'SUM', 'SUP', 'TAU', 'TAW', 'TED',
+    'THE', 'THY', 'TIT', 'TOT', 'TOW', 'TUN', 'TUT', 'TWO', 'UGH', 'USE', 'VEX', 'VOW', 'WAD', 'WAG', 'WAN', 'WAY',
+    'WED', 'WIT', 'WOE', 'WOW', 'YOW', 'YUK', 'ZAG', 'ZEE', 'ZIG', 'ABS', 'ACE', 'ACT', 'ADS', 'AFT', 'AGO', 'AHA',
+    'AHS', 'ALE', 'ALP', 'AMP', 'ANT', 'APT', 'ARC', 'ARF', 'ARM', 'ART', 'ASH', 'ATE', 'AWL', 'AYE', 'BAD', 'BAG',
+    'BAM', 'BAT', 'BAY', 'BED', 'BEG', 'BET', 'BIB', 'BID', 'BIG', 'BIN', 'BIT', 'BOA', 'BOB', 'BOG', 'BOX', 'BOY',
+    'BUD', 'BUG', 'BUM', 'BUN', 'BUS', 'BUT', 'BUY', 'BYE', 'CAB', 'CAD', 'CAM', 'CAN', 'CAP', 'CAR', 'CAT', 'CAW',
+    'COB', 'COD', 'COG', 'COO', 'COP', 'COT', 'COW', 'COX', 'COY', 'COZ', 'CRY', 'CUB', 'CUD', 'CUE', 'CUP', 'CUR',
+    'CUT', 'DAB', 'DAD', 'DAM', 'DAY', 'DEN', 'DEW', 'DIB', 'DID', 'DIE', 'DIG', 'DIM', 'DIN', 'DIP', 'DOC', 'DOE',
+    'DOG', 'DON', 'DOT', 'DRY', 'DUB', 'DUD', 'DUE', 'DUG', 'DUN', 'DUO', 'DYE', 'EAR', 'EAT', 'EBB', 'EEL', 'EGG',
+    'EGO', 'ELF', 'ELK', 'ELM', 'EMU', 'END', 'ERA', 'ERG', 'ERR', 'EVE', 'EWE', 'EYE', 'FAB', 'FAD', 'FAN', 'FAR',
+    'FAT', 'FAX', 'FED', 'FEE', 'FEW', 'FEZ', 'FIB', 'FIG', 'FIN', 'FIR', 'FIT', 'FIX', 'FLU', 'FLY', 'FOB', 'FOE',
+    'FOG', 'FOR', 'FOX', 'FRY', 'FUG', 'FUN', 'FUR', 'GAB', 'GAG', 'GAL', 'GAP', 'GAS', 'GAY', 'GEL', 'GEM', 'GET',
+    'GIG', 'GIN', 'GNU', 'GOB', 'GOD', 'GOO', 'GOT', 'GUM', 'GUN', 'GUT', 'GUY', 'GYM', 'HAD', 'HAG', 'HAM', 'HAS',
+    'HAT', 'HAY', 'HEM', 'HEN', 'HEP', 'HER', 'HEW', 'HEX', 'HEY', 'HID', 'HIM', 'HIP', 'HIS', 'HIT', 'HOB', 'HOD',
+    'HOG', 'HOP', 'HOT', 'HOW', 'HUB', 'HUE', 'HUG', 'HUM', 'HUN', 'HUT', 'HYP', 'ICE', 'ICY', 'ILL', 'IMP', 'INK',
+    'INN', 'ION', 'IRE', 'IRK', 'ITS', 'IVY', 'JAB', 'JAG', 'JAM', 'JAR', 'JAW', 'JAY', 'JET', 'JEW', 'JIG', 'JOB',
+    'JOG', 'JOT', 'JOY', 'JUG', 'JUT', 'KEG', 'KEN', 'KEY', 'KID', 'KIN', 'KIT', 'LAB', 'LAC', 'LAD', 'LAG', 'LAM',
+    'LAP', 'LAW', 'LAX', 'LAY', 'LEA', 'LED', 'LEG', 'LET', 'LEV', 'LID', 'LIE', 'LIP', 'LIT', 'LOB', 'LOG', 'LOO',
+    'LOP', 'LOT', 'LOW', 'LOX', 'LUG', 'LYE', 'MAC', 'MAD', 'MAN', 'MAP', 'MAR', 'MAT', 'MAW', 'MAX', 'MAY', 'MEN',
+    'MET', 'MID', 'MIX', 'MOB', 'MOD', 'MOM', 'MOP', 'MOW', 'MUD', 'MUG', 'MUM', 'NAB', 'NAG', 'NAP', 'NAY', 'NET',
+    'NEW', 'NIB', 'NIL', 'NIT', 'NIX', 'NOB', 'NOD', 'NOR', 'NOT', 'NOW', 'NUB', 'NUN', 'NUT', 'OAF', 'OAK', 'OAR',
+    'OAT', 'ODD', 'ODE', 'OFF', 'OFT', 'OIL', 'OLD', 'ONE', 'OPT', 'ORB', 'ORE', 'OUR', 'OUT', 'OVA', 'OWE', 'OWL',
+    'OWN', 'PAD', 'PAL', 'PAN', 'PAP', 'PAR', 'PAT', 'PAW', 'PAX', 'PAY', 'PEA', 'PEG', 'PEN', 'PEP', 'PER', 'PET',
+    'PEW', 'PIE', 'PIG', 'PIN', 'PIP', 'PIT', 'PLY', 'POD', 'POP', 'POT', 'POW', 'POX', 'PRO', 'PRY', 'PUB', 'PUD',
+    'PUG', 'PUN', 'PUP', 'PUS', 'PUT', 'QUA', 'RAG', 'RAM', 'RAN', 'RAP', 'RAT', 'RAW', 'RAY', 'RED', 'REF', 'REP',
+    'REV', 'RIB', 'RID', 'RIG', 'RIM', 'RIP', 'ROB', 'ROD', 'ROE', 'ROT', 'ROW', 'RUB', 'RUG', 'RUM', 'RUN', 'RUT',
+    'RYE', 'SAC', 'SAD', 'SAG', 'SAP', 'SAT', 'SAW', 'SAX', 'SAY', 'SEA', 'SEE', 'SET', 'SEW', 'SEX', 'SHE', 'SHY',
+    'SIN', 'SIP', 'SIR', 'SIS', 'SIT', 'SIX', 'SKI', 'SKY', 'SLY', 'SOB', 'SOD', 'SON', 'SOP', 'SOT', 'SOW', 'SOX',
+    'SOY', 'SPA', 'SPY', 'STY', 'SUB', 'SUM', 'SUN', 'SUP', 'TAB', 'TAD', 'TAG', 'TAN', 'TAP', 'TAR', 'TAT', 'TAU',
+    'TAW', 'TAX', 'TEA', 'TED', 'TEN', 'THE', 'THY', 'TIC', 'TIE', 'TIN', 'TIP', 'TIT', 'TOE', 'TON', 'TOO', 'TOP',
+    'TOT', 'TOW', 'TOY', 'TRY', 'TUB', 'TUG', 'TUN', 'TUT', 'TWO', 'UGH', 'URN', 'USE', 'VAN', 'VAT', 'VET', 'VEX',
+    'VIA', 'VIE', 'VOW', 'WAD', 'WAG', 'WAN', 'WAR', 'WAS', 'WAX', 'WAY', 'WEB', 'WED', 'WET', 'WHO', 'WHY', 'WIG',
+    'WIN', 'WIT', 'WOE', 'WOK', 'WON', 'WOO', 'WOW', 'YAK', 'YAM', 'YAP', 'YAW', 'YEA', 'YEP', 'YES', 'YET', 'YEW',
+    'YIN', 'YIP', 'YOU', 'YOW', 'YUK', 'ZAG', 'ZAP', 'ZED', 'ZEE', 'ZEN', 'ZIG', 'ZIP', 'ZIT', 'ZOO'
+}
+
+# 4-letter words (Combining base + additional words for comprehensive coverage)
+FOUR_LETTER_WORDS = {
+    'WORD', 'WHAT', 'SAID', 'EACH', 'WHICH', 'WILL', 'ABOUT', 'MANY', 'THEN', 'THEM', 'THESE', 'SOME', 'WOULD',
+    'MAKE', 'LIKE', 'INTO', 'TIME', 'VERY', 'WHEN', 'COME', 'HERE', 'JUST', 'KNOW', 'TAKE', 'THAN', 'ONLY', 'GOOD',
+    'ALSO', 'BACK', 'OVER', 'THINK', 'WHERE', 'BEING', 'WELL', 'LONG', 'WORK', 'LIFE', 'STILL', 'SHOULD', 'AFTER',
+    'FIRST', 'NEVER', 'GIVE', 'MOST', 'USED', 'MADE', 'NEED', 'CALL', 'FIND', 'TELL', 'HELP', 'MOVE', 'PART', 'HAND',
+    'HIGH', 'YEAR', 'CAME', 'SHOW', 'LOOK', 'WANT', 'DOES', 'SEEM', 'FELT', 'KEEP', 'LEFT', 'TURN', 'SEEN', 'FACT',
+    'HEAD', 'WEEK', 'CASE', 'LAST', 'SAME', 'BOOK', 'HEAR', 'STOP', 'SIDE', 'BOTH', 'FACE', 'ONCE', 'OPEN', 'WALK',
+    'TALK', 'WENT', 'EYES', 'DOOR', 'ROOM', 'AWAY', 'NIGHT', 'SMALL', 'HOUSE', 'PLACE', 'LARGE', 'SOUND', 'AGAIN',
+    'UNDER', 'MIGHT', 'WHILE', 'GOING', 'AREA', 'BEAR', 'BEAT', 'BIRD', 'BLUE', 'BODY', 'BONE', 'BOOK', 'BURN',
+    'BUSY', 'CAKE', 'CALL', 'CARE', 'CELL', 'CITY', 'CLUB', 'COAT', 'COLD', 'COOL', 'COPY', 'COST', 'CREW', 'DARK',
+    'DATA', 'DEAD', 'DEAL', 'DEAR', 'DEEP', 'DESK', 'DIET', 'DOOR', 'DRAW', 'DRUG', 'DUCK', 'DUTY', 'EACH', 'EARN',
+    'EAST', 'EASY', 'EDGE', 'ELSE', 'EVEN', 'EVER', 'EVIL', 'EXIT', 'FACE', 'FAIL', 'FAIR', 'FALL', 'FARM', 'FAST',
+    'FEAR', 'FEEL', 'FEET', 'FELL', 'FILE', 'FILM', 'FINE', 'FIRE', 'FISH', 'FIVE', 'FLAT', 'FLOW', 'FOLK', 'FOOD',
+    'FOOT', 'FORM', 'FREE', 'FROM', 'FULL', 'FUND', 'GAME', 'GATE', 'GAVE', 'GIFT', 'GIRL', 'GIVE', 'GLAD', 'GOLD',
+    'GONE', 'GRAB', 'GREW', 'GRIP', 'GROW', 'HALL', 'HANG', 'HARD', 'HARM', 'HATE', 'HAVE', 'HEAD', 'HEAR', 'HEAT',
+    'HELD', 'HELL', 'HIDE', 'HILL', 'HIRE', 'HOLD', 'HOLE', 'HOLY', 'HOME', 'HOPE', 'HOUR', 'HUGE', 'HUNG', 'HUNT',
+    'HURT', 'IDEA', 'INCH', 'INTO', 'IRON', 'ITEM', 'JACK', 'JANE', 'JAZZ', 'JOIN', 'JOKE', 'JUMP', 'JUNE', 'JURY',
+    'JUST', 'KEEP', 'KEPT', 'KICK', 'KILL', 'KIND', 'KING', 'KNEE', 'KNEW', 'KNOW', 'LACK', 'LADY', 'LAID', 'LAKE',
+    'LAND', 'LAST', 'LATE', 'LEAD', 'LEAN', 'LEFT', 'LENS', 'LESS', 'LIES', 'LIFE', 'LIFT', 'LINE', 'LINK', 'LION',
+    'LIST', 'LIVE', 'LOAN', 'LOCK', 'LONG', 'LOOK', 'LORD', 'LOSE', 'LOSS', 'LOST', 'LOTS', 'LOUD', 'LOVE', 'LUCK',
+    'MADE', 'MAIL', 'MAIN', 'MAKE', 'MALE', 'MALL', 'MANY', 'MARK', 'MASS', 'MATE', 'MATH', 'MEAL', 'MEAN', 'MEAT',
+    'MEET', 'MELT', 'MENU', 'MESS', 'MICE', 'MILE', 'MILK', 'MIND', 'MINE', 'MISS', 'MODE', 'MOOD', 'MOON', 'MORE',
+    'MOST', 'MOVE', 'MUCH', 'MUST', 'NAME', 'NAVY', 'NEAR', 'NECK', 'NEED', 'NEWS', 'NICE', 'NOON', 'NOTE', 'NUTS',
+    'ONCE', 'ONLY', 'ONTO', 'OPEN', 'ORAL', 'OVER', 'PACE', 'PACK', 'PAGE', 'PAID', 'PAIN', 'PAIR', 'PALM', 'PARK',
+    'PART', 'PASS', 'PAST', 'PATH', 'PEAK', 'PICK', 'PILE', 'PINK', 'PIPE', 'PLAN', 'PLAY', 'PLOT', 'POEM', 'POET',
+    'POLL', 'POOL', 'POOR', 'PORT', 'POST', 'PULL', 'PURE', 'PUSH', 'QUIT', 'RACE', 'RAIN', 'RANK', 'RARE', 'RATE',
+    'READ', 'REAL', 'REAR', 'RELY', 'RENT', 'REST', 'RICH', 'RIDE', 'RING', 'RISE', 'RISK', 'ROAD', 'ROCK', 'ROLE',
+    'ROLL', 'ROOF', 'ROOM', 'ROOT', 'ROPE', 'ROSE', 'RULE', 'RUSH', 'SAFE', 'SAID', 'SAIL', 'SALE', 'SALT', 'SAME',
+    'SAND', 'SAVE', 'SEAT', 'SEED', 'SEEK', 'SEEM', 'SEEN', 'SELL', 'SEND', 'SENT', 'SHIP', 'SHOE', 'SHOP', 'SHOT',
+    'SHOW', 'SICK', 'SIDE', 'SIGN', 'SING', 'SINK', 'SITE', 'SIZE', 'SKIN', 'SLIP', 'SLOW', 'SNAP', 'SNOW', 'SOAP',
+    'SOFT', 'SOIL', 'SOLD', 'SOME', 'SONG', 'SOON', 'SORT', 'SOUL', 'SOUP', 'SPIN', 'SPOT', 'STAR', 'STAY', 'STEP',
+    'STOP', 'SUCH', 'SUIT', 'SURE', 'SWIM', 'TAKE', 'TALK', 'TALL', 'TANK', 'TAPE', 'TASK', 'TEAM', 'TEAR', 'TELL',
+    'TEND', 'TENT', 'TEST', 'TEXT', 'THAN', 'THAT', 'THEM', 'THEN', 'THEY', 'THIN', 'THIS', 'THUS', 'TIDE', 'TIED',
+    'TIES', 'TIME', 'TINY', 'TIPS', 'TIRE', 'TOLD', 'TONE', 'TOOK', 'TOOL', 'TOPS', 'TORN', 'TOUR', 'TOWN', 'TREE',
+    'TRIP', 'TRUE', 'TUBE', 'TUNE', 'TURN', 'TYPE', 'UNIT', 'UPON', 'USED', 'USER', 'VARY', 'VAST', 'VIEW', 'VOTE',
+    'WAGE', 'WAIT', 'WAKE', 'WALK', 'WALL', 'WANT', 'WARD', 'WARM', 'WARN', 'WASH', 'WAVE', 'WAYS', 'WEAK', 'WEAR',
+    'WEEK', 'WELL', 'WENT', 'WERE', 'WEST', 'WHAT', 'WHEN', 'WHOM', 'WIDE', 'WIFE', 'WILD', 'WILL', 'WIND', 'WINE',
+    'WING', 'WIRE', 'WISE', 'WISH', 'WITH', 'WOOD', 'WOOL', 'WORD', 'WORE', 'WORK', 'YARD', 'YEAR', 'YOUR', 'ZERO',
+    'ZONE', 'ABLE', 'ACID', 'AGED', 'AGES', 'AIDE', 'AIDS', 'AIMS', 'ALAN', 'ALLY', 'ALPS', 'AMID', 'ANNA', 'ANNE',
+    'ANTI', 'ARAB', 'ARCH', 'ARMS', 'ARMY', 'ARTS', 'ASIA', 'ATOM', 'AUTO', 'AWAY', 'BABY', 'BACK', 'BAIL', 'BALL',
+    'BAND', 'BANK', 'BASE', 'BASS', 'BATH', 'BEAM', 'BEAN', 'BEDS', 'BEEF', 'BEEN', 'BEER', 'BELL', 'BELT', 'BEND',
+    'BENT', 'BEST', 'BIAS', 'BIKE', 'BILL', 'BIND', 'BINS', 'BITS', 'BLOW', 'BOAT', 'BOMB', 'BOND', 'BOOT', 'BORE',
+    'BORN', 'BOSS', 'BOWL', 'BOYS', 'BRAD', 'BUCK', 'BUGS', 'BULK', 'BUMP', 'BURN', 'BUSH', 'BUST', 'BUSY', 'BUYS',
+    'CAFE', 'CAGE', 'CAKE', 'CALM', 'CAME', 'CAMP', 'CANE', 'CAPS', 'CARD', 'CARE', 'CARS', 'CART', 'CASE', 'CASH',
+    'CAST', 'CATS', 'CAVE', 'CELL', 'CHAR', 'CHAT', 'CHEF', 'CHIP', 'CITE', 'CLAY', 'CLIP', 'COAL', 'CODE', 'COIN',
+    'COKE', 'COLD', 'COME', 'CONE', 'COOK', 'COOL', 'COPE', 'COPS', 'CORD', 'CORE', 'CORN', 'COST', 'COUP', 'CREW',
+    'CROP', 'CUBE', 'CUPS', 'CURE', 'CUTS', 'DAMN', 'DARE', 'DARK', 'DAWN', 'DAYS', 'DEAD', 'DEAF', 'DEAL', 'DEAN',
+    'DEBT', 'DECK', 'DEER', 'DEMO', 'DENY', 'DESK', 'DIAL', 'DICE', 'DIED', 'DIET', 'DIME', 'DIRE', 'DIRT', 'DISH',
+    'DIVE', 'DOCK', 'DOES', 'DOGS', 'DOME', 'DONE', 'DOOM', 'DOSE', 'DOTS', 'DOWN', 'DOZE', 'DRAG', 'DREW', 'DROP',
+    'DRUG', 'DRUM', 'DUAL', 'DUCK', 'DUDE', 'DUEL', 'DUMB', 'DUMP', 'DUNE', 'DUSK', 'DUST', 'DUTY', 'EACH', 'EARL',
+    'EARN', 'EARS', 'EASE', 'EAST', 'EASY', 'EATS', 'ECHO', 'EGGS', 'ELSE', 'EMIT', 'ENDS', 'EPIC', 'EURO', 'EVEN',
+    'EVIL', 'EXAM', 'EXIT', 'EYES', 'FACE', 'FACT', 'FADE', 'FAIL', 'FAIR', 'FALL', 'FAME', 'FANS', 'FARE', 'FARM',
+    'FAST', 'FATE', 'FEAR', 'FEAT', 'FEED', 'FEEL', 'FEES', 'FEET', 'FELL', 'FELT', 'FERN', 'FEST', 'FEUD', 'FIAT',
+    'FIDO', 'FIGS', 'FILE', 'FILL', 'FILM', 'FIND', 'FINE', 'FINS', 'FIRE', 'FIRM', 'FISH', 'FIST', 'FITS', 'FIVE',
+    'FIZZ', 'FLAG', 'FLAP', 'FLAT', 'FLAW', 'FLED', 'FLEE', 'FLEW', 'FLIP', 'FLOW', 'FLUX', 'FOAM', 'FOES', 'FOLK',
+    'FOND', 'FONT', 'FOOD', 'FOOL', 'FOOT', 'FORD', 'FORE', 'FORK', 'FORM', 'FORT', 'FOUL', 'FOUR', 'FOWL', 'FREE',
+    'FROG', 'FROM', 'FUEL', 'FULL', 'FUND', 'FUNK', 'FURY', 'FUSE', 'FUSS', 'GAIN', 'GALE', 'GAME', 'GANG', 'GAPS',
+    'GATE', 'GAVE', 'GAZE', 'GEAR', 'GEEK', 'GEMS', 'GENE', 'GETS', 'GIFT', 'GIRL', 'GIVE', 'GLAD', 'GLOW', 'GLUE',
+    'GOAL', 'GOAT', 'GOES', 'GOLD', 'GOLF', 'GONE', 'GOOD', 'GRAB', 'GRAD', 'GRAM', 'GRAY', 'GREW', 'GRID', 'GRIM',
+    'GRIP', 'GROW', 'GULF', 'GURU', 'GUYS', 'HACK', 'HAIL', 'HAIR', 'HALF', 'HALL', 'HALT', 'HAND', 'HANG', 'HARD',
+    'HARM', 'HATE', 'HAVE', 'HAWK', 'HAZE', 'HEAD', 'HEAL', 'HEAP', 'HEAR', 'HEAT', 'HEEL', 'HEIR', 'HELD', 'HELL',
+    'HELP', 'HEMP', 'HERD', 'HERE', 'HERO', 'HIDE', 'HIGH', 'HIKE', 'HILL', 'HINT', 'HIRE', 'HITS', 'HIVE', 'HOAX',
+    'HOLD', 'HOLE', 'HOLY', 'HOME', 'HOOD', 'HOOK', 'HOPE', 'HORN', 'HOST', 'HOUR', 'HUGE', 'HULL', 'HUNG', 'HUNT',
+    'HURT', 'HYMN', 'IBEX', 'ICED', 'ICON', 'IDEA', 'IDLE', 'IDOL', 'INCH', 'INFO', 'INIT', 'IRON', 'ISLE', 'ITEM',
+    'JABS', 'JACK', 'JADE', 'JAIL', 'JANE', 'JAZZ', 'JEAN', 'JEST', 'JETS', 'JOBS', 'JOGS', 'JOIN', 'JOKE', 'JOLT',
+    'JOSE', 'JUMP', 'JUNE', 'JUNK', 'JURY', 'JUST', 'JUTE', 'KEEN', 'KEEP', 'KEPT', 'KEYS', 'KICK', 'KIDS', 'KILL',
+    'KIND', 'KING', 'KISS', 'KITE', 'KNEE', 'KNEW', 'KNIT', 'KNOT', 'KNOW', 'LABS', 'LACE', 'LACK', 'LADS', 'LADY',
+    'LAID', 'LAKE', 'LAMB', 'LAMP', 'LAND', 'LANE', 'LAPS', 'LAST', 'LATE', 'LAWN', 'LAZY', 'LEAD', 'LEAF', 'LEAK',
+    'LEAN', 'LEAP', 'LEFT', 'LEGS', 'LENS', 'LESS', 'LEST', 'LEVY', 'LIAR', 'LICE', 'LICK', 'LIDS', 'LIES', 'LIFE',
+    'LIFT', 'LIME', 'LIMP', 'LINE', 'LINK', 'LION', 'LIPS', 'LIST', 'LIVE', 'LOAN', 'LOBE', 'LOCK', 'LOGO', 'LONE',
+    'LONG', 'LOOK', 'LOOP', 'LORD', 'LOSE', 'LOSS', 'LOST', 'LOTS', 'LOUD', 'LOVE', 'LUCK', 'LUNG', 'LURE', 'LYNX',
+    'MADE', 'MAID', 'MAIL', 'MAIN', 'MAKE', 'MALE', 'MALL', 'MALT', 'MAMA', 'MANE', 'MANY', 'MAPS', 'MARE', 'MARK',
+    'MARS', 'MASK', 'MASS', 'MAST', 'MATE', 'MATH', 'MAYO', 'MAZE', 'MEAL', 'MEAN', 'MEAT', 'MEEK', 'MEET', 'MELT',
+    'MEMO', 'MEND', 'MENU', 'MERE', 'MESH', 'MESS', 'MICE', 'MILD', 'MILE', 'MILK', 'MILL', 'MIME', 'MIND', 'MINE',
+    'MINT', 'MISS', 'MIST', 'MITT', 'MOAN', 'MOAT', 'MOCK', 'MODE', 'MOLD', 'MOLE', 'MONK', 'MOOD', 'MOON', 'MOOR',
+    'MOPE', 'MOPS', 'MORE', 'MOSS', 'MOST', 'MOTH', 'MOVE', 'MUCH', 'MULE', 'MUST', 'MUTE', 'MYTH', 'NAIL', 'NAME',
+    'NAPE', 'NAVY', 'NEAR', 'NEAT', 'NECK', 'NEED', 'NEST', 'NEWS', 'NEXT', 'NICE', 'NICK', 'NINE', 'NODE', 'NOON',
+    'NORM', 'NOSE', 'NOTE', 'NUMB', 'NUTS', 'OAKS', 'OATH', 'OATS', 'OBEY', 'ODDS', 'OILS', 'OKAY', 'ONCE', 'ONLY',
+    'ONTO', 'OPEN', 'OPTS', 'ORAL', 'ORBS', 'OVAL', 'OVEN', 'OVER', 'OWES', 'OWLS', 'OWNS', 'PACE', 'PACK', 'PACT',
+    'PAGE', 'PAID', 'PAIL', 'PAIN', 'PAIR', 'PALE', 'PALM', 'PANE', 'PAPA', 'PARK', 'PART', 'PASS', 'PAST', 'PATH',
+    'PAVE', 'PAYS', 'PEAK', 'PEAR', 'PEAS', 'PEEK', 'PEEL', 'PEER', 'PENS', 'PEST', 'PETS', 'PICK', 'PIES', 'PILE',
+    'PILL', 'PINE', 'PINK', 'PINS', 'PIPE', 'PITS', 'PLAN', 'PLAY', 'PLEA', 'PLOT', 'PLUG', 'PLUS', 'POEM', 'POET',
+    'POLE', 'POLL', 'POLO', 'POND', 'POOL', 'POOR', 'POPE', 'PORK', 'PORT', 'POSE', 'POST', 'POUR', 'PREP', 'PREY',
+    'PROS', 'PUFF', 'PULL', 'PUMP', 'PUNK', 'PURE', 'PUSH', 'PUTS', 'QUAD', 'QUIZ', 'QUIT', 'RACE', 'RACK', 'RAGE',
+    'RAIL', 'RAIN', 'RANK', 'RARE', 'RATE', 'RAYS', 'READ', 'REAL', 'REAP', 'REAR', 'RELY', 'RENT', 'REST', 'RICE',
+    'RICH', 'RIDE', 'RIDS', 'RING', 'RINK', 'RIOT', 'RIPE', 'RISE', 'RISK', 'ROAD', 'ROAM', 'ROBE', 'ROCK', 'RODE',
+    'ROLE', 'ROLL', 'ROME', 'ROOF', 'ROOM', 'ROOT', 'ROPE', 'ROSE', 'ROTE', 'RUBS', 'RUDE', 'RULE', 'RUNS', 'RUSH',
+    'RUST', 'RUTH', 'SAFE', 'SAGE', 'SAID', 'SAIL', 'SAKE', 'SALE', 'SALT', 'SAME', 'SAND', 'SANE', 'SAVE', 'SCAN',
+    'SEAL', 'SEAM', 'SEAT', 'SEED', 'SEEK', 'SEEM', 'SEEN', 'SELF', 'SELL', 'SEND', 'SENT', 'SETS', 'SEWN', 'SHED',
+    'SHIP', 'SHOE', 'SHOP', 'SHOT', 'SHOW', 'SHUT', 'SICK', 'SIDE', 'SIGH', 'SIGN', 'SILK', 'SING', 'SINK', 'SITE',
+    'SIZE', 'SKIP', 'SKIN', 'SLAM', 'SLIP', 'SLOT', 'SLOW', 'SNAP', 'SNOW', 'SOAP', 'SOAR', 'SOCK', 'SODA', 'SOFA',
+    'SOFT', 'SOIL', 'SOLD', 'SOLE', 'SOME', 'SONG', 'SOON', 'SORE', 'SORT', 'SOUL', 'SOUP', 'SOUR', 'SPAN', 'SPIN',
+    'SPIT', 'SPOT', 'STAB', 'STAG', 'STAR', 'STAY', 'STEM', 'STEP', 'STEW', 'STIR', 'STOP', 'STUB', 'STUD', 'SUCH',
+    'SUIT', 'SUNG', 'SUNK', 'SURE', 'SURF', 'SWAP', 'SWIM', 'TABS', 'TACT', 'TAIL', 'TAKE', 'TALE', 'TALK', 'TALL',
+    'TAME', 'TANK', 'TAPE', 'TAPS', 'TART', 'TASK', 'TAXI', 'TEAM', 'TEAR', 'TELL', 'TEMP', 'TEND', 'TENT', 'TEST',
+    'TEXT', 'THAN', 'THAT', 'THAW', 'THEM', 'THEN', 'THEY', 'THIN', 'THIS', 'THUS', 'TIDE', 'TIED', 'TIES', 'TILE',
+    'TILL', 'TILT', 'TIME', 'TINY', 'TIPS', 'TIRE', 'TOAD', 'TOLL', 'TOMB', 'TONE', 'TOOK', 'TOOL', 'TOPS', 'TORN',
+    'TOUR', 'TOWN', 'TOYS', 'TRAP', 'TREE', 'TRIM', 'TRIO', 'TRIP', 'TRUE', 'TUBE', 'TUCK', 'TUNE', 'TURF', 'TURN',
+    'TWIN', 'TYPE', 'UNIT', 'UPON', 'URGE', 'USED', 'USER', 'USES', 'VARY', 'VAST', 'VEAL', 'VEIN', 'VERY', 'VEST',
+    'VETO', 'VICE', 'VIEW', 'VINE', 'VISA', 'VOID', 'VOTE', 'WADE', 'WAGE', 'WAIT', 'WAKE', 'WALK', 'WALL', 'WANT',
+    'WARD', 'WARM', 'WARN', 'WARP', 'WARS', 'WASH', 'WAVE', 'WAYS', 'WEAK', 'WEAR', 'WEEK', 'WELL', 'WENT', 'WERE',
+    'WEST', 'WHAT', 'WHEN', 'WHEY', 'WHIP', 'WHOM', 'WICK', 'WIDE', 'WIFE', 'WILD', 'WILL', 'WIND', 'WINE', 'WING',
+    'WINK', 'WINS', 'WIPE', 'WIRE', 'WISE', 'WISH', 'WITH', 'WOKE', 'WOLF', 'WOOD', 'WOOL', 'WORD', 'WORE', 'WORK',
+    'WORM', 'WORN', 'WRAP', 'YARD', 'YARN', 'YEAR', 'YELL', 'YOGA', 'YOUR', 'ZERO', 'ZEST', 'ZINC', 'ZONE', 'ZOOM'
+} | ADDITIONAL_FOUR_LETTER_WORDS
+
+# 5-letter words (Combining base + additional words)
+FIVE_LETTER_WORDS = {
+    'ABOUT', 'ABOVE', 'ABUSE', 'ACTOR', 'ACUTE', 'ADMIT', 'ADOPT', 'ADULT', 'AFTER', 'AGAIN', 'AGENT', 'AGREE',
+    'AHEAD', 'ALARM', 'ALBUM', 'ALERT', 'ALIEN', 'ALIGN', 'ALIKE', 'ALIVE', 'ALLOW', 'ALONE', 'ALONG', 'ALTER',
+    'ANGEL', 'ANGER', 'ANGLE', 'ANGRY', 'APART', 'APPLE', 'APPLY', 'ARENA', 'ARGUE', 'ARISE', 'ARRAY', 'ARROW',
+    'ASIDE', 'ASSET', 'AVOID', 'AWAKE', 'AWARD', 'AWARE', 'BADLY', 'BAKER', 'BASES', 'BASIC', 'BEACH', 'BEGAN',
+    'BEGIN', 'BEING', 'BELLY', 'BELOW', 'BENCH', 'BILLY', 'BIRTH', 'BLACK', 'BLAME', 'BLANK', 'BLAST', 'BLIND',
+    'BLOCK', 'BLOOD', 'BOARD', 'BOAST', 'BOBBY', 'BOUND', 'BRAIN', 'BRAND', 'BRASS', 'BRAVE', 'BREAD', 'BREAK',
+    'BREED', 'BRIEF', 'BRING', 'BROAD', 'BROKE', 'BROWN', 'BUILD', 'BUILT', 'BUYER', 'CABLE', 'CALIF', 'CARRY',
+    'CATCH', 'CAUSE', 'CHAIN', 'CHAIR', 'CHAOS', 'CHARM', 'CHART', 'CHASE', 'CHEAP', 'CHECK', 'CHEST', 'CHIEF',
+    'CHILD', 'CHINA', 'CHOSE', 'CIVIC', 'CIVIL', 'CLAIM', 'CLASS', 'CLEAN', 'CLEAR', 'CLICK', 'CLIMB', 'CLOCK',
+    'CLOSE', 'CLOUD', 'COACH', 'COAST', 'COULD', 'COUNT', 'COURT', 'COVER', 'CRAFT', 'CRASH', 'CRAZY', 'CREAM',
+    'CRIME', 'CROSS', 'CROWD', 'CROWN', 'CRUDE', 'CURVE', 'CYCLE', 'DAILY', 'DANCE', 'DATED', 'DEALT', 'DEATH',
+    'DEBUT', 'DELAY', 'DEPTH', 'DOING', 'DOUBT', 'DOZEN', 'DRAFT', 'DRAMA', 'DRANK', 'DRAWN', 'DREAM', 'DRESS',
+    'DRILL', 'DRINK', 'DRIVE', 'DROVE', 'DYING', 'EAGER', 'EARLY', 'EARTH', 'EIGHT', 'ELITE', 'EMPTY', 'ENEMY',
+    'ENJOY', 'ENTER', 'ENTRY', 'EQUAL', 'ERROR', 'EVENT', 'EVERY', 'EXACT', 'EXIST', 'EXTRA', 'FAITH', 'FALSE',
+    'FAULT', 'FIBER', 'FIBRE', 'FIELD', 'FIFTH', 'FIFTY', 'FIGHT', 'FINAL', 'FIRST', 'FIXED', 'FLASH', 'FLEET',
+    'FLOOR', 'FLUID', 'FOCUS', 'FORCE', 'FORTH', 'FORTY', 'FORUM', 'FOUND', 'FRAME', 'FRANK', 'FRAUD', 'FRESH',
+    'FRONT', 'FROST', 'FRUIT', 'FULLY', 'FUNNY', 'GIANT', 'GIVEN', 'GLASS', 'GLOBE', 'GLORY', 'GOODS', 'GRACE',
+    'GRADE', 'GRAIN', 'GRAND', 'GRANT', 'GRASS', 'GRAVE', 'GREAT', 'GREEN', 'GROSS', 'GROUP', 'GROWN', 'GUARD',
+    'GUESS', 'GUEST', 'GUIDE', 'HAPPY', 'HARRY', 'HEART', 'HEAVY', 'HENRY', 'HORSE', 'HOTEL', 'HOUSE', 'HUMAN',
+    'IDEAL', 'IMAGE', 'INDEX', 'INNER', 'INPUT', 'ISSUE', 'JAPAN', 'JIMMY', 'JOINT', 'JONES', 'JUDGE', 'KNOWN',
+    'LABEL', 'LARGE', 'LASER', 'LATER', 'LAUGH', 'LAYER', 'LEARN', 'LEASE', 'LEAST', 'LEAVE', 'LEGAL', 'LEVEL',
+    'LEWIS', 'LIGHT', 'LIMIT', 'LINKS', 'LIVES', 'LOCAL', 'LOOSE', 'LOWER', 'LUCKY', 'LUNCH', 'LYING', 'MAGIC',
+    'MAJOR', 'MAKER', 'MARCH', 'MARIA', 'MATCH', 'MAYBE', 'MAYOR', 'MEANT', 'MEDIA', 'METAL', 'MIGHT', 'MINOR',
+    'MINUS', 'MIXED', 'MODEL', 'MONEY', 'MONTH', 'MORAL', 'MOTOR', 'MOUNT', 'MOUSE', 'MOUTH', 'MOVED', 'MOVIE',
+    'MUSIC', 'NEEDS', 'NEVER', 'NEWLY', 'NIGHT', 'NOISE', 'NORTH', 'NOTED', 'NOVEL', 'NURSE', 'OCCUR', 'OCEAN',
+    'OFFER', 'OFTEN', 'ORDER', 'OTHER', 'OUGHT', 'PAINT', 'PANEL', 'PAPER', 'PARIS', 'PARTY', 'PEACE', 'PETER',
+    'PHASE', 'PHONE', 'PHOTO', 'PIANO', 'PIECE', 'PILOT', 'PITCH', 'PLACE', 'PLAIN', 'PLANE', 'PLANT', 'PLATE',
+    'POINT', 'POUND', 'POWER', 'PRESS', 'PRICE', 'PRIDE', 'PRIME', 'PRINT', 'PRIOR', 'PRIZE', 'PROOF', 'PROUD',
+    'PROVE', 'QUEEN', 'QUICK', 'QUIET', 'QUITE', 'RADIO', 'RAISE', 'RANGE', 'RAPID', 'RATIO', 'REACH', 'READY',
+    'REALM', 'REBEL', 'REFER', 'RELAX', 'REPAY', 'REPLY', 'RIGHT', 'RIVAL', 'RIVER', 'ROBIN', 'ROGER', 'ROMAN',
+    'ROUGH', 'ROUND', 'ROUTE', 'ROYAL', 'RURAL', 'SCALE', 'SCENE', 'SCOPE', 'SCORE', 'SENSE', 'SERVE', 'SETUP',
+    'SEVEN', 'SHALL', 'SHAPE', 'SHARE', 'SHARP', 'SHEET', 'SHELF', 'SHELL', 'SHIFT', 'SHINE', 'SHIRT', 'SHOCK',
+    'SHOOT', 'SHORT', 'SHOWN', 'SIGHT', 'SIMON', 'SIXTH', 'SIXTY', 'SIZED', 'SKILL', 'SLEEP', 'SLIDE', 'SMALL',
+    'SMART', 'SMILE', 'SMITH', 'SMOKE', 'SNAKE', 'SNOW', 'SOLAR', 'SOLID', 'SOLVE', 'SORRY', 'SOUND', 'SOUTH',
+    'SPACE', 'SPARE', 'SPEAK', 'SPEED', 'SPEND', 'SPENT', 'SPLIT', 'SPOKE', 'SPORT', 'SQUAD', 'STAFF', 'STAGE',
+    'STAKE', 'STAND', 'START', 'STATE', 'STEAM', 'STEEL', 'STEEP', 'STEER', 'STICK', 'STILL', 'STOCK', 'STONE',
+    'STOOD', 'STORE', 'STORM', 'STORY', 'STRIP', 'STUCK', 'STUDY', 'STUFF', 'STYLE', 'SUGAR', 'SUITE', 'SUPER',
+    'SWEET', 'SWIFT', 'SWING', 'SWISS', 'TABLE', 'TAKEN', 'TASTE', 'TAXES', 'TEACH', 'TEETH', 'TERRY', 'TEXAS',
+    'THANK', 'THEFT', 'THEIR', 'THEME', 'THERE', 'THESE', 'THICK', 'THING', 'THINK', 'THIRD', 'THOSE', 'THREE',
+    'THREW', 'THROW', 'THUMB', 'TIGER', 'TIGHT', 'TIRED', 'TITLE', 'TODAY', 'TOKEN', 'TOMMY', 'TOPIC', 'TOTAL',
+    'TOUCH', 'TOUGH', 'TOWER', 'TRACK', 'TRADE', 'TRAIN', 'TREAT', 'TREND', 'TRIAL', 'TRIBE', 'TRICK', 'TRIED',
+    'TRIES', 'TRUCK', 'TRULY', 'TRUNK', 'TRUST', 'TRUTH', 'TWICE', 'TWIST', 'TYLER', 'UNCLE', 'UNDUE', 'UNION',
+    'UNITY', 'UNTIL', 'UPPER', 'UPSET', 'URBAN', 'USAGE', 'USUAL', 'VALUE', 'VIDEO', 'VIRUS', 'VISIT', 'VITAL',
+    'VOCAL', 'VOICE', 'WASTE', 'WATCH', 'WATER', 'WHEEL', 'WHERE', 'WHICH', 'WHILE', 'WHITE', 'WHOLE', 'WHOSE',
+    'WIDOW', 'WIDTH', 'WOMAN', 'WOMEN', 'WORLD', 'WORRY', 'WORSE', 'WORST', 'WORTH', 'WOULD', 'WRITE', 'WRONG',
+    'WROTE', 'YARDS', 'YEAH', 'YOUNG', 'YOURS', 'YOUTH', 'ACTOR', 'ADULT', 'ALBUM', 'ALIEN', 'ALPHA', 'AMBER',
+    'ANGEL', 'ANIMAL', 'ANKLE', 'APPLE', 'ARENA', 'ARMOR', 'ARROW', 'ATLAS', 'BADGE', 'BASIC', 'BEACH', 'BENCH',
+    'BERRY', 'BIRTH', 'BLANK', 'BLAST', 'BLIND', 'BLOCK', 'BLOOM', 'BOARD', 'BONUS', 'BOOTH', 'BOUND', 'BOXER',
+    'BRAIN', 'BRAND', 'BRAVE', 'BREAD', 'BREAK', 'BRICK', 'BRIDE', 'BRIEF', 'BRING', 'BROAD', 'BROKE', 'BROWN',
+    'BRUSH', 'BUILD', 'BUNCH', 'BUYER', 'CABLE', 'CANDY', 'CARGO', 'CARRY', 'CATCH', 'CAUSE', 'CHAIR', 'CHAOS',
+    'CHARM', 'CHART', 'CHASE', 'CHEAP', 'CHECK', 'CHEST', 'CHILD', 'CHINA', 'CHOSE', 'CLAIM', 'CLASS', 'CLEAN',
+    'CLEAR', 'CLICK', 'CLIMB', 'CLOCK', 'CLOSE', 'CLOTH', 'CLOUD', 'COACH', 'COAST', 'COLON', 'COLOR', 'COMET',
+    'CORAL', 'COUCH', 'COUNT', 'COURT', 'COVER', 'CRAFT', 'CRANE', 'CRASH', 'CRAZY', 'CREAM', 'CREEK', 'CRIME',
+    'CRISP', 'CROSS', 'CROWD', 'CROWN', 'CRUDE', 'CRUSH', 'CURVE', 'CYCLE', 'DAILY', 'DANCE', 'DATED', 'DEALT',
+    'DEATH', 'DEBUT', 'DELAY', 'DEMON', 'DENSE', 'DEPOT', 'DEPTH', 'DERBY', 'DESK', 'DEVIL', 'DIARY', 'DIGIT',
+    'DINER', 'DIRTY', 'DISCO', 'DOING', 'DONOR', 'DOUBT', 'DOZEN', 'DRAFT', 'DRAIN', 'DRAMA', 'DRANK', 'DRAWN',
+    'DREAM', 'DRESS', 'DRIED', 'DRILL', 'DRINK', 'DRIVE', 'DRONE', 'DROVE', 'DRUNK', 'DRIED', 'DYING', 'EAGER',
+    'EAGLE', 'EARLY', 'EARTH', 'EIGHT', 'ELDER', 'ELITE', 'EMPTY', 'ENEMY', 'ENJOY', 'ENTER', 'ENTRY', 'EQUAL',
+    'ERROR', 'EVENT', 'EVERY', 'EXACT', 'EXCEL', 'EXIST', 'EXTRA', 'FABLE', 'FAITH', 'FALSE', 'FANCY', 'FATAL',
+    'FAULT', 'FAVOR', 'FENCE', 'FERRY', 'FIBER', 'FIELD', 'FIERY', 'FIFTH', 'FIFTY', 'FIGHT', 'FINAL', 'FIRST',
+    'FIXED', 'FLAME', 'FLASH', 'FLEET', 'FLESH', 'FLOAT', 'FLOOD', 'FLOOR', 'FLOUR', 'FLUID', 'FOCUS', 'FORCE',
+    'FORGE', 'FORTH', 'FORTY', 'FORUM', 'FOUND', 'FRAME', 'FRANK', 'FRAUD', 'FRESH', 'FRIED', 'FRONT', 'FROST',
+    'FRUIT', 'FULLY', 'FUNNY', 'FUZZY', 'GAINS', 'GAMMA', 'GATES', 'GAUGE', 'GHOST', 'GIANT', 'GIVEN', 'GLASS',
+    'GLEAM', 'GLOBE', 'GLORY', 'GLOVE', 'GOODS', 'GRACE', 'GRADE', 'GRAIN', 'GRAND', 'GRANT', 'GRAPE', 'GRASS',
+    'GRAVE', 'GREAT', 'GREED', 'GREEN', 'GREET', 'GRIEF', 'GRILL', 'GRIND', 'GROAN', 'GROSS', 'GROUP', 'GROWN',
+    'GUARD', 'GUESS', 'GUEST', 'GUIDE', 'GUILD', 'GUILT', 'HAPPY', 'HARSH', 'HASTE', 'HEARD', 'HEART', 'HEAVY',
+    'HEDGE', 'HENCE', 'HENRY', 'HERBS', 'HILLS', 'HINGE', 'HITCH', 'HOBBY', 'HONEY', 'HONOR', 'HOPES', 'HORSE',
+    'HOTEL', 'HOUSE', 'HOVER', 'HUMAN', 'HUMOR', 'HURRY', 'IDEAL', 'IMAGE', 'IMPLY', 'INDEX', 'INDIE', 'INNER',
+    'INPUT', 'INTEL', 'INTER', 'INTRO', 'IRONY', 'ISSUE', 'IVORY', 'JAPAN', 'JEANS', 'JERRY', 'JIMMY', 'JOINT',
+    'JONES', 'JUDGE', 'JUICE', 'JUMBO', 'JUNKY', 'KARMA', 'KEEPS', 'KENNY', 'KNIFE', 'KNOCK', 'KNOWN', 'LABEL',
+    'LABOR', 'LANCE', 'LANDS', 'LARGE', 'LASER', 'LATER', 'LAUGH', 'LAYER', 'LEADS', 'LEARN', 'LEASE', 'LEAST',
+    'LEAVE', 'LEDGE', 'LEGAL', 'LEMON', 'LEVEL', 'LEWIS', 'LIGHT', 'LIMIT', 'LINED', 'LINKS', 'LIONS', 'LISTS',
+    'LIVED', 'LIVES', 'LOADS', 'LOANS', 'LOCAL', 'LOCKS', 'LOGIC', 'LOOSE', 'LORDS', 'LOSES', 'LOVED', 'LOVER',
+    'LOVES', 'LOWER', 'LOYAL', 'LUCKY', 'LUNCH', 'LYING', 'MAGIC', 'MAJOR', 'MAKER', 'MALES', 'MANGA', 'MAPLE',
+    'MARCH', 'MARIA', 'MARKS', 'MARRY', 'MASON', 'MATCH', 'MATES', 'MATHS', 'MAYBE', 'MAYOR', 'MEALS', 'MEANS',
+    'MEANT', 'MEATS', 'MEDAL', 'MEDIA', 'MELON', 'MEMES', 'MERCY', 'MERGE', 'MERIT', 'MERRY', 'METAL', 'METER',
+    'MICRO', 'MIDST', 'MIGHT', 'MILES', 'MINDS', 'MINES', 'MINOR', 'MINUS', 'MIXED', 'MODAL', 'MODEL', 'MODES',
+    'MODEM', 'MONEY', 'MONKS', 'MONTH', 'MOODS', 'MORAL', 'MOSES', 'MOTOR', 'MOTTO', 'MOULD', 'MOUND', 'MOUNT',
+    'MOUSE', 'MOUTH', 'MOVED', 'MOVES', 'MOVIE', 'MUSIC', 'MYTHS', 'NAMED', 'NAMES', 'NANCY', 'NASTY', 'NEEDS',
+    'NERVE', 'NEVER', 'NEWLY', 'NIGHT', 'NINE', 'NODES', 'NOISE', 'NORMS', 'NORTH', 'NOTED', 'NOTES', 'NOVEL',
+    'NURSE', 'OATHS', 'OCCUR', 'OCEAN', 'ODDS', 'OFFER', 'OFTEN', 'OLDER', 'OLIVE', 'OPENS', 'OPERA', 'ORDER',
+    'ORGAN', 'OTHER', 'OUGHT', 'OUTER', 'OWNED', 'OWNER', 'PAGES', 'PAINS', 'PAINT', 'PAIRS', 'PALMS', 'PANEL',
+    'PANIC', 'PANTS', 'PAPA', 'PAPER', 'PARIS', 'PARKS', 'PARTS', 'PARTY', 'PASTA', 'PASTE', 'PATCH', 'PATHS',
+    'PAUSE', 'PEACE', 'PEACH', 'PEAKS', 'PEARL', 'PEERS', 'PENNY', 'PERKS', 'PETER', 'PHASE', 'PHONE', 'PHOTO',
+    'PIANO', 'PIECE', 'PILES', 'PILOT', 'PINCH', 'PIPES', 'PITCH', 'PIZZA', 'PLACE', 'PLAIN', 'PLANE', 'PLANS',
+    'PLANT', 'PLATE', 'PLAYS', 'PLAZA', 'PLOTS', 'POEMS', 'POETS', 'POINT', 'POLES', 'POOLS', 'PORCH', 'POSES',
+    'POUND', 'POWER', 'PRESS', 'PRICE', 'PRIDE', 'PRIME', 'PRINT', 'PRIOR', 'PRIZE', 'PROOF', 'PROPS', 'PROUD',
+    'PROVE', 'PROXY', 'PSALM', 'PULLS', 'PULSE', 'PUMPS', 'PUNCH', 'PURSE', 'QUEEN', 'QUERY', 'QUEST', 'QUEUE',
+    'QUICK', 'QUIET', 'QUILT', 'QUITE', 'QUOTA', 'QUOTE', 'RADIO', 'RAILS', 'RAINS', 'RAISE', 'RANKS', 'RAPID',
+    'RATES', 'RATIO', 'REACH', 'READS', 'READY', 'REALM', 'REBEL', 'REFER', 'REIGN', 'RELAX', 'RELAY', 'REMIT',
+    'REPAY', 'REPLY', 'RESET', 'RIGHT', 'RINGS', 'RISES', 'RISKS', 'RIVAL', 'RIVER', 'ROADS', 'ROAST', 'ROBIN',
+    'ROBOT', 'ROCKS', 'ROGER', 'ROLES', 'ROLLS', 'ROMAN', 'ROOMS', 'ROOTS', 'ROSES', 'ROUGH', 'ROUND', 'ROUTE',
+    'ROYAL', 'RUINS', 'RULES', 'RURAL', 'SAFER', 'SAINT', 'SALES', 'SALTS', 'SANDY', 'SAUCE', 'SAVES', 'SCALE',
+    'SCARE', 'SCENE', 'SCOPE', 'SCORE', 'SCOTS', 'SCRUB', 'SEALS', 'SEATS', 'SEEDS', 'SEEKS', 'SEEMS', 'SELLS',
+    'SENDS', 'SENSE', 'SERVE', 'SETUP', 'SEVEN', 'SHADE', 'SHAFT', 'SHAKE', 'SHALL', 'SHAME', 'SHAPE', 'SHARE',
+    'SHARK', 'SHARP', 'SHAVE', 'SHEET', 'SHELF', 'SHELL', 'SHINE', 'SHIPS', 'SHIRT', 'SHOCK', 'SHOES', 'SHOOT',
+    'SHOPS', 'SHORT', 'SHOTS', 'SHOUT', 'SHOWN', 'SHOWS', 'SIDES', 'SIGHT', 'SIGNS', 'SILLY', 'SIMON', 'SINCE',
+    'SINGS', 'SITES', 'SIXTH', 'SIXTY', 'SIZED', 'SIZES', 'SKILL', 'SKINS', 'SKULL', 'SLATE', 'SLAVE', 'SLEEP',
+    'SLICE', 'SLIDE', 'SLOPE', 'SMALL', 'SMART', 'SMILE', 'SMITH', 'SMOKE', 'SNAKE', 'SNAPS', 'SNEAK', 'SNOW',
+    'SOCKS', 'SOLAR', 'SOLID', 'SOLVE', 'SONGS', 'SORRY', 'SORTS', 'SOULS', 'SOUND', 'SOUTH', 'SPACE', 'SPARE',
+    'SPARK', 'SPEAK', 'SPECS', 'SPEED', 'SPELL', 'SPEND', 'SPENT', 'SPINE', 'SPLIT', 'SPOKE', 'SPORT', 'SPOTS',
+    'SPRAY', 'SQUAD', 'STACK', 'STAFF', 'STAGE', 'STAKE', 'STALL', 'STAMP', 'STAND', 'STARS', 'START', 'STATE',
+    'STAYS', 'STEAL', 'STEAM', 'STEEL', 'STEEP', 'STEER', 'STEMS', 'STEPS', 'STERN', 'STICK', 'STILL', 'STING',
+    'STOCK', 'STONE', 'STOOD', 'STOPS', 'STORE', 'STORM', 'STORY', 'STRIP', 'STUCK', 'STUDY', 'STUFF', 'STYLE',
+    'SUGAR', 'SUITE', 'SUPER', 'SWEAR', 'SWEEP', 'SWEET', 'SWIFT', 'SWING', 'SWISS', 'SWORD', 'TABLE', 'TAKEN',
+    'TAKES', 'TALES', 'TALKS', 'TANKS', 'TAPES', 'TASKS', 'TASTE', 'TAXES', 'TEACH', 'TEAMS', 'TEARS', 'TEENS',
+    'TEETH', 'TELLS', 'TERMS', 'TERRY', 'TESTS', 'TEXAS', 'TEXTS', 'THANK', 'THEFT', 'THEIR', 'THEME', 'THERE',
+    'THESE', 'THICK', 'THING', 'THINK', 'THIRD', 'THOSE', 'THREE', 'THREW', 'THROW', 'THUMB', 'TIGER', 'TIGHT',
+    'TILES', 'TIMES', 'TINY', 'TIRED', 'TITLE', 'TODAY', 'TOKEN', 'TOMMY', 'TOOLS', 'TOPIC', 'TOTAL', 'TOUCH',
+    'TOUGH', 'TOURS', 'TOWER', 'TOWNS', 'TOYS', 'TRACK', 'TRADE', 'TRAIL', 'TRAIN', 'TRAIT', 'TRASH', 'TREAT',
+    'TREES', 'TREND', 'TRIAL', 'TRIBE', 'TRICK', 'TRIED', 'TRIES', 'TRIPS', 'TRUCK', 'TRULY', 'TRUMP', 'TRUNK',
+    'TRUST', 'TRUTH', 'TUBES', 'TUNED', 'TURNS', 'TWICE', 'TWIST', 'TYLER', 'TYPES', 'ULTRA', 'UNCLE', 'UNDER',
+    'UNDUE', 'UNION', 'UNITS', 'UNITY', 'UNTIL', 'UPPER', 'UPSET', 'URBAN', 'URGED', 'USAGE', 'USERS', 'USES',
+    'USUAL', 'VALUE', 'VENUE', 'VERSO', 'VIDEO', 'VIEWS', 'VINYL', 'VIRUS', 'VISIT', 'VITAL', 'VOCAL', 'VOICE',
+    'VOTED', 'VOTES', 'WAGES', 'WAIST', 'WALKS', 'WALLS', 'WANTS', 'WARNS', 'WASTE', 'WATCH', 'WATER', 'WAVES',
+    'WEEKS', 'WEIRD', 'WELLS', 'WHEEL', 'WHERE', 'WHICH', 'WHILE', 'WHITE', 'WHOLE', 'WHOSE', 'WIDER', 'WIDOW',
+    'WIDTH', 'WINDS', 'WINES', 'WINGS', 'WIPES', 'WIRED', 'WIRES', 'WITCH', 'WIVES', 'WOMAN', 'WOMEN', 'WOODS',
+    'WORDS', 'WORKS', 'WORLD', 'WORMS', 'WORRY', 'WORSE', 'WORST', 'WORTH', 'WOULD', 'WRIST', 'WRITE', 'WRONG',
+    'WROTE', 'YARDS', 'YEARS', 'YOUNG', 'YOURS', 'YOUTH', 'ZONES'
+} | ADDITIONAL_FIVE_LETTER_WORDS
+
+# 6-letter words (Combining base + additional words)
+SIX_LETTER_WORDS = {
+    'ACCEPT', 'ACCESS', 'ACCORD', 'ACROSS', 'ACTION', 'ACTIVE', 'ACTUAL', 'ADJUST', 'ADVICE', 'ADVISE', 'AFFECT',
+    'AFFORD', 'AFRAID', 'AFRICA', 'AGENCY', 'AGENDA', 'AGREED', 'ALMOST', 'ALWAYS', 'AMOUNT', 'ANIMAL', 'ANNUAL',
+    'ANSWER', 'ANYONE', 'ANYWAY', 'APPEAR', 'AROUND', 'ARRIVE', 'ARTIST', 'ASPECT', 'ASSUME', 'ATTACK', 'ATTEND',
+    'AUGUST', 'AUTHOR', 'AVENUE', 'BANNED', 'BATTLE', 'BEAUTY', 'BECAME', 'BECOME', 'BEFORE', 'BEHALF', 'BEHAVE',
+    'BEHIND', 'BELIEF', 'BELONG', 'BESIDE', 'BETTER', 'BETWEEN', 'BEYOND', 'BISHOP', 'BLOODY', 'BORDER', 'BOTTLE',
+    'BOTTOM', 'BOUGHT', 'BRANCH', 'BREATH', 'BRIDGE', 'BRIGHT', 'BRINGS', 'BROKEN', 'BUDGET', 'BURDEN', 'BUREAU',
+    'BUTTON', 'CAMERA', 'CANCER', 'CANNOT', 'CANVAS', 'CAREER', 'CARING', 'CASTLE', 'CASUAL', 'CAUGHT', 'CAUSED',
+    'CENTRE', 'CHANCE', 'CHANGE', 'CHARGE', 'CHOSEN', 'CHURCH', 'CIRCLE', 'CLIENT', 'CLOSED', 'CLOSER', 'COFFEE',
+    'COLUMN', 'COMBAT', 'COMING', 'COMMON', 'COMPLY', 'COPPER', 'CORNER', 'COSTLY', 'COUNTY', 'COUPLE', 'COURSE',
+    'COVERS', 'CREATE', 'CREDIT', 'CRISIS', 'CUSTOM', 'DAMAGE', 'DANGER', 'DEALER', 'DEBATE', 'DECADE', 'DECIDE',
+    'DEFEAT', 'DEFEND', 'DEFINE', 'DEGREE', 'DELIVER', 'DEMAND', 'DEPEND', 'DEPUTY', 'DESERT', 'DESIGN', 'DESIRE',
+    'DETAIL', 'DETECT', 'DEVICE', 'DIFFER', 'DINNER', 'DIRECT', 'DOCTOR', 'DOLLAR', 'DOMAIN', 'DOUBLE', 'DRAGON',
+    'DRAWER', 'DRIVER', 'DURING', 'EASILY', 'EATING', 'EDITOR', 'EFFECT', 'EFFORT', 'EIGHTH', 'EITHER', 'ELEVEN',
+    'EMPIRE', 'EMPLOY', 'ENABLE', 'ENDING', 'ENERGY', 'ENGINE', 'ENOUGH', 'ENSURE', 'ENTIRE', 'EQUITY', 'ERROR',
+    'ESCAPE', 'ESTATE', 'ETHNIC', 'EUROPE', 'EVENTS', 'EXCEPT', 'EXCUSE', 'EXPAND', 'EXPECT', 'EXPERT', 'EXPORT',
+    'EXTEND', 'EXTENT', 'FABRIC', 'FACIAL', 'FACTOR', 'FAILED', 'FAIRLY', 'FALLEN', 'FAMILY', 'FAMOUS', 'FATHER',
+    'FAULTY', 'FEATURE', 'FELLOW', 'FEMALE', 'FIGURE', 'FILING', 'FINGER', 'FINISH', 'FISCAL', 'FLIGHT', 'FLOWER',
+    'FLYING', 'FOLDER', 'FOLLOW', 'FORGET', 'FORMAT', 'FORMER', 'FOUGHT', 'FOURTH', 'FRIDAY', 'FRIEND', 'FROZEN',
+    'FUTURE', 'GALAXY', 'GARAGE', 'GARDEN', 'GATHER', 'GENDER', 'GENTLE', 'GERMAN', 'GLOBAL', 'GOLDEN', 'GROUND',
+    'GROWTH', 'GUITAR', 'HANDED', 'HANDLE', 'HAPPEN', 'HARDLY', 'HEADED', 'HEALTH', 'HEATED', 'HEIGHT', 'HELPED',
+    'HEREBY', 'HIDDEN', 'HOLDER', 'HOPING', 'HORROR', 'HORSES', 'HOTELS', 'HOURS', 'HOUSES', 'HOWEVER', 'HUNGER',
+    'HUNTER', 'HURRIED', 'HUSHED', 'HYBRID', 'IGNORE', 'IMPACT', 'IMPORT', 'INCOME', 'INDEED', 'INDIAN', 'INDOOR',
+    'INFANT', 'INFORM', 'INJECT', 'INJURY', 'INLINE', 'INSECT', 'INSIDE', 'INSIST', 'INTAKE', 'INTEND', 'INTENT',
+    'INVEST', 'INVITE', 'ISLAND', 'ITSELF', 'JACKET', 'JOINED', 'JUNIOR', 'KILLED', 'KILLER', 'KINDLY', 'LADIES',
+    'LAPTOP', 'LARGER', 'LATEST', 'LATTER', 'LAUNCH', 'LAWYER', 'LEADER', 'LEAGUE', 'LEARNS', 'LEGACY', 'LENGTH',
+    'LESSON', 'LETTER', 'LIFTED', 'LIKELY', 'LINKED', 'LIQUID', 'LISTEN', 'LITTLE', 'LIVING', 'LOCKED', 'LONDON',
+    'LONGER', 'LOOKED', 'LOSING', 'LOVELY', 'LOVING', 'LUCKY', 'LUMBER', 'LUXURY', 'LYRICS', 'MACHINE', 'MAINLY',
+    'MAKING', 'MANAGE', 'MANNER', 'MARBLE', 'MARGIN', 'MARINE', 'MARKED', 'MARKER', 'MARKET', 'MARTIN', 'MASTER',
+    'MATTER', 'MATURE', 'MEDALS', 'MEDIUM', 'MEMBER', 'MEMORY', 'MENTAL', 'MERELY', 'MERGER', 'METHOD', 'METRIC',
+    'MIDDLE', 'MILLER', 'MINING', 'MINUTE', 'MIRROR', 'MOBILE', 'MODERN', 'MODIFY', 'MODULE', 'MOMENT', 'MONDAY',
+    'MONTHS', 'MOSTLY', 'MOTHER', 'MOTION', 'MOVIES', 'MOVING', 'MURDER', 'MUSCLE', 'MUSEUM', 'MUTUAL', 'MYSELF',
+    'NATION', 'NATIVE', 'NATURE', 'NEARBY', 'NEARLY', 'NEEDED', 'NEPHEW', 'NICELY', 'NIGHTS', 'NOBODY', 'NORMAL',
+    'NOTICE', 'NOTION', 'NOVELS', 'NUMBER', 'NURSES', 'OBJECT', 'OBTAIN', 'OBVIOUS', 'OCCUPY', 'OCCURS', 'OFFICE',
+    'OFFSET', 'ONLINE', 'OPENED', 'OPTION', 'ORANGE', 'ORDERS', 'ORIGIN', 'OUTPUT', 'OUTSET', 'OXYGEN', 'PACKED',
+    'PALACE', 'PANELS', 'PAPERS', 'PARADE', 'PARENT', 'PARTLY', 'PASSED', 'PATENT', 'PATROL', 'PAYING', 'PEACE',
+    'PEOPLE', 'PERIOD', 'PERMIT', 'PERSON', 'PHONES', 'PHOTOS', 'PHRASE', 'PICKED', 'PIECES', 'PLACED', 'PLACES',
+    'PLANET', 'PLANTS', 'PLATES', 'PLAYED', 'PLAYER', 'PLEASE', 'PLENTY', 'POCKET', 'POINTS', 'POLICE', 'POLICY',
+    'POLISH', 'POORLY', 'PORTER', 'POSTED', 'POTATO', 'POWDER', 'POWERS', 'PRAISE', 'PRAYER', 'PREFER', 'PRETTY',
+    'PRICES', 'PRIME', 'PRINCE', 'PRINTS', 'PRISON', 'PROFIT', 'PROPER', 'PROVEN', 'PUBLIC', 'PUERTO', 'PURPLE',
+    'PURSUE', 'PUSHED', 'PUZZLE', 'QUEENS', 'QUOTES', 'RACING', 'RARELY', 'RATHER', 'RATING', 'REALLY', 'REASON',
+    'REBELS', 'RECALL', 'RECENT', 'RECORD', 'REDUCE', 'REFORM', 'REFUSE', 'REGARD', 'REGION', 'RELATE', 'RELIED',
+    'RELIEF', 'REMAIN', 'REMOTE', 'REMOVE', 'REPAIR', 'REPEAT', 'REPLACE', 'REPLY', 'REPORT', 'RESCUE', 'RESULT',
+    'RETAIL', 'RETIRE', 'RETURN', 'REVEAL', 'REVIEW', 'REVOLT', 'REWARD', 'RIDING', 'RIGHTS', 'RISING', 'ROBUST',
+    'ROCKET', 'ROLLED', 'RONALD', 'ROSTER', 'ROTATE', 'ROUTER', 'RUBBER', 'RULING', 'RUMORS', 'RUNNER', 'RUSHED',
+    'RUSSIA', 'SACRED', 'SADDLE', 'SAFELY', 'SAFETY', 'SAILED', 'SALARY', 'SAMPLE', 'SAVING', 'SAYING', 'SCALES',
+    'SCARED', 'SCENES', 'SCHEME', 'SCHOOL', 'SCORES', 'SCREEN', 'SCRIPT', 'SEARCH', 'SEASON', 'SECOND', 'SECRET',
+    'SECTOR', 'SECURE', 'SEEING', 'SELDOM', 'SELECT', 'SENATE', 'SENIOR', 'SEQUEL', 'SERIES', 'SERVED', 'SERVER',
+    'SETTLE', 'SEVERE', 'SHADOW', 'SHARED', 'SHEETS', 'SHIELD', 'SHIRTS', 'SHORTS', 'SHOULD', 'SHOWED', 'SHOWER',
+    'SHRINK', 'SHUTUP', 'SIGNED', 'SILENT', 'SILVER', 'SIMPLE', 'SIMPLY', 'SINGLE', 'SISTER', 'SITTING', 'SLIGHT',
+    'SLOWLY', 'SMALLER', 'SMOOTH', 'SOCCER', 'SOCIAL', 'SOCKET', 'SODIUM', 'SOFTER', 'SOLELY', 'SOLVED', 'SOMEWHAT',
+    'SOUNDS', 'SOURCE', 'SOVIET', 'SPEAKS', 'SPEECH', 'SPIRIT', 'SPOKEN', 'SPORTS', 'SPREAD', 'SPRING', 'SQUARE',
+    'STABLE', 'STAGED', 'STAIRS', 'STANCE', 'STANDS', 'STARTS', 'STATED', 'STATES', 'STATIC', 'STATUS', 'STAYED',
+    'STEADY', 'STOLEN', 'STONES', 'STORAGE', 'STORED', 'STORES', 'STORMS', 'STRAND', 'STREAM', 'STREET', 'STRESS',
+    'STRICT', 'STRIKE', 'STRING', 'STRONG', 'STRUCK', 'STUDIO', 'STUPID', 'STYLES', 'SUBMIT', 'SUDDEN', 'SUFFER',
+    'SUMMER', 'SUNDAY', 'SUPPLY', 'SURELY', 'SURVEY', 'SWITCH', 'SYMBOL', 'SYSTEM', 'TABLES', 'TACKLE', 'TAKING',
+    'TALENT', 'TALKED', 'TARGET', 'TAUGHT', 'TEMPLE', 'TENDER', 'TENNIS', 'TERRIBLE', 'THANKS', 'THEORY', 'THIRTY',
+    'THOUGH', 'THREAD', 'THREAT', 'THRONE', 'THROWN', 'THRUST', 'TICKET', 'TIMBER', 'TIMING', 'TISSUE', 'TITLES',
+    'TOILET', 'TOMATO', 'TONGUE', 'TOPICS', 'TOWARD', 'TRACKS', 'TRADED', 'TRAGIC', 'TRAVEL', 'TREATY', 'TROOPS',
+    'TROPHY', 'TRUCKS', 'TURNED', 'TWELVE', 'TWENTY', 'TYPING', 'UNABLE', 'UNFAIR', 'UNIQUE', 'UNITED', 'UNLESS',
+    'UNLIKE', 'UNLOCK', 'UNUSED', 'UPDATE', 'UPLOAD', 'URGENT', 'USEFUL', 'VALLEY', 'VALUES', 'VARIED', 'VARIES',
+    'VECTOR', 'VENDOR', 'VERIFY', 'VERSUS', 'VESSEL', 'VICTIM', 'VIDEOS', 'VIEWED', 'VIEWER', 'VIOLET', 'VIRGIN',
+    'VIRTUE', 'VISION', 'VISUAL', 'VOLUME', 'VOTING', 'WAITED', 'WALKED', 'WALKER', 'WALLET', 'WANTED', 'WARDEN',
+    'WARMTH', 'WARNED', 'WASHER', 'WASTED', 'WATERS', 'WEALTH', 'WEAPON', 'WEEKLY', 'WEIGHT', 'WHEELS', 'WHILST',
+    'WHISKY', 'WIDELY', 'WILSON', 'WINDOW', 'WINTER', 'WISDOM', 'WISHED', 'WITHIN', 'WIZARD', 'WOLVES', 'WONDER',
+    'WOODEN', 'WORKED', 'WORKER', 'WORTHY', 'WRITER', 'WRITES', 'YEARLY', 'YELLOW', 'YIELDS', 'YOUNGER'
+} | ADDITIONAL_SIX_LETTER_WORDS
+
+# Combined dictionary for easy lookup
+ALL_WORDS = THREE_LETTER_WORDS | FOUR_LETTER_WORDS | FIVE_LETTER_WORDS | SIX_LETTER_WORDS
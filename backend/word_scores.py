@@ -0,0 +1,97 @@
+# Precomputed word scores and rarity bonuses
+# Base Scrabble scores are tabulated once per dictionary version, so scoring an
+# accepted word is a dict lookup. Rarity tiers come from aggregated play counts
+# (server.refresh_rarity_table reloads them periodically) and are swapped in as a
+# whole, so submissions never wait on the database.
+import itertools
+import threading
+import weakref
+from typing import Dict, Iterable, Optional
+
+from dictionary import WORD_LENGTHS, DictionaryVersion, current_dictionary, register_warmer
+from tiles import SCRABBLE_SCORES
+
+# Bonus per rarity tier: 0 = the words making up the first half of all plays,
+# 1 = the next 30%, 2 = the remaining played words, 3 = never played
+RARITY_BONUS = (0, 1, 2, 4)
+TIER_SHARES = (0.5, 0.8)  # Cumulative share of plays closing tiers 0 and 1
+UNPLAYED_TIER = len(RARITY_BONUS) - 1
+MIN_TOTAL_PLAYS = 1000  # Below this there is too little data, and every word is tier 0
+
+
+def base_score(word: str) -> int:
+    return sum(SCRABBLE_SCORES[letter] for letter in word.upper())
+
+
+class WordScoreTable:
+    """Base score of every word in one dictionary version"""
+
+    def __init__(self, words: Iterable[str]):
+        self._scores: Dict[str, int] = {word: base_score(word) for word in words}
+
+    def score(self, word: str) -> int:
+        word = word.upper()
+        score = self._scores.get(word)
+        if score is None:  # e.g. a word accepted by the plausibility fallback
+            score = base_score(word)
+        return score
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+
+class RarityTable:
+    """Rarity tier of every word, derived from how often each word has been played"""
+
+    def __init__(self, play_counts: Dict[str, int], generation: int = 0):
+        self.generation = generation
+        self.total_plays = sum(play_counts.values())
+        self._tiers: Dict[str, int] = {}
+        if self.total_plays < MIN_TOTAL_PLAYS:
+            self._default_tier = 0
+            return
+        self._default_tier = UNPLAYED_TIER
+        cumulative = 0
+        for word, plays in sorted(play_counts.items(), key=lambda item: -item[1]):
+            share = cumulative / self.total_plays  # share of plays taken by more common words
+            self._tiers[word.upper()] = next(
+                (tier for tier, limit in enumerate(TIER_SHARES) if share < limit), len(TIER_SHARES)
+            )
+            cumulative += plays
+
+    def tier(self, word: str) -> int:
+        return self._tiers.get(word.upper(), self._default_tier)
+
+    def bonus(self, word: str) -> int:
+        return RARITY_BONUS[self.tier(word)]
+
+    def __len__(self) -> int:
+        return len(self._tiers)
+
+
+_score_tables: 'weakref.WeakKeyDictionary[DictionaryVersion, WordScoreTable]' = weakref.WeakKeyDictionary()
+_generations = itertools.count(1)
+_rarity = RarityTable({})
+_rarity_lock = threading.Lock()
+
+def get_score_table(dictionary: Optional[DictionaryVersion] = None) -> WordScoreTable:
+    """Score table for a dictionary version, built on first use"""
+    if dictionary is None:
+        dictionary = current_dictionary()
+    table = _score_tables.get(dictionary)
+    if table is None:
+        table = _score_tables[dictionary] = WordScoreTable(dictionary.words_of(WORD_LENGTHS))
+    return table
+
+register_warmer(lambda dictionary, lengths: get_score_table(dictionary))
+
+def current_rarity() -> RarityTable:
+    return _rarity
+
+def update_rarity(play_counts: Dict[str, int]) -> RarityTable:
+    """Rebuild the rarity tiers from aggregated play counts and swap them in"""
+    global _rarity
+    with _rarity_lock:
+        table = RarityTable(play_counts, next(_generations))
+        _rarity = table
+    return table
@@ -0,0 +1,21 @@
+from tiles import parse_tile_ids
+
+
+def play_game(game, turns: int = 80):
+    """Seat two players, then deal `turns` tiles, playing the hinted word on every third deal"""
+    players = ('p1', 'p2')
+    for player_id in players:
+        game.join(player_id, player_id.upper())
+    game.start()
+    for turn in range(turns):
+        game.add_letter_to_table()
+        if turn % 3 != 2:
+            continue
+        hint = game.get_hint()
+        if hint is None:
+            continue
+        letter_ids = parse_tile_ids(hint["letter_ids"])
+        word, blank_letters = game.resolve_word(letter_ids, hint["word"])
+        game.accept_word(players[turn % 2], word, blank_letters,
+                         game.calculate_word_score(word, blank_letters), letter_ids)
+    return game
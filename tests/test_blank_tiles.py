@@ -0,0 +1,60 @@
+from letter_counts import table_counts
+from server import GameState
+from tiles import SCRABBLE_SCORES
+
+
+def room_with(tiles: str, word_length: int = 3, blank_tiles: bool = True) -> GameState:
+    """A room whose table holds exactly these tiles, with ids 1..n in order"""
+    game = GameState('BLANKS', word_length, blank_tiles=blank_tiles, seed=0)
+    game.deck = list(reversed(tiles))  # Dealt from the end
+    for _ in tiles:
+        game.add_letter_to_table()
+    return game
+
+
+def test_blank_stands_for_missing_letter():
+    game = room_with("CA?")
+    assert game.resolve_word([1, 2, 3], "cat") == ("CAT", ["T"])
+
+
+def test_blank_letters_score_zero():
+    game = room_with("CA?")
+    assert game.calculate_word_score("CAT", ["T"]) == game.calculate_word_score("CAT") - SCRABBLE_SCORES["T"]
+
+
+def test_wildcard_resolves_to_a_word_the_tiles_spell():
+    game = room_with("CA?")
+    word, blank_letters = game.resolve_word([1, 2, 3], "CA?")
+    assert word.startswith("CA") and game.dictionary.is_valid_word(word, 3)
+    assert blank_letters == [word[2]]
+
+
+def test_two_blanks():
+    game = room_with("C??")
+    word, blank_letters = game.resolve_word([1, 2, 3], "C??")
+    assert word[0] == "C" and game.dictionary.is_valid_word(word, 3)
+    assert sorted(blank_letters) == sorted(word[1:])
+
+
+def test_missing_letter_without_blank_is_rejected():
+    game = room_with("CAB")
+    assert game.resolve_word([1, 2], "CAT") is None
+    assert game.resolve_word([1, 2, 3], "CAT") is None
+
+
+def test_wildcards_need_enough_selected_blanks():
+    game = room_with("CA?", word_length=6)
+    assert game.resolve_word([], "??????") is None
+    assert game.resolve_word([1, 2, 3], "CA????") is None
+
+
+def test_wildcards_rejected_in_rooms_without_blanks():
+    game = room_with("CAT", blank_tiles=False)
+    assert game.resolve_word([1, 2, 3], "CA?") is None
+    assert game.resolve_word([1, 2, 3], "CAT") == ("CAT", [])
+
+
+def test_table_counts_skip_blanks():
+    counts = table_counts(["CA?", "??"])
+    assert counts.shape == (2, 26)
+    assert counts.sum(axis=1).tolist() == [2, 0]
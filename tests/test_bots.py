@@ -0,0 +1,81 @@
+import asyncio
+from datetime import datetime, timezone
+
+from fastapi.testclient import TestClient
+
+import server
+from bots import IDLE_TIMEOUT_SECONDS, BotProfile, BotScheduler
+from clock import VirtualClock
+
+
+def scheduler_for(games: dict, clock) -> BotScheduler:
+    async def submit_word(room_code, player_id, word, letter_ids):
+        return False
+    return BotScheduler(games.get, submit_word, seed=1, clock=clock)
+
+
+def test_bots_leave_a_room_that_never_starts():
+    async def main():
+        clock = VirtualClock()
+        game = server.GameState('IDLE', 4, seed=1, clock=clock, persist=False)
+        scheduler = scheduler_for({game.room_code: game}, clock)
+        scheduler.add_bot(game, BotProfile())
+        await clock.advance(IDLE_TIMEOUT_SECONDS / 2)
+        halfway = (len(game.players), scheduler.bot_count)
+        await clock.advance()
+        return halfway, (len(game.players), scheduler.bot_count), clock.time()
+
+    halfway, after, now = asyncio.run(main())
+    assert halfway == (1, 1)
+    assert after == (0, 0)
+    assert now < IDLE_TIMEOUT_SECONDS + 10
+
+
+def test_retire_room_removes_only_that_rooms_bots():
+    async def main():
+        clock = VirtualClock()
+        games = {code: server.GameState(code, 4, seed=1, clock=clock, persist=False) for code in ('A', 'B')}
+        scheduler = scheduler_for(games, clock)
+        for game in games.values():
+            scheduler.add_bot(game, BotProfile())
+            scheduler.add_bot(game, BotProfile())
+        retired = scheduler.retire_room(games['A'])
+        counts = (retired, scheduler.bot_count, len(games['A'].players), len(games['B'].players))
+        scheduler.retire_room(games['B'])
+        await clock.advance()
+        return counts
+
+    assert asyncio.run(main()) == (2, 2, 0, 2)
+
+
+def test_adding_bots_needs_the_host_or_an_admin(monkeypatch):
+    host = server.User(id="host", email="host@example.com", name="Host", picture="",
+                       created_at=datetime.now(timezone.utc))
+    server.games['BOTS01'] = server.GameState('BOTS01', 4, creator_user=host, seed=1)
+    monkeypatch.setattr(server, 'ADMIN_TOKEN', 'secret')
+    client = TestClient(server.app)
+    try:
+        assert client.post('/api/rooms/BOTS01/bots').status_code == 403
+        assert client.post('/api/rooms/BOTS01/bots', headers={"X-Admin-Token": "wrong"}).status_code == 403
+        assert client.post('/api/rooms/BOTS01/bots', headers={"X-Admin-Token": "secret"}).status_code == 200
+
+        server.app.dependency_overrides[server.get_optional_user] = lambda: host
+        assert client.post('/api/rooms/BOTS01/bots').status_code == 200
+        assert len(server.games['BOTS01'].players) == 2
+    finally:
+        server.app.dependency_overrides.clear()
+        server.bot_scheduler.retire_room(server.games.pop('BOTS01'))
+
+
+def test_bots_retire_when_the_last_human_leaves(monkeypatch):
+    monkeypatch.setattr(server, 'ADMIN_TOKEN', 'secret')
+    client = TestClient(server.app)
+    room_code = client.post('/api/create-room', json={"word_length": 4}).json()["room_code"]
+    with client.websocket_connect(f'/api/ws/{room_code}') as websocket:
+        websocket.send_json({"type": "join", "player_name": "Human"})
+        websocket.receive_json()
+        response = client.post(f'/api/rooms/{room_code}/bots', json={"count": 2},
+                               headers={"X-Admin-Token": "secret"})
+        assert response.status_code == 200
+        assert len(server.games[room_code].players) == 3
+    assert server.games.pop(room_code).players == {}
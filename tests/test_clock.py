@@ -0,0 +1,126 @@
+import asyncio
+
+import pytest
+
+from clock import VirtualClock
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_advance_wakes_sleepers_in_time_order():
+    async def main():
+        clock = VirtualClock()
+        woken = []
+
+        async def sleeper(name, seconds):
+            await clock.sleep(seconds)
+            woken.append((name, clock.time()))
+
+        tasks = [asyncio.create_task(sleeper(name, seconds)) for name, seconds in (("b", 2), ("a", 1), ("c", 3))]
+        await clock.advance()
+        await asyncio.gather(*tasks)
+        return woken, clock.time()
+
+    woken, now = run(main())
+    assert woken == [("a", 1), ("b", 2), ("c", 3)]
+    assert now == 3
+
+
+def test_advance_by_seconds_stops_at_the_deadline():
+    async def main():
+        clock = VirtualClock(start=10.0)
+        task = asyncio.create_task(clock.sleep(5))
+        await clock.advance(2)
+        early = (clock.time(), task.done(), clock.sleepers)
+        await clock.advance(3)
+        return early, (clock.time(), task.done(), clock.sleepers)
+
+    assert run(main()) == ((12.0, False, 1), (15.0, True, 0))
+
+
+def test_sleepers_due_together_see_the_same_time():
+    async def main():
+        clock = VirtualClock()
+        seen = []
+
+        async def sleeper():
+            await clock.sleep(1.5)
+            seen.append(clock.time())
+
+        await asyncio.gather(clock.advance(), *(sleeper() for _ in range(3)))
+        return seen
+
+    assert run(main()) == [1.5, 1.5, 1.5]
+
+
+def test_time_waits_for_woken_tasks_to_block_again():
+    async def main():
+        clock = VirtualClock()
+        seen = []
+
+        async def worker():
+            for _ in range(3):
+                await clock.sleep(1)
+                for _ in range(100):  # Many event-loop passes before the next sleep
+                    await asyncio.sleep(0)
+                seen.append(clock.time())
+
+        task = asyncio.create_task(worker())
+        await clock.advance()
+        await task
+        return seen
+
+    assert run(main()) == [1, 2, 3]
+
+
+def test_wait_for_event_and_timeout():
+    async def main():
+        clock = VirtualClock()
+        event = asyncio.Event()
+
+        async def setter():
+            await clock.sleep(2)
+            event.set()
+
+        waits = asyncio.gather(clock.wait_for(event, 5), setter())
+        await clock.advance()
+        set_result, _ = await waits
+        set_at = clock.time()
+
+        event.clear()
+        timeout = asyncio.create_task(clock.wait_for(event, 4))
+        await clock.advance()
+        return set_result, set_at, await timeout, clock.time()
+
+    # The 5 s timeout was cancelled when the event was set, so it does not move time on
+    assert run(main()) == (True, 2, False, 6)
+
+
+def test_spinning_task_is_reported():
+    async def main():
+        clock = VirtualClock()
+
+        async def spin():
+            while True:
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(spin())
+        try:
+            await clock.advance()
+        finally:
+            task.cancel()
+
+    with pytest.raises(RuntimeError):
+        run(main())
+
+
+def test_simulated_games_finish_and_are_deterministic():
+    from game_simulation import simulate
+
+    first = run(simulate(games=3, bots_per_room=2, word_length=4, timer_minutes=2, seed=1))
+    second = run(simulate(games=3, bots_per_room=2, word_length=4, timer_minutes=2, seed=1))
+    assert first["ended"] == 3
+    first.pop("wall_seconds"), second.pop("wall_seconds")
+    assert first == second
@@ -0,0 +1,43 @@
+import random
+
+import numpy as np
+import pytest
+
+import deck_calibration
+import tiles
+from server import GameState, ranked_deck_rng
+from tiles import deck_library_path, draw_ranked_deck_seed, load_deck_library
+
+
+@pytest.mark.parametrize("dealer_lookahead", [0, 3])
+def test_simulator_deals_like_a_ranked_room(dealer_lookahead):
+    deck_calibration._init_worker(4)
+    for seed in (123, 7):
+        game = GameState('CALIB', 4, deck_seed=seed, dealer_lookahead=dealer_lookahead)
+        expected = [game.add_letter_to_table() for _ in range(26)]
+
+        decks = deck_calibration.deck_codes(seed)[None, :].copy()
+        position = np.zeros(1, dtype=np.int16)
+        counts = np.zeros((1, 26), dtype=np.uint8)
+        dealt = []
+        for _ in range(26):
+            if dealer_lookahead:
+                deck_calibration.dealer_pick(decks, position, counts, np.arange(1), dealer_lookahead)
+            code = decks[0, position[0]]
+            counts[0, code] += 1
+            position[0] += 1
+            dealt.append(chr(ord('A') + int(code)))
+        assert dealt == expected
+
+
+def test_ranked_deck_is_drawn_from_the_game_seed(tmp_path, monkeypatch):
+    monkeypatch.setattr(tiles, 'DECK_LIBRARY_DIR', tmp_path)
+    monkeypatch.setattr(tiles, '_deck_libraries', {})
+    deck_library_path(4, 3).write_text('{"decks": [{"seed": 11}, {"seed": 22}, {"seed": 33}]}')
+
+    assert load_deck_library(4) == []
+    assert load_deck_library(4, 1) == []  # A window of 1 deals in deck order
+    draws = [draw_ranked_deck_seed(4, ranked_deck_rng(seed), 3) for seed in range(20)]
+    assert set(draws) <= {11, 22, 33}
+    assert draws == [draw_ranked_deck_seed(4, ranked_deck_rng(seed), 3) for seed in range(20)]
+    assert draw_ranked_deck_seed(4, random.Random(0)) is None
@@ -0,0 +1,31 @@
+import os
+
+import dictionary
+from dictionary import DictionaryVersion
+from dictionary_artifact import PackedDictionary, bucket_words, compile_words, unlink_shared_dictionary
+
+WORDS = ["CAT", "DOG", "BIRD", "FISH", "HORSE", "ANIMAL"]
+
+
+def test_warm_builds_only_the_requested_lengths():
+    version = DictionaryVersion(PackedDictionary(compile_words(bucket_words(WORDS))), 0)
+    version.warm(4)
+    version.warm((3, 5), blank_tiles=True)
+
+    assert set(version._prefix_indexes) == {4, (3, 5)}
+    assert set(version._wildcard_indexes) == {3, 5}
+    assert not version._anagram_indexes
+    assert version.warmed == {(4, False), ((3, 5), True)}
+
+
+def test_reload_keeps_to_shared_memory(monkeypatch):
+    monkeypatch.setattr(dictionary, "SHARED_MEMORY_NAME", f"wordgame-test-{os.getpid()}")
+    first = dictionary._reload_packed_dictionary()
+    try:
+        second = dictionary._reload_packed_dictionary()
+        name = f"{dictionary.SHARED_MEMORY_NAME}-{first.digest[:16]}"
+        assert first.source == f"shm:{name} (created)"
+        assert second.source == f"shm:{name}"
+        assert first.digest == second.digest == dictionary.current_dictionary().digest
+    finally:
+        unlink_shared_dictionary(f"{dictionary.SHARED_MEMORY_NAME}-{first.digest[:16]}")
@@ -0,0 +1,59 @@
+import pytest
+
+from dictionary_artifact import (
+    ArtifactError, PackedDictionary, PackedWordSet, bucket_words, compile_words, load_artifact, write_artifact
+)
+
+WORDS = ["cat", "DOG", "ant", "bird", "FISH", "horse", "zebra", "animal", "a", "x-ray", "cat"]
+
+
+@pytest.fixture
+def packed(tmp_path):
+    path = tmp_path / "dictionary.bin"
+    write_artifact(bucket_words(WORDS), path)
+    return load_artifact(path)
+
+
+def test_round_trip_membership_and_len(packed):
+    assert len(packed) == 8
+    for word in ("ANT", "CAT", "DOG", "BIRD", "FISH", "HORSE", "ZEBRA", "ANIMAL"):
+        assert word in packed
+    for word in ("COW", "A", "XRAY", "ANIMALS", "cat", ""):
+        assert word not in packed
+    assert len(packed.words(3)) == 3
+    assert len(packed.words(7)) == 0
+
+
+def test_sections_iterate_in_sorted_order(packed):
+    section = packed.words(3)
+    assert isinstance(section, PackedWordSet)
+    assert list(section) == ["ANT", "CAT", "DOG"]
+    assert "CAT" in section and "BAT" not in section and 3 not in section
+
+
+def test_set_operators_return_frozensets(packed):
+    section = packed.words(3)
+    assert section | {"COW"} == frozenset({"ANT", "CAT", "DOG", "COW"})
+    assert section & {"CAT", "COW"} == frozenset({"CAT"})
+    assert section - {"CAT"} == frozenset({"ANT", "DOG"})
+    assert section ^ {"CAT", "COW"} == frozenset({"ANT", "DOG", "COW"})
+    assert isinstance(section | set(), frozenset)
+    assert section == {"ANT", "CAT", "DOG"}
+    assert section <= {"ANT", "CAT", "DOG", "EEL"}
+
+
+def test_bucket_words_reports_rejects_and_duplicates():
+    stats = {}
+    buckets = bucket_words(WORDS, stats)
+    assert buckets[3] == ["ANT", "CAT", "DOG"]
+    assert stats == {"entries": 11, "rejected": 2, "duplicates": 1}
+
+
+def test_corrupted_artifacts_are_rejected():
+    payload = compile_words(bucket_words(WORDS))
+    with pytest.raises(ArtifactError):
+        PackedDictionary(b"NOTADICT" + payload[8:])
+    with pytest.raises(ArtifactError):
+        PackedDictionary(payload[:-4])
+    with pytest.raises(ArtifactError):
+        PackedDictionary(payload[:4])
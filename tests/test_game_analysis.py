@@ -0,0 +1,23 @@
+import pytest
+
+from dictionary import DictionaryUnavailable, current_dictionary
+from dictionary_artifact import PackedDictionary, bucket_words, compile_words
+from game_analysis import missed_words, missed_words_in_version
+
+
+def test_missed_words_use_the_pinned_version():
+    payload = compile_words(bucket_words(["TAC", "DOG"]))
+    digest = PackedDictionary(payload).digest
+    with pytest.raises(DictionaryUnavailable):
+        missed_words_in_version(digest, None, ["CAT"], [], 3)
+
+    words = missed_words_in_version(digest, payload, ["CAT"], [], 3)
+    assert [entry["word"] for entry in words] == ["TAC"]
+    # Once rebuilt, the version is found by digest alone
+    assert missed_words_in_version(digest, None, ["CAT"], [], 3) == words
+
+
+def test_current_version_needs_no_payload():
+    dictionary = current_dictionary()
+    assert missed_words_in_version(dictionary.digest, None, ["CAT"], ["ACT"], 3) == \
+        missed_words(["CAT"], ["ACT"], 3, dictionary=dictionary)
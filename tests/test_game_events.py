@@ -0,0 +1,51 @@
+import pickle
+
+import pytest
+
+from server import SNAPSHOT_INTERVAL, GameState
+from tests.game_helpers import play_game
+
+ROOMS = [
+    dict(word_length=4, seed=1),
+    dict(word_length=5, seed=2, blank_tiles=True, dealer_lookahead=3),
+    dict(word_length=3, seed=3, mixed_lengths=True),
+]
+
+
+@pytest.mark.parametrize("options", ROOMS)
+def test_pickled_restore_point_rebuilds_the_room(options):
+    game = play_game(GameState('EVENTS', **options))
+    assert game.words_played and game.event_count > SNAPSHOT_INTERVAL
+    snapshot, events = pickle.loads(pickle.dumps(game.restore_point()))
+
+    rebuilt = GameState.from_snapshot(snapshot, events)
+
+    assert rebuilt.snapshot() == game.snapshot()
+    assert rebuilt.event_count == game.event_count
+    assert rebuilt.solver.words() == game.solver.words()
+    assert rebuilt.letter_counts == game.letter_counts
+
+
+def test_rebuilt_room_keeps_dealing_the_same_deck():
+    game = play_game(GameState('EVENTS', word_length=4, seed=4), turns=30)
+    rebuilt = GameState.from_snapshot(*game.restore_point())
+    for _ in range(10):
+        assert rebuilt.add_letter_to_table() == game.add_letter_to_table()
+    assert [t.letter for t in rebuilt.letters_on_table] == [t.letter for t in game.letters_on_table]
+
+
+def test_every_mutation_is_recorded():
+    game = play_game(GameState('EVENTS', word_length=4, seed=5), turns=20)
+    kinds = [kind for kind, _ in game.events]
+    assert kinds.count('player_joined') == 2
+    assert kinds.count('letter_dealt') == game.deals
+    assert kinds.count('word_accepted') == len(game.words_played)
+
+
+def test_only_events_since_the_latest_snapshot_are_kept():
+    game = play_game(GameState('EVENTS', word_length=4, seed=6), turns=200)
+    assert game.event_count > 2 * SNAPSHOT_INTERVAL
+    assert len(game.events) < SNAPSHOT_INTERVAL
+    assert game.latest_snapshot["event_count"] == game.event_offset
+    rebuilt = GameState.from_snapshot(*game.restore_point())
+    assert rebuilt.snapshot() == game.snapshot()
@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from dictionary import DictionaryUnavailable, current_dictionary
+from server import GameState, generate_room_code
+from tests.game_helpers import play_game
+
+ROOMS = [
+    dict(word_length=4, seed=11),
+    dict(word_length=5, seed=12, blank_tiles=True, dealer_lookahead=3),
+    dict(word_length=3, seed=13, mixed_lengths=True),
+]
+
+
+def recorded(game) -> dict:
+    """What a finished game stores for replay, after a trip through JSON like a database document"""
+    return json.loads(json.dumps({"config": game.config(), "deals": game.deals, "word_log": game.word_log}))
+
+
+@pytest.mark.parametrize("options", ROOMS)
+def test_replay_from_json_log_matches_the_game(options):
+    game = play_game(GameState('REPLAY', **options))
+    record = recorded(game)
+
+    replayed = GameState.replay('REPLAY', record["config"], record["word_log"], record["deals"])
+
+    assert game.words_played
+    assert replayed.deck == game.deck
+    assert [t.letter for t in replayed.letters_on_table] == [t.letter for t in game.letters_on_table]
+    assert replayed.table_history == game.table_history
+    assert replayed.words_played == game.words_played
+    assert replayed.word_log == game.word_log
+    assert {p: player["score"] for p, player in replayed.players.items()} == \
+           {p: player["score"] for p, player in game.players.items() if player["score"]}
+
+
+def test_same_seed_same_game():
+    first = play_game(GameState('SEEDED', word_length=4, seed=99))
+    second = play_game(GameState('SEEDED', word_length=4, seed=99))
+    assert first.word_log == second.word_log
+    assert first.table_history == second.table_history
+
+
+def test_seed_decides_the_room_code():
+    assert generate_room_code(7) == generate_room_code(7)
+
+
+def test_replay_pins_the_recorded_dictionary():
+    game = play_game(GameState('PINNED', word_length=4, seed=14))
+    record = recorded(game)
+    assert record["config"]["dictionary_digest"] == current_dictionary().digest
+    assert GameState.replay('PINNED', record["config"], record["word_log"], record["deals"]).dictionary is game.dictionary
+
+    record["config"]["dictionary_digest"] = "0" * 32
+    with pytest.raises(DictionaryUnavailable):
+        GameState.replay('PINNED', record["config"], record["word_log"], record["deals"])
+    with pytest.raises(DictionaryUnavailable):
+        GameState.from_snapshot({**game.snapshot(), "config": record["config"]})
@@ -0,0 +1,40 @@
+import random
+
+import pytest
+
+from dictionary import WORD_LENGTHS, current_dictionary
+from table_solver import TableSolver
+from tiles import create_deck
+
+
+@pytest.mark.parametrize("word_length", [*WORD_LENGTHS, WORD_LENGTHS])
+def test_solver_matches_anagram_index(word_length):
+    dictionary = current_dictionary()
+    rng = random.Random(str(word_length))
+    for _ in range(25):
+        solver = TableSolver(dictionary, word_length)
+        table = []
+        for letter in create_deck(rng)[:40]:
+            if len(table) < 26:
+                table.append(letter)
+                solver.add(letter)
+            if table and rng.random() < 0.3:
+                solver.remove(table.pop(rng.randrange(len(table))))
+            assert solver.words() == sorted(set(dictionary.find_formable_words(table, word_length)))
+            assert solver.count == len(solver.words())
+
+
+def test_gain_if_added_counts_new_words():
+    dictionary = current_dictionary()
+    solver = TableSolver(dictionary, 4, "STARE")
+    before = solver.count
+    gain = solver.gain_if_added("L")
+    solver.add("L")
+    assert solver.count - before == gain
+
+
+def test_removing_absent_letter_is_ignored():
+    solver = TableSolver(current_dictionary(), 3, "CAT")
+    words = solver.words()
+    solver.remove("Z")
+    assert solver.words() == words
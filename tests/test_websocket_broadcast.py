@@ -0,0 +1,43 @@
+import asyncio
+from datetime import datetime, timezone
+
+from fastapi.testclient import TestClient
+
+import server
+
+
+def test_authenticated_player_leaving_is_broadcast():
+    client = TestClient(server.app)
+    room_code = client.post('/api/create-room', json={"word_length": 3}).json()["room_code"]
+    with client.websocket_connect(f'/api/ws/{room_code}') as staying:
+        staying.send_json({"type": "join", "player_name": "Stays"})
+        assert staying.receive_json()["type"] == "player_joined"
+        assert staying.receive_json()["type"] == "game_state"
+        with client.websocket_connect(f'/api/ws/{room_code}') as leaving:
+            leaving.send_json({"type": "join", "player_name": "Leaves"})
+            assert staying.receive_json()["type"] == "player_joined"
+            user = server.User(id="u1", email="u1@example.com", name="Leaves", picture="",
+                               created_at=datetime.now(timezone.utc))
+            for player in server.games[room_code].players.values():
+                if player["name"] == "Leaves":
+                    player["user"] = user
+        message = staying.receive_json()
+    assert message["type"] == "player_left"
+    assert message["players"] == [
+        {"name": "Stays", "score": 0, "elo_rating": None, "is_authenticated": False}
+    ]
+    server.games.pop(room_code, None)
+
+
+def test_unserializable_message_is_not_raised():
+    sent = []
+
+    class Connection:
+        async def send_text(self, text):
+            sent.append(text)
+
+    manager = server.ConnectionManager()
+    manager.active_connections["ROOM"] = [Connection()]
+    asyncio.run(manager.broadcast_to_room({"type": "bad", "value": object()}, "ROOM"))
+    asyncio.run(manager.broadcast_to_room({"type": "good"}, "ROOM"))
+    assert sent == ['{"type": "good"}']